@@ -0,0 +1,317 @@
+"""
+Benchmark suite for the end-to-end pipeline.
+
+Every (case, size) pair runs in a fresh process on seeded synthetic data, so
+wall times are reproducible and the reported peak RSS belongs to that
+measurement alone. Results are written as JSON and can be compared with a
+previous run to catch regressions::
+
+    python -m benchmarks.suite --sizes 1000 100000 --output after.json \\
+        --compare before.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.synthetic import generate_ohlcv
+
+SIZES = (1_000, 100_000, 1_000_000)
+COVARIANCE_TYPES = ("full", "diag", "tied", "spherical")
+DTYPES = ("float64", "float32")
+# Cases that refit many HMMs are skipped above this many bars
+CASE_MAX_BARS = {"mc_run": 100_000, "optimizer": 100_000, "optimizer_warm": 100_000}
+
+
+def _features(n_bars, seed):
+    from src.feature_engineering import FeatureEngineer
+
+    return FeatureEngineer().build_features(generate_ohlcv(n_bars, seed))
+
+
+def _setup_build_features(n_bars, seed, params):
+    from src.feature_engineering import FeatureEngineer
+
+    raw_data = generate_ohlcv(n_bars, seed)
+    return lambda: FeatureEngineer().build_features(raw_data)
+
+
+def _hmm_model(seed, params):
+    from src.hmm_model import HMMModel
+
+    return HMMModel(
+        n_states=params["n_states"],
+        random_state=seed,
+        n_iter=params["n_iter"],
+        covariance_type=params["covariance_type"],
+        dtype=params["dtype"],
+    )
+
+
+def _setup_hmm_fit(n_bars, seed, params):
+    _, features = _features(n_bars, seed)
+    return lambda: _hmm_model(seed, params).fit(features, verbose=False)
+
+
+def _setup_hmm_predict(n_bars, seed, params):
+    _, features = _features(n_bars, seed)
+    hmm_model = _hmm_model(seed, params)
+    hmm_model.fit(features, verbose=False)
+    return lambda: hmm_model.predict(features, verbose=False)
+
+
+def _setup_backtest(n_bars, seed, params):
+    from src.backtester import Backtester
+
+    df, _ = _features(n_bars, seed)
+    rng = np.random.default_rng(seed)
+    df["signal"] = rng.choice([0, 1], size=len(df), p=[0.4, 0.6])
+    return lambda: Backtester().backtest(df)
+
+
+def _setup_mc_run(n_bars, seed, params):
+    from src.mc_backtester import MCBacktester
+
+    df, features = _features(n_bars, seed)
+    split = len(df) * 2 // 3
+
+    def run():
+        mc = MCBacktester(
+            features.iloc[:split],
+            features.iloc[split:],
+            df.iloc[split:],
+            n_states=params["n_states"],
+            runs=params["mc_runs"],
+            covariance_type=params["covariance_type"],
+            dtype=params["dtype"],
+        )
+        mc.run(seeded=True, verbose=False)
+
+    return run
+
+
+def _setup_optimizer(n_bars, seed, params, warm_start=False):
+    from src.optimizer import HMMStateOptimizer
+
+    df, features = _features(n_bars, seed)
+
+    def run():
+        optimizer = HMMStateOptimizer(
+            range(2, params["n_states"] + 1),
+            random_state=seed,
+            n_iter=params["n_iter"],
+            covariance_type=params["covariance_type"],
+            dtype=params["dtype"],
+            warm_start=warm_start,
+        )
+        optimizer.run_optimization(df, features)
+
+    return run
+
+
+def _setup_optimizer_warm(n_bars, seed, params):
+    # K -> K+1 warm-started sweep; compare with "optimizer" for the gain
+    return _setup_optimizer(n_bars, seed, params, warm_start=True)
+
+
+CASES = {
+    "build_features": _setup_build_features,
+    "hmm_fit": _setup_hmm_fit,
+    "hmm_predict": _setup_hmm_predict,
+    "backtest": _setup_backtest,
+    "mc_run": _setup_mc_run,
+    "optimizer": _setup_optimizer,
+    "optimizer_warm": _setup_optimizer_warm,
+}
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MiB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _measure(case, n_bars, seed, repeat, params):
+    """Benchmark one case at one size; runs inside a dedicated process."""
+    run = CASES[case](n_bars, seed, params)
+    setup_rss = _peak_rss_mb()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return {
+        "case": case,
+        "n_bars": n_bars,
+        "seed": seed,
+        "repeat": repeat,
+        "wall_time_min": min(times),
+        "wall_time_median": float(np.median(times)),
+        "setup_peak_rss_mb": setup_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _metadata():
+    import hmmlearn
+    import pandas as pd
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "hmmlearn": hmmlearn.__version__,
+    }
+
+
+def run_suite(
+    cases=tuple(CASES),
+    sizes=SIZES,
+    seed=0,
+    repeat=3,
+    n_states=4,
+    n_iter=100,
+    mc_runs=8,
+    limits=True,
+    covariance_type="full",
+    dtype="float64",
+):
+    """
+    Run every requested case at every size and return the JSON-ready report.
+
+    Cases above their ``CASE_MAX_BARS`` size are reported as skipped unless
+    ``limits`` is False. ``covariance_type`` and ``dtype`` configure every HMM
+    fitted by the cases.
+    """
+    params = {
+        "n_states": n_states,
+        "n_iter": n_iter,
+        "mc_runs": mc_runs,
+        "covariance_type": covariance_type,
+        "dtype": dtype,
+    }
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for case in cases:
+        for n_bars in sizes:
+            if limits and n_bars > CASE_MAX_BARS.get(case, n_bars):
+                results.append({"case": case, "n_bars": n_bars, "skipped": True})
+                continue
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(
+                    _measure, case, n_bars, seed, repeat, params
+                ).result()
+            print(
+                f"{case:>15} {n_bars:>9} bars: {result['wall_time_min']:9.4f}s "
+                f"(peak RSS {result['peak_rss_mb'] or float('nan'):.0f} MiB)",
+                flush=True,
+            )
+            results.append(result)
+    return {"metadata": dict(_metadata(), **params), "results": results}
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2) -> list:
+    """
+    Cases whose best wall time grew by more than ``tolerance`` (a fraction).
+
+    Returns
+    -------
+    list of dict
+        ``case``, ``n_bars``, ``baseline``, ``current`` and ``ratio`` of every
+        regression.
+    """
+    reference = {
+        (r["case"], r["n_bars"]): r["wall_time_min"]
+        for r in baseline["results"]
+        if not r.get("skipped")
+    }
+    regressions = []
+    for result in current["results"]:
+        key = (result["case"], result["n_bars"])
+        if result.get("skipped") or key not in reference:
+            continue
+        ratio = result["wall_time_min"] / reference[key]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    "case": key[0],
+                    "n_bars": key[1],
+                    "baseline": reference[key],
+                    "current": result["wall_time_min"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--n-states", type=int, default=4)
+    parser.add_argument("--n-iter", type=int, default=100)
+    parser.add_argument("--mc-runs", type=int, default=8)
+    parser.add_argument("--covariance-type", default="full", choices=COVARIANCE_TYPES)
+    parser.add_argument("--dtype", default="float64", choices=DTYPES)
+    parser.add_argument("--no-limits", action="store_true", help="ignore CASE_MAX_BARS")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        cases=args.cases,
+        sizes=args.sizes,
+        seed=args.seed,
+        repeat=args.repeat,
+        n_states=args.n_states,
+        n_iter=args.n_iter,
+        mc_runs=args.mc_runs,
+        limits=not args.no_limits,
+        covariance_type=args.covariance_type,
+        dtype=args.dtype,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.tolerance)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['case']} @ {r['n_bars']} bars: "
+                f"{r['baseline']:.4f}s -> {r['current']:.4f}s ({r['ratio']:.2f}x)"
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+# Daily drift and volatility of the bull, sideways and bear regimes
+REGIME_DRIFT = np.array([0.0015, 0.0, -0.002])
+REGIME_VOL = np.array([0.02, 0.012, 0.035])
+# Regime transition matrix (rows: current regime)
+REGIME_TRANSMAT = np.array(
+    [
+        [0.97, 0.02, 0.01],
+        [0.02, 0.96, 0.02],
+        [0.02, 0.03, 0.95],
+    ]
+)
+
+
+def generate_regimes(n_bars: int, seed: int = 0) -> np.ndarray:
+    """Markov chain of regime labels drawn from ``REGIME_TRANSMAT``."""
+    rng = np.random.default_rng(seed)
+    cum_transmat = np.cumsum(REGIME_TRANSMAT, axis=1)
+    draws = rng.random(n_bars)
+    regimes = np.empty(n_bars, dtype=np.int64)
+    regime = 0
+    for t in range(n_bars):
+        regimes[t] = regime
+        regime = int(np.searchsorted(cum_transmat[regime], draws[t], side="right"))
+    return regimes
+
+
+def generate_ohlcv(n_bars: int, seed: int = 0, start_price: float = 100.0):
+    """
+    Synthetic OHLC frame shaped like ``DataLoader.get_data`` output.
+
+    Log returns follow a three-regime switching random walk, so an HMM has
+    real structure to find. The same ``(n_bars, seed)`` always yields the same
+    frame. The index is hourly so that a million bars stay within the
+    timestamp range.
+    """
+    regimes = generate_regimes(n_bars + 1, seed)
+    rng = np.random.default_rng(seed + 1)
+    logret = REGIME_DRIFT[regimes] + REGIME_VOL[regimes] * rng.standard_normal(
+        n_bars + 1
+    )
+    close = start_price * np.exp(np.cumsum(logret))
+    open_ = close * np.exp(-logret * rng.random(n_bars + 1))
+    spread = REGIME_VOL[regimes] * np.abs(rng.standard_normal((2, n_bars + 1)))
+    df = pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1 + spread[0]),
+            "Low": np.minimum(open_, close) * (1 - spread[1]),
+            "Close": close,
+        },
+        index=pd.date_range(start="2000-01-01", periods=n_bars + 1, freq="h"),
+    )
+    df.index.name = "date"
+    df["logret"] = np.log(df["Close"] / df["Close"].shift(1))
+    return df.dropna()
@@ -0,0 +1,164 @@
+"""
+Speed vs. quality of the HMM covariance structures and precisions.
+
+Every (covariance type, dtype) configuration is fitted on the same seeded
+synthetic training window and evaluated on the window that follows it: fit
+wall time and EM iterations against train/test log-likelihood per bar, BIC,
+the backtest of the regime signals and how often those signals agree with
+the reference configuration (the first one, ``full``/``float64`` by
+default)::
+
+    python -m benchmarks.tradeoffs --n-bars 20000 --output tradeoffs.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.suite import COVARIANCE_TYPES, DTYPES, _features, _metadata
+
+
+def compare_configs(
+    df,
+    features,
+    configs,
+    n_states=4,
+    n_iter=100,
+    seed=0,
+    repeat=1,
+    train_fraction=2 / 3,
+):
+    """
+    Fit and evaluate every ``(covariance_type, dtype)`` pair of ``configs``.
+
+    Log-likelihoods are always evaluated in float64, so they measure the
+    fitted model rather than the precision of the evaluation.
+
+    Returns
+    -------
+    list of dict
+        One row per configuration, in the order of ``configs``.
+    """
+    from src.backtester import Backtester
+    from src.hmm_decoding import HMMDecoder
+    from src.hmm_model import HMMModel
+
+    split = int(len(features) * train_fraction)
+    features_train, features_test = features.iloc[:split], features.iloc[split:]
+    test_df = df.iloc[split:]
+    backtester = Backtester()
+    results, reference = [], None
+    for covariance_type, dtype in configs:
+        times = []
+        for _ in range(repeat):
+            hmm_model = HMMModel(
+                n_states=n_states,
+                random_state=seed,
+                n_iter=n_iter,
+                covariance_type=covariance_type,
+                dtype=dtype,
+            )
+            start = time.perf_counter()
+            hmm_model.fit(features_train, verbose=False)
+            times.append(time.perf_counter() - start)
+
+        decoder = HMMDecoder.from_models([hmm_model], dtype=np.float64)
+        X_train = hmm_model.transform(features_train)
+        X_test = hmm_model.transform(features_test)
+        train_ll = float(decoder.forward_backward(X_train)[1][0])
+        test_ll = float(decoder.forward_backward(X_test)[1][0])
+        hidden_states = hmm_model.predict(features_test, verbose=False)
+        signal, _ = hmm_model.signal_path(hidden_states, test_df["ret"].values)
+        batch = backtester.backtest_batch(signal[None], test_df["logret"].values)
+        if reference is None:
+            reference = signal
+        results.append(
+            {
+                "covariance_type": covariance_type,
+                "dtype": dtype,
+                "fit_time": min(times),
+                "em_iter": hmm_model.fit_stats_["n_iter"],
+                "converged": hmm_model.fit_stats_["converged"],
+                "train_ll_per_bar": train_ll / len(X_train),
+                "test_ll_per_bar": test_ll / len(X_test),
+                "bic": float(hmm_model.model.bic(X_train)),
+                "total_return": float(batch["total_return"][0]),
+                "annualized_sharpe": float(batch["annualized_sharpe"][0]),
+                "max_drawdown": float(batch["max_drawdown"][0]),
+                "signal_agreement": float(np.mean(signal == reference)),
+            }
+        )
+    return results
+
+
+def run_tradeoffs(
+    n_bars=20_000,
+    seed=0,
+    covariance_types=COVARIANCE_TYPES,
+    dtypes=DTYPES,
+    n_states=4,
+    n_iter=100,
+    repeat=3,
+):
+    """Compare every configuration on synthetic data; JSON-ready report."""
+    df, features = _features(n_bars, seed)
+    configs = [(c, d) for c in covariance_types for d in dtypes]
+    results = compare_configs(
+        df,
+        features,
+        configs,
+        n_states=n_states,
+        n_iter=n_iter,
+        seed=seed,
+        repeat=repeat,
+    )
+    for r in results:
+        print(
+            f"{r['covariance_type']:>9} {r['dtype']:>7}: {r['fit_time']:8.3f}s "
+            f"({r['em_iter']:3d} iter)  test ll/bar {r['test_ll_per_bar']:9.4f}  "
+            f"return {r['total_return']:8.2%}  agreement {r['signal_agreement']:6.1%}",
+            flush=True,
+        )
+    metadata = dict(
+        _metadata(), n_bars=n_bars, seed=seed, n_states=n_states, n_iter=n_iter
+    )
+    return {"metadata": metadata, "results": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--n-bars", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--covariance-types",
+        nargs="+",
+        choices=COVARIANCE_TYPES,
+        default=list(COVARIANCE_TYPES),
+    )
+    parser.add_argument("--dtypes", nargs="+", choices=DTYPES, default=list(DTYPES))
+    parser.add_argument("--n-states", type=int, default=4)
+    parser.add_argument("--n-iter", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_tradeoffs(
+        n_bars=args.n_bars,
+        seed=args.seed,
+        covariance_types=args.covariance_types,
+        dtypes=args.dtypes,
+        n_states=args.n_states,
+        n_iter=args.n_iter,
+        repeat=args.repeat,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,43 +1,41 @@
-# import joblib
-# import pandas as pd
 from src.data_loader import DataLoader
 from src.feature_engineering import FeatureEngineer
 from src.hmm_model import HMMModel
-from train import train
+from src.model_registry import ModelRegistry
+from train import train, training_config
 
 
 def predict():
     """
     Loads the trained HMM model, gets the latest data, and predicts the signal.
-    """
-    # 1. Load the trained model and scaler
 
-    # 2. Load data (in a real scenario, you would fetch live data here)
+    The model is only retrained when no artifact matches the fingerprint of the
+    current training window and configuration.
+    """
+    # 1. Load data (in a real scenario, you would fetch live data here)
     data_loader = DataLoader()
     raw_data = data_loader.get_data()
 
-    # 3. Feature Engineering for the latest data point
+    # 2. Feature Engineering for the latest data point
     feature_engineer = FeatureEngineer()
     df, features = feature_engineer.build_features(raw_data)
-    latest_features = features.tail(1)
-    try:
-        model, scaler = train(raw_data)
-    except FileNotFoundError:
-        print("Model not found. Please run train.py first.")
-        return
-
-    # 4. Predict the state for the latest data point
-    scaled_features = scaler.transform(latest_features.values)
-    hidden_state = model.predict(scaled_features)[0]
 
-    # 5. Generate the signal
+    # 3. Load the trained model, retraining if the data or config changed
+    registry = ModelRegistry()
+    key = registry.fingerprint(features, training_config(feature_engineer, HMMModel()))
+    artifact = registry.load(key)
+    if artifact is None:
+        train(raw_data, registry)
+        artifact = registry.load(key)
     hmm_model = HMMModel()
-    hmm_model.model = model
-    _, state_stats = hmm_model.regime_to_signal(
-        df, model.predict(scaler.transform(features.values))
-    )
+    hmm_model.model, hmm_model.scaler = artifact["model"], artifact["scaler"]
+    state_stats = artifact["state_stats"]
+
+    # 4. Filter the state of the latest data point (forward pass, no Viterbi)
+    hmm_model.filter(features)
 
-    signal = 1 if state_stats[hidden_state] > 0 else 0
+    # 5. Generate the signal
+    signal = hmm_model.filtered_signal(state_stats, include_shorting=False)
 
     # print(f"Predicted State: {hidden_state}")
     # print(f"State Stats (Mean Future Return):\n{state_stats}")
@@ -8,6 +8,27 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def enforce_min_hold(position: np.ndarray, min_hold_days: int) -> np.ndarray:
+    """
+    Flatten every bar that sits fewer than ``min_hold_days`` bars into its run.
+
+    Works along the last axis, so ``position`` may be a single path or a
+    (runs, days) matrix. A bar's holding count is its 1-based offset within the
+    run of consecutive positions with the same direction it belongs to, so
+    fractional positions resized within a long (or short) run keep counting.
+    """
+    position = np.asarray(position, dtype=float)
+    if min_hold_days <= 1:
+        return position.copy()
+    idx = np.arange(position.shape[-1])
+    direction = np.sign(position)
+    change = np.ones(position.shape, dtype=bool)
+    change[..., 1:] = direction[..., 1:] != direction[..., :-1]
+    run_start = np.maximum.accumulate(np.where(change, idx, 0), axis=-1)
+    hold = idx - run_start + 1
+    return np.where(hold < min_hold_days, 0.0, position)
+
+
 class Backtester:
     def __init__(
         self,
@@ -21,50 +42,175 @@ class Backtester:
         self.slippage = slippage
         self.min_hold_days = min_hold_days
 
-    def backtest(self, df: pd.DataFrame, verbose=False) -> pd.DataFrame:
-        df = df.copy()
-        df["position"] = df["signal"].shift(1).fillna(0)  # act on yesterday's signal
+    def backtest_arrays(self, signal, logret, valid=None, with_direction=False):
+        """
+        Array-level backtest kernel.
+
+        Parameters
+        ----------
+        signal : array-like
+            Signal per bar, acted upon on the following bar. Fractional
+            signals (e.g. posterior position sizing) are held as fractional
+            positions; costs are charged on the traded size ``|Δposition|``.
+        logret : array-like
+            Log return per bar.
+        valid : np.ndarray of bool, optional
+            Extra row mask (e.g. rows of the caller's frame without NaNs).
+        with_direction : bool
+            Also compute the trade direction (1 buy, -1 sell, 0 no action).
+
+        Returns
+        -------
+        dict
+            ``valid`` (full-length row mask) and per-row arrays restricted to the
+            valid rows: ``position``, ``returns``, ``trade``, ``strategy_ret``,
+            ``hodl_ret``, ``strategy_equity``, ``hodl_equity``, ``outperforming``
+            and optionally ``direction``.
+        """
+        signal = np.asarray(signal, dtype=float)
+        logret = np.asarray(logret, dtype=float)
+        n = len(signal)
+        cost = self.commission + self.slippage
+
+        position = np.empty(n)
+        position[0] = 0.0
+        position[1:] = signal[:-1]  # act on yesterday's signal
+        position[np.isnan(position)] = 0.0
         # Enforce min hold days (optional)
         if self.min_hold_days > 1:
-            pos = df["position"].values.copy()
-            last = 0
-            hold = 0
-            for i in range(len(pos)):
-                if pos[i] == last:
-                    hold += 1
-                else:
-                    last = pos[i]
-                    hold = 1
-                if hold < self.min_hold_days:
-                    pos[i] = 0
-            df["position"] = pos
-
-        df["returns"] = np.exp(df["logret"]) - 1
-        df["trade"] = df["position"].diff(-1).abs()
-        df.loc[df.index[-1], "trade"] = df["signal"].iloc[-1]
-
-        df["strategy_ret"] = df["position"] * df["returns"] - df["trade"] * (
-            self.commission + self.slippage
-        )
+            position = enforce_min_hold(position, self.min_hold_days)
+
+        returns = np.exp(logret)
+        returns -= 1
+
+        trade = np.empty(n)
+        np.subtract(position[:-1], position[1:], out=trade[:-1])
+        np.abs(trade[:-1], out=trade[:-1])
+        trade[-1] = signal[-1]
+
+        strategy_ret = position * returns
+        strategy_ret -= trade * cost
+
+        out = {
+            "position": position,
+            "returns": returns,
+            "trade": trade,
+            "strategy_ret": strategy_ret,
+        }
+        if with_direction:
+            direction = np.zeros(n, dtype=np.int8)
+            np.sign(position[1:] - position[:-1], out=direction[:-1], casting="unsafe")
+            out["direction"] = direction
+
+        keep = ~(np.isnan(returns) | np.isnan(trade))
+        if valid is not None:
+            keep &= valid
+        if not keep.all():
+            out = {k: v[keep] for k, v in out.items()}
+
+        hodl_ret = out["returns"].copy()
+        hodl_ret[0] = -cost
+        strategy_equity = np.cumprod(1 + out["strategy_ret"])
+        strategy_equity *= self.initial_cap
+        hodl_equity = np.cumprod(1 + hodl_ret)
+        hodl_equity *= self.initial_cap
+
+        out["valid"] = keep
+        out["hodl_ret"] = hodl_ret
+        out["strategy_equity"] = strategy_equity
+        out["hodl_equity"] = hodl_equity
+        out["outperforming"] = strategy_equity >= hodl_equity
+        return out
+
+    def backtest_batch(self, signals, logret) -> dict:
+        """
+        Backtest many signal paths over the same price path in one pass.
+
+        Parameters
+        ----------
+        signals : array-like of shape (runs, days)
+            One signal path per row; NaN signals are treated as flat.
+        logret : array-like of shape (days,)
+            Log return per bar, shared by every path.
 
-        position_diff = -df["position"].diff(-1)
-        conditions = [
-            position_diff > 0,
-            position_diff < 0,
-        ]
-        choices = ["buy", "sell"]
-        df["direction"] = np.select(conditions, choices, default="no action")
-        df.dropna(inplace=True)
+        Returns
+        -------
+        dict
+            ``valid`` (row mask over days), ``strategy_equity`` (runs x valid
+            days), ``hodl_equity`` (valid days) and per-run ``annualized_sharpe``,
+            ``total_return``, ``max_drawdown`` and ``number_of_trades`` arrays.
+        """
+        signals = np.nan_to_num(np.atleast_2d(np.asarray(signals, dtype=float)))
+        logret = np.asarray(logret, dtype=float)
+        runs, n = signals.shape
+        cost = self.commission + self.slippage
 
-        df["hodl_position"] = 1
-        df.loc[df.index[0], "hodl_position"] = 0
-        df["hodl_ret"] = df["hodl_position"] * df["returns"]
-        df.loc[df.index[0], "hodl_ret"] = -(self.commission + self.slippage)
+        position = np.empty((runs, n))
+        position[:, 0] = 0.0
+        position[:, 1:] = signals[:, :-1]  # act on yesterday's signal
+        if self.min_hold_days > 1:
+            position = enforce_min_hold(position, self.min_hold_days)
+
+        returns = np.exp(logret)
+        returns -= 1
+
+        trade = np.empty((runs, n))
+        np.subtract(position[:, :-1], position[:, 1:], out=trade[:, :-1])
+        np.abs(trade[:, :-1], out=trade[:, :-1])
+        trade[:, -1] = signals[:, -1]
+
+        strategy_ret = position * returns
+        strategy_ret -= trade * cost
+
+        keep = ~np.isnan(returns)
+        if not keep.all():
+            returns = returns[keep]
+            trade = trade[:, keep]
+            strategy_ret = strategy_ret[:, keep]
 
-        df["strategy_equity"] = self.initial_cap * (1 + df["strategy_ret"]).cumprod()
+        hodl_ret = returns.copy()
+        hodl_ret[0] = -cost
+        strategy_equity = np.cumprod(1 + strategy_ret, axis=1)
+        strategy_equity *= self.initial_cap
+        hodl_equity = np.cumprod(1 + hodl_ret)
+        hodl_equity *= self.initial_cap
 
-        df["hodl_equity"] = self.initial_cap * (1 + df["hodl_ret"]).cumprod()
-        df["outperforming"] = df["strategy_equity"] >= df["hodl_equity"]
+        drawdown = 1 - strategy_equity / np.maximum.accumulate(strategy_equity, axis=1)
+        return {
+            "valid": keep,
+            "strategy_equity": strategy_equity,
+            "hodl_equity": hodl_equity,
+            "annualized_sharpe": strategy_ret.mean(axis=1)
+            / strategy_ret.std(axis=1, ddof=1)
+            * np.sqrt(365),
+            "total_return": strategy_equity[:, -1] / strategy_equity[:, 0] - 1,
+            "max_drawdown": -1 * drawdown.max(axis=1),
+            "number_of_trades": trade.sum(axis=1).astype(int),
+        }
+
+    def backtest(self, df: pd.DataFrame, verbose=False) -> pd.DataFrame:
+        arrays = self.backtest_arrays(
+            df["signal"].values,
+            df["logret"].values,
+            valid=df.notna().all(axis=1).values,
+            with_direction=True,
+        )
+        hodl_position = np.ones(len(arrays["returns"]), dtype=np.int64)
+        hodl_position[0] = 0
+        df = df[arrays["valid"]].assign(
+            position=arrays["position"],
+            returns=arrays["returns"],
+            trade=arrays["trade"],
+            strategy_ret=arrays["strategy_ret"],
+            direction=np.array(["sell", "no action", "buy"], dtype=object)[
+                arrays["direction"] + 1
+            ],
+            hodl_position=hodl_position,
+            hodl_ret=arrays["hodl_ret"],
+            strategy_equity=arrays["strategy_equity"],
+            hodl_equity=arrays["hodl_equity"],
+            outperforming=arrays["outperforming"],
+        )
         if verbose:
             logger.info("HMM Strategy Backtesting & Trade Logs")
             self._log_trades(df)
@@ -155,3 +301,19 @@ class Backtester:
             "max_drawdown": float(maxdd),
             "number_of_trades": trades,
         }
+
+    def metrics_arrays(self, arrays: dict, col: str = "strategy_equity") -> dict:
+        """Same as :meth:`metrics` for the output of :meth:`backtest_arrays`."""
+        ret = arrays["strategy_ret"] if col == "strategy_equity" else arrays["returns"]
+        equity = arrays[col]
+        sr = ret.mean() / ret.std(ddof=1) * np.sqrt(365)
+        total_return = equity[-1] / equity[0] - 1
+        drawdown = 1 - equity / np.maximum.accumulate(equity)
+        maxdd = -1 * drawdown.max()
+        trades = int(arrays["trade"].sum()) if col == "strategy_equity" else 1
+        return {
+            "annualized_sharpe": float(sr),
+            "total_return": float(total_return),
+            "max_drawdown": float(maxdd),
+            "number_of_trades": trades,
+        }
@@ -7,8 +7,12 @@ TRAIN_END_DATE = "2025-01-01"
 TEST_START_DATE = "2025-01-01"
 TEST_END_DATE = "2025-08-22"
 EMBARGO_PERIOD = 2  # 2 Days of embargoing to avoid overlap between test and train
+WF_TRAIN_DAYS = 730  # walk-forward training window (bars)
+WF_TEST_DAYS = 90  # walk-forward refit interval / test window (bars)
 FREQ = "1D"  # data frequency
 N_STATES = 6
+COVARIANCE_TYPE = "full"  # HMM emission covariance: full, diag, tied or spherical
+HMM_DTYPE = "float64"  # precision of the HMM E-step products: float64 or float32
 INITIAL_CAPITAL = 10000.0
 COMMISSION = 0.001  # 10 bps per trade (both sides approximated)
 SLIPPAGE = 0.0001  # 1 bps on fills
@@ -19,3 +23,6 @@ MOM_WINDOW = 10
 RSI_WINDOW = 14
 ADX_WINDOW = 14
 SEED = 0
+MODEL_DIR = "models"  # on-disk store for trained model artifacts
+CACHE_DIR = "data_cache"  # local OHLCV store, one file per ticker and interval
+FEATURE_CACHE_SIZE = 32  # scaled feature matrices kept in memory by HMMModel
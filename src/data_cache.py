@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .config import CACHE_DIR
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_COLUMNS = ["open_time", "Open", "High", "Low", "Close"]
+INTERVAL_UNITS_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def interval_to_ms(interval: str) -> int:
+    """Length of a kline interval such as ``"1d"`` or ``"15m"`` in milliseconds."""
+    return int(interval[:-1]) * INTERVAL_UNITS_MS[interval[-1]]
+
+
+class OHLCVCache:
+    """
+    Local OHLCV store partitioned by ticker and interval.
+
+    Each partition is a single ``(bars, 5)`` float64 ``.npy`` array whose first
+    column is the bar open time in epoch milliseconds (exact in float64). Reads
+    are memory-mapped and appends rewrite the partition to a temporary file that
+    atomically replaces the previous one.
+    """
+
+    def __init__(self, root: str = CACHE_DIR):
+        self.root = root
+
+    def path(self, ticker: str, interval: str) -> str:
+        return os.path.join(self.root, ticker, f"{interval}.npy")
+
+    def _load(self, ticker: str, interval: str):
+        path = self.path(ticker, interval)
+        if not os.path.exists(path):
+            return None
+        return np.load(path, mmap_mode="r")
+
+    def last_timestamp(self, ticker: str, interval: str):
+        """Open time (epoch ms) of the newest stored bar, or ``None`` if empty."""
+        data = self._load(ticker, interval)
+        if data is None or not len(data):
+            return None
+        return int(data[-1, 0])
+
+    def read(self, ticker: str, interval: str) -> pd.DataFrame:
+        """Stored bars as an OHLC frame indexed by ``date``."""
+        data = self._load(ticker, interval)
+        if data is None:
+            data = np.empty((0, len(CACHE_COLUMNS)))
+        df = pd.DataFrame(np.asarray(data[:, 1:]), columns=CACHE_COLUMNS[1:])
+        df.index = pd.to_datetime(data[:, 0].astype(np.int64), unit="ms")
+        df.index.name = "date"
+        return df
+
+    @staticmethod
+    def _to_array(df: pd.DataFrame) -> np.ndarray:
+        data = np.column_stack(
+            [
+                df.index.values.astype("datetime64[ms]").astype(np.int64),
+                df[CACHE_COLUMNS[1:]].to_numpy(dtype=float),
+            ]
+        ).astype(float)
+        # Keep one row per open time, sorted
+        _, unique_idx = np.unique(data[:, 0], return_index=True)
+        return data[unique_idx]
+
+    def _write(self, ticker: str, interval: str, data: np.ndarray):
+        path = self.path(ticker, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.npy"
+        np.save(tmp_path, data)
+        os.replace(tmp_path, path)
+
+    def append(self, ticker: str, interval: str, df: pd.DataFrame) -> int:
+        """
+        Append the bars of ``df`` newer than the last stored one.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            OHLC frame indexed by bar open time.
+
+        Returns
+        -------
+        int
+            Number of bars actually appended.
+        """
+        new = self._to_array(df)
+        stored = self._load(ticker, interval)
+        last = self.last_timestamp(ticker, interval)
+        if last is not None:
+            new = new[new[:, 0] > last]
+        if not len(new):
+            return 0
+
+        data = new if stored is None else np.concatenate([stored, new])
+        del stored
+        self._write(ticker, interval, data)
+        logger.info(f"Appended {len(new)} {interval} bars for {ticker} to cache.")
+        return len(new)
+
+    def merge(self, ticker: str, interval: str, df: pd.DataFrame) -> int:
+        """
+        Upsert the bars of ``df`` anywhere in the history (e.g. a backfill older
+        than the first stored bar). Incoming bars replace stored ones with the
+        same open time, so a backfill repairs partial or stale bars.
+
+        Returns
+        -------
+        int
+            Number of bars inserted or changed.
+        """
+        new = self._to_array(df)
+        stored = self._load(ticker, interval)
+        if stored is not None:
+            known = np.isin(new[:, 0], stored[:, 0])
+            # Stored rows sorted by open time; drop the incoming ones unchanged
+            pos = np.searchsorted(stored[:, 0], new[known, 0])
+            unchanged = (stored[pos] == new[known]).all(axis=1)
+            changed = np.ones(len(new), dtype=bool)
+            changed[np.flatnonzero(known)[unchanged]] = False
+            new = new[changed]
+        if not len(new):
+            return 0
+
+        if stored is None:
+            data = new
+        else:
+            data = np.concatenate([stored[~np.isin(stored[:, 0], new[:, 0])], new])
+            data = data[np.argsort(data[:, 0], kind="stable")]
+        del stored
+        self._write(ticker, interval, data)
+        logger.info(f"Merged {len(new)} {interval} bars for {ticker} into cache.")
+        return len(new)
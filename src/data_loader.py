@@ -1,24 +1,170 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 import pandas as pd
 import requests
 import numpy as np
+from requests.adapters import HTTPAdapter
 from .config import TICKER  # , START, END
+from .data_cache import OHLCVCache, interval_to_ms
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+KLINE_COLUMNS = [
+    "open_time",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_volume",
+    "taker_buy_quote_volume",
+    "ignore",
+]
+
 
 class DataLoader:
     def __init__(
         self,
         ticker=TICKER,
+        interval="1d",
+        cache: OHLCVCache = None,
     ):
         self.ticker = ticker
+        self.interval = interval
         self.limit = 1000
-        self.api_url = (
-            "https://www.deribit.com/api/v2/public/get_tradingview_chart_data"
+        self.api_url = "https://api.binance.com/api/v3/klines"
+        self.stored_path = "raw_data.csv"
+        self.cache = cache or OHLCVCache()
+        self.max_retries = 5
+        self.backoff = 0.5  # seconds, doubled after every rate-limited attempt
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
+
+    @classmethod
+    def _klines_to_frame(cls, data, closed_only=False) -> pd.DataFrame:
+        """
+        Convert raw Binance klines to an OHLC frame indexed by open time.
+
+        Binance returns the bar that is still forming as the last kline;
+        ``closed_only`` drops it (any kline whose close time is in the future)
+        so that partial bars never reach the cache.
+        """
+        # Convert to DataFrame
+        df = pd.DataFrame(data, columns=KLINE_COLUMNS)
+        if closed_only:
+            df = df[df["close_time"].astype(np.int64) < cls._now_ms()]
+
+        # Keep only needed columns and convert types
+        df = df[["open_time", "open", "high", "low", "close"]].astype(float)
+        df["date"] = pd.to_datetime(df["open_time"], unit="ms")
+        df.set_index("date", inplace=True)
+        df.drop(columns=["open_time"], inplace=True)
+        df.columns = [col.capitalize() for col in df.columns]
+        return df
+
+    @staticmethod
+    def _add_logret(df: pd.DataFrame) -> pd.DataFrame:
+        # Calculate log returns
+        df["logret"] = np.log(df["Close"] / df["Close"].shift(1))
+        return df.dropna()
+
+    def _fetch_klines(self, start_time: int = None, closed_only=False) -> pd.DataFrame:
+        params = {"symbol": self.ticker, "interval": self.interval, "limit": self.limit}
+        if start_time is not None:
+            params["startTime"] = start_time
+        r = requests.get(self.api_url, params=params)
+        r.raise_for_status()
+        return self._klines_to_frame(r.json(), closed_only)
+
+    def _fetch_page(self, session: requests.Session, start_time: int, end_time: int):
+        """Fetch one kline page, backing off while the API rate-limits us."""
+        params = {
+            "symbol": self.ticker,
+            "interval": self.interval,
+            "limit": self.limit,
+            "startTime": start_time,
+            "endTime": end_time,
+        }
+        for attempt in range(self.max_retries + 1):
+            r = session.get(self.api_url, params=params)
+            # 429: request weight exceeded, 418: IP auto-banned after ignoring 429s
+            if r.status_code in (418, 429) and attempt < self.max_retries:
+                wait = float(r.headers.get("Retry-After", self.backoff * 2**attempt))
+                logger.warning(f"Rate limited by Binance API, retrying in {wait}s...")
+                time.sleep(wait)
+                continue
+            r.raise_for_status()
+            return self._klines_to_frame(r.json(), closed_only=True)
+
+    def backfill(self, start, end=None, max_workers: int = 4) -> int:
+        """
+        Download ``[start, end]`` into the local cache in concurrent kline pages.
+
+        The range is split into pages of ``limit`` bars which are fetched over a
+        pooled ``requests.Session``, then stitched, de-duplicated and merged into
+        the cache, replacing stored bars with the same open time. Naive
+        ``start``/``end`` are read as UTC. Returns the number of bars inserted
+        or changed.
+        """
+        start_ms = int(pd.Timestamp(start).value // 10**6)
+        end = pd.Timestamp.now(tz="UTC") if end is None else pd.Timestamp(end)
+        end_ms = int(end.value // 10**6)
+        page_ms = self.limit * interval_to_ms(self.interval)
+        pages = [
+            (page_start, min(page_start + page_ms - 1, end_ms))
+            for page_start in range(start_ms, end_ms + 1, page_ms)
+        ]
+        if not pages:
+            return 0
+        logger.info(
+            f"Backfilling {self.ticker} {self.interval} bars in {len(pages)} pages..."
         )
 
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(
+                    executor.map(lambda page: self._fetch_page(session, *page), pages)
+                )
+
+        df = pd.concat(frames).sort_index()
+        df = df[~df.index.duplicated(keep="first")]
+        return self.cache.merge(self.ticker, self.interval, df)
+
+    def update_cache(self) -> int:
+        """
+        Bring the local cache up to date, fetching only bars after the last one.
+
+        Only closed bars are stored: a bar still forming would otherwise be
+        cached with its partial close/high/low and never fetched again. An
+        empty cache of the default ticker is first seeded from the stored CSV
+        history. Returns the number of bars appended from the API.
+        """
+        last = self.cache.last_timestamp(self.ticker, self.interval)
+        if (
+            last is None
+            and self.ticker == TICKER
+            and self.interval == "1d"
+            and os.path.exists(self.stored_path)
+        ):
+            stored_df = pd.read_csv(self.stored_path, parse_dates=["date"])
+            self.cache.append(self.ticker, self.interval, stored_df.set_index("date"))
+            last = self.cache.last_timestamp(self.ticker, self.interval)
+
+        start_time = None if last is None else last + interval_to_ms(self.interval)
+        new_df = self._fetch_klines(start_time, closed_only=True)
+        return self.cache.append(self.ticker, self.interval, new_df)
+
     def get_data(
         self,
         focus: Literal[
@@ -28,66 +174,24 @@ class DataLoader:
         ] = "expansion",
     ) -> pd.DataFrame:
         """
-        Fetches historical OHLCV data from Deribit using the requests library.
+        Fetches historical OHLCV data from Binance using the requests library.
+
+        ``"expansion"`` serves the local cache after appending the bars missing
+        since its last timestamp, ``"limit"`` returns the latest ``limit`` bars
+        straight from the API and ``"reproduction"`` reads the stored CSV.
         """
         logger.info(f"Fetching data for {self.ticker} from Binance API...")
         if focus == "reproduction":
-            df = pd.read_csv("raw_data.csv")
+            df = pd.read_csv(self.stored_path)
             df["date"] = pd.to_datetime(df["date"])
             df = df.set_index("date")
 
-        else:
-            url = "https://api.binance.com/api/v3/klines"
-            params = {"symbol": self.ticker, "interval": "1d", "limit": self.limit}
-            r = requests.get(url, params=params)
-            r.raise_for_status()
-            data = r.json()
-
-            # Convert to DataFrame
-            last1000_df = pd.DataFrame(
-                data,
-                columns=[
-                    "open_time",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "close_time",
-                    "quote_asset_volume",
-                    "number_of_trades",
-                    "taker_buy_base_volume",
-                    "taker_buy_quote_volume",
-                    "ignore",
-                ],
-            )
-
-            # Keep only needed columns and convert types
-            last1000_df = last1000_df[
-                ["open_time", "open", "high", "low", "close"]
-            ].astype(float)
-            last1000_df["date"] = pd.to_datetime(last1000_df["open_time"], unit="ms")
-            last1000_df.set_index("date", inplace=True)
-            last1000_df.drop(columns=["open_time"], inplace=True)
-            last1000_df.columns = [col.capitalize() for col in last1000_df.columns]
-            # Calculate log returns
-            last1000_df["logret"] = np.log(
-                last1000_df["Close"] / last1000_df["Close"].shift(1)
-            )
-            last1000_df = last1000_df.dropna()
-            if focus == "limit":
-                df = last1000_df
-            elif focus == "expansion":
-                stored_df = pd.read_csv("raw_data.csv")
-                stored_df["date"] = pd.to_datetime(stored_df["date"])
-                stored_df = stored_df.set_index("date")
-                df = (
-                    pd.concat(
-                        [last1000_df, stored_df],  # ignore_index=False
-                    )
-                    .drop_duplicates(subset=["date"])
-                    .set_index("date")
-                )
+        elif focus == "limit":
+            df = self._add_logret(self._fetch_klines())
+
+        elif focus == "expansion":
+            self.update_cache()
+            df = self._add_logret(self.cache.read(self.ticker, self.interval))
 
         logger.info("Data fetched successfully.")
         return df
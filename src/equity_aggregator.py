@@ -0,0 +1,155 @@
+import numpy as np
+
+
+class EquityAggregator:
+    """
+    Streaming per-timestamp statistics over Monte Carlo equity paths.
+
+    Paths arrive in blocks of shape (runs, days). The aggregator keeps a
+    running mean and variance per timestamp (Chan et al. parallel update) and
+    one P² quantile sketch (Jain & Chlamtac, 1985) per configured quantile and
+    timestamp: five markers whose heights track the quantile without storing
+    the observations. The first ``exact_paths`` paths are also buffered, so
+    quantiles are exact for small studies; the buffer is released as soon as
+    more paths arrive. Paths can optionally be spilled to a memory-mapped
+    ``.npy`` file.
+
+    Memory is O((exact_paths + 10 x len(quantiles)) x days) floats up to
+    ``exact_paths`` runs and O(10 x len(quantiles) x days) beyond, regardless
+    of the number of runs (the spill file lives on disk).
+    """
+
+    def __init__(
+        self,
+        n_days: int,
+        quantiles=(0.05, 0.5, 0.95),
+        exact_paths: int = 100,
+        spill_path: str = None,
+        max_paths: int = None,
+    ):
+        """
+        Parameters
+        ----------
+        n_days : int
+            Length of every equity path.
+        quantiles : tuple of float
+            Quantiles tracked by the P² sketches.
+        exact_paths : int
+            Number of paths buffered for exact quantiles; larger studies switch
+            to the sketches.
+        spill_path : str, optional
+            ``.npy`` file receiving every path, written through a memory map.
+        max_paths : int, optional
+            Capacity of the spill file (required with ``spill_path``).
+        """
+        self.n_days = n_days
+        self.count = 0
+        self.mean = np.zeros(n_days)
+        self._m2 = np.zeros(n_days)
+        self.quantile_levels = np.asarray(quantiles, dtype=float)
+        self.exact_paths = exact_paths
+        self._buffer = []
+        # P² marker heights and positions, (quantiles, 5, days); set at 5 paths
+        self._heights = None
+        self._positions = None
+        # Desired-position increments of the five markers, (quantiles, 5)
+        p = self.quantile_levels[:, None]
+        self._increments = np.hstack(
+            [np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)]
+        )
+        self.paths = None
+        if spill_path is not None:
+            if max_paths is None:
+                raise ValueError("max_paths is required to spill paths to disk.")
+            self.paths = np.lib.format.open_memmap(
+                spill_path, mode="w+", dtype=float, shape=(max_paths, n_days)
+            )
+
+    def update(self, block: np.ndarray):
+        """Fold a (runs, days) block of equity paths into the statistics."""
+        block = np.atleast_2d(block)
+        n_block = len(block)
+        if not n_block:
+            return
+
+        if self.paths is not None:
+            self.paths[self.count : self.count + n_block] = block
+
+        block_mean = block.mean(axis=0)
+        block_m2 = ((block - block_mean) ** 2).sum(axis=0)
+        total = self.count + n_block
+        delta = block_mean - self.mean
+        self.mean += delta * (n_block / total)
+        self._m2 += block_m2 + delta**2 * (self.count * n_block / total)
+
+        for path in block:
+            self.count += 1
+            if self._heights is not None:
+                self._sketch(path)
+            if self.count <= max(5, self.exact_paths):
+                self._buffer.append(np.array(path, dtype=float))
+            if self.count == 5:
+                first = np.sort(self._buffer[:5], axis=0)
+                n_levels = len(self.quantile_levels)
+                self._heights = np.repeat(first[None], n_levels, axis=0)
+                self._positions = np.broadcast_to(
+                    np.arange(1.0, 6.0)[None, :, None], self._heights.shape
+                ).copy()
+            if self._heights is not None and self.count > self.exact_paths:
+                self._buffer = []
+
+    def _sketch(self, x: np.ndarray):
+        """One P² step for every quantile and timestamp."""
+        h, n = self._heights, self._positions
+        # Markers above x shift right; the extremes absorb new minima/maxima
+        n[:, 1:4] += x < h[:, 1:4]
+        n[:, 4] += 1
+        np.minimum(h[:, 0], x, out=h[:, 0])
+        np.maximum(h[:, 4], x, out=h[:, 4])
+
+        desired = 1 + (self.count - 1) * self._increments
+        for i in (1, 2, 3):
+            d = desired[:, i, None] - n[:, i]
+            move = ((d >= 1) & (n[:, i + 1] - n[:, i] > 1)) | (
+                (d <= -1) & (n[:, i - 1] - n[:, i] < -1)
+            )
+            step = np.where(move, np.sign(d), 0.0)
+            gap_up = n[:, i + 1] - n[:, i]
+            gap_down = n[:, i] - n[:, i - 1]
+            parabolic = h[:, i] + step / (n[:, i + 1] - n[:, i - 1]) * (
+                (gap_down + step) * (h[:, i + 1] - h[:, i]) / gap_up
+                + (gap_up - step) * (h[:, i] - h[:, i - 1]) / gap_down
+            )
+            up = step > 0
+            neighbour_h = np.where(up, h[:, i + 1], h[:, i - 1])
+            neighbour_n = np.where(up, gap_up, -gap_down)
+            linear = h[:, i] + step * (neighbour_h - h[:, i]) / neighbour_n
+            inside = (h[:, i - 1] < parabolic) & (parabolic < h[:, i + 1])
+            h[:, i] = np.where(move, np.where(inside, parabolic, linear), h[:, i])
+            n[:, i] += step
+
+    @property
+    def std(self) -> np.ndarray:
+        """Sample standard deviation per timestamp."""
+        if self.count < 2:
+            return np.full(self.n_days, np.nan)
+        return np.sqrt(self._m2 / (self.count - 1))
+
+    def quantiles(self, q) -> np.ndarray:
+        """
+        Quantile bands of shape (len(q), days).
+
+        Exact while every path is buffered; afterwards only the configured
+        ``quantiles`` can be read from the sketches.
+        """
+        if not self.count:
+            return np.full((len(q), self.n_days), np.nan)
+        if len(self._buffer) == self.count:
+            return np.quantile(np.array(self._buffer), q, axis=0)
+        rows = []
+        for level in q:
+            match = np.flatnonzero(np.isclose(self.quantile_levels, level))
+            if not len(match):
+                raise ValueError(f"Quantile {level} is not tracked by the sketches.")
+            rows.append(self._heights[match[0], 2])
+        return np.array(rows)
@@ -0,0 +1,102 @@
+import hashlib
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from .config import FEATURE_CACHE_SIZE
+
+
+def _digest(values: np.ndarray) -> str:
+    values = np.ascontiguousarray(values)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str((values.shape, values.dtype.str)).encode())
+    h.update(values.tobytes())
+    return h.hexdigest()
+
+
+class FeatureCache:
+    """
+    LRU cache of scaled feature matrices.
+
+    ``fit_transform`` is keyed by the feature values and the scaler
+    configuration and returns the fitted scaler with the scaled training
+    matrix; ``transform`` is keyed by the feature values and the fitted
+    scaler. Repeated fits and predictions on identical inputs (Monte Carlo
+    seeds, optimizer candidates) therefore scale each matrix once. Cached
+    arrays are read-only since they are shared between callers.
+    """
+
+    def __init__(self, maxsize: int = FEATURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _lookup(self, key):
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def _store(self, key, value):
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def fit_transform(self, features: pd.DataFrame, scaler=None):
+        """
+        Fit ``scaler`` (a fresh ``StandardScaler`` by default) on ``features``.
+
+        Returns
+        -------
+        scaler : StandardScaler
+            Fitted scaler, shared with other hits on the same key.
+        X : np.ndarray
+            Scaled (read-only) feature matrix.
+        """
+        scaler = StandardScaler() if scaler is None else scaler
+        values = features.values
+        key = ("fit", _digest(values), repr(sorted(scaler.get_params().items())))
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        X = scaler.fit_transform(values)
+        X.flags.writeable = False
+        return self._store(key, (scaler, X))
+
+    def transform(self, features: pd.DataFrame, scaler) -> np.ndarray:
+        """Scale ``features`` with an already fitted ``scaler``."""
+        values = features.values
+        scaler_digest = hashlib.blake2b(pickle.dumps(scaler), digest_size=16)
+        key = ("transform", _digest(values), scaler_digest.hexdigest())
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        X = scaler.transform(values)
+        X.flags.writeable = False
+        return self._store(key, X)
+
+    def info(self) -> dict:
+        """Hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Process-wide cache used by ``HMMModel`` unless another one is injected
+FEATURE_CACHE = FeatureCache()
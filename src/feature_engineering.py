@@ -1,3 +1,5 @@
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
@@ -81,3 +83,89 @@ class FeatureEngineer:
             f"Test: {test_df.index.min()} → {test_df.index.max()} ({len(test_df)} days)"
         )
         return train_df, test_df, features_train, features_test
+
+
+class StreamingFeatureEngineer:
+    """
+    Incremental counterpart of ``FeatureEngineer.build_features``.
+
+    Each appended close updates O(1) accumulators: a Welford rolling variance
+    over the last ``roll_vol`` log returns and the RSI's exponentially weighted
+    gain/loss averages (same ``alpha = 1 / rsi_window`` weighting as
+    ``pandas_ta.rsi``), so a new ``EXPECTED_FEATURES`` row costs constant time.
+    """
+
+    def __init__(self, roll_vol=ROLL_VOL, rsi_window=RSI_WINDOW):
+        self.roll_vol = roll_vol
+        self.rsi_window = rsi_window
+        self._prev_close = None
+        # Welford accumulators over the rolling return window
+        self._window = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Weighted sums and weight totals of the RSI averages
+        self._decay = 1.0 - 1.0 / rsi_window
+        self._gain_num = 0.0
+        self._loss_num = 0.0
+        self._weight = 0.0
+        self._n_diffs = 0
+
+    def _push_return(self, ret):
+        self._window.append(ret)
+        delta = ret - self._mean
+        self._mean += delta / len(self._window)
+        self._m2 += delta * (ret - self._mean)
+        if len(self._window) > self.roll_vol:
+            old = self._window.popleft()
+            delta = old - self._mean
+            self._mean -= delta / len(self._window)
+            self._m2 -= delta * (old - self._mean)
+
+    def _push_diff(self, diff):
+        self._gain_num = self._decay * self._gain_num + max(diff, 0.0)
+        self._loss_num = self._decay * self._loss_num + min(diff, 0.0)
+        self._weight = self._decay * self._weight + 1.0
+        self._n_diffs += 1
+
+    def update(self, close: float):
+        """
+        Append one close and return its feature row.
+
+        Returns
+        -------
+        dict or None
+            ``EXPECTED_FEATURES`` values for the new bar, or ``None`` while the
+            rolling windows are still warming up.
+        """
+        close = float(close)
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            return None
+
+        ret = np.log(close / prev_close)
+        self._push_return(ret)
+        self._push_diff(close - prev_close)
+        if len(self._window) < self.roll_vol or self._n_diffs < self.rsi_window:
+            return None
+
+        variance = max(self._m2, 0.0) / (len(self._window) - 1)
+        gain = self._gain_num / self._weight
+        loss = self._loss_num / self._weight
+        return {
+            "ret": ret,
+            "vol21": np.sqrt(variance) * np.sqrt(365),
+            "rsi": 100 * gain / (gain + abs(loss)),
+        }
+
+    def update_many(self, df: pd.DataFrame, col: str = "Close") -> pd.DataFrame:
+        """Feed every bar of ``df`` and return the emitted feature rows."""
+        rows = {}
+        for timestamp, close in df[col].items():
+            row = self.update(close)
+            if row is not None:
+                rows[timestamp] = row
+        features = pd.DataFrame.from_dict(
+            rows, orient="index", columns=EXPECTED_FEATURES
+        )
+        features.index.name = df.index.name
+        return features
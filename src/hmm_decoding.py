@@ -0,0 +1,204 @@
+import numpy as np
+
+LOG_2PI = np.log(2 * np.pi)
+# Ridge hmmlearn adds to a covariance whose Cholesky factorization fails
+CHOLESKY_MIN_COVAR = 1e-7
+
+
+def _cholesky(covars: np.ndarray) -> np.ndarray:
+    """
+    Cholesky factors of a stack of covariances.
+
+    EM can leave a state numerically singular (eigenvalues around -1e-16);
+    like hmmlearn's emission density, such matrices are retried with
+    ``CHOLESKY_MIN_COVAR`` added to the diagonal.
+    """
+    try:
+        return np.linalg.cholesky(covars)
+    except np.linalg.LinAlgError:
+        pass
+    eye = np.eye(covars.shape[-1])
+    flat = covars.reshape(-1, *covars.shape[-2:])
+    chol = np.empty_like(flat)
+    for i, cv in enumerate(flat):
+        try:
+            chol[i] = np.linalg.cholesky(cv)
+        except np.linalg.LinAlgError:
+            chol[i] = np.linalg.cholesky(cv + CHOLESKY_MIN_COVAR * eye)
+    return chol.reshape(covars.shape)
+
+
+class HMMDecoder:
+    """
+    Batched log-space decoding for Gaussian HMMs.
+
+    Parameters of ``M`` models with the same number of states ``K`` are
+    stacked along a leading model axis. Cholesky factors of the covariances
+    are inverted once, so the emission log-likelihoods of every model, state
+    and observation come out of a single matrix product, and the Viterbi,
+    forward-backward and filtering recursions advance all models and
+    sequences together, one time step per vectorized operation.
+
+    ``dtype`` sets the precision of the emission computation, by far the
+    largest array (``M x S x T x K x d`` whitened residuals); ``float32``
+    halves its memory and doubles the GEMM throughput. The log-likelihoods
+    are returned and recursed in float64.
+
+    Observations are passed already scaled, with shape ``(T, d)`` for one
+    sequence or ``(S, T, d)`` for ``S`` sequences of equal length. Outputs
+    carry a leading model axis followed by the sequence axis (dropped for a
+    single ``(T, d)`` sequence).
+    """
+
+    def __init__(self, startprob, transmat, means, covars, dtype=np.float64):
+        """
+        Parameters
+        ----------
+        startprob : np.ndarray of shape (M, K)
+        transmat : np.ndarray of shape (M, K, K)
+        means : np.ndarray of shape (M, K, d)
+        covars : np.ndarray of shape (M, K, d, d)
+            Full covariance matrices.
+        dtype : numpy dtype
+            Precision of the emission log-likelihoods (see class docstring).
+        """
+        self.dtype = np.dtype(dtype)
+        self.means = np.asarray(means, dtype=float)
+        self.n_models, self.n_states, self.n_features = self.means.shape
+        chol = _cholesky(np.asarray(covars, dtype=float))
+        # Whitening maps: z = L^-1 (x - mu) = x @ W - mu @ W with W = L^-T
+        eye = np.broadcast_to(np.eye(self.n_features), chol.shape)
+        self._whiten = np.swapaxes(np.linalg.solve(chol, eye), -1, -2)
+        self._whitened_means = np.einsum("mkd,mkde->mke", self.means, self._whiten)
+        log_det = 2 * np.log(np.diagonal(chol, axis1=-2, axis2=-1)).sum(axis=-1)
+        self._log_norm = -0.5 * (self.n_features * LOG_2PI + log_det)
+
+        with np.errstate(divide="ignore"):
+            self.log_startprob = np.log(np.asarray(startprob, dtype=float))
+            self.log_transmat = np.log(np.asarray(transmat, dtype=float))
+        self.transmat = np.asarray(transmat, dtype=float)
+
+    @classmethod
+    def from_models(cls, models, dtype=None):
+        """
+        Stack fitted models (``HMMModel`` or ``GaussianHMM``) with equal ``K``.
+
+        ``covars_`` of hmmlearn models is always in full form, whatever their
+        covariance type. ``dtype`` defaults to the widest ``dtype`` of the
+        models (float64 for plain ``GaussianHMM``).
+        """
+        models = [getattr(model, "model", model) for model in models]
+        if dtype is None:
+            dtype = np.result_type(
+                *(getattr(model, "dtype", np.float64) for model in models)
+            )
+        return cls(
+            np.stack([model.startprob_ for model in models]),
+            np.stack([model.transmat_ for model in models]),
+            np.stack([model.means_ for model in models]),
+            np.stack([model.covars_ for model in models]),
+            dtype=dtype,
+        )
+
+    def _as_sequences(self, X):
+        X = np.asarray(X, dtype=float)
+        return X[None] if X.ndim == 2 else X, X.ndim == 2
+
+    def log_emissions(self, X) -> np.ndarray:
+        """Gaussian log-likelihoods of shape (M, S, T, K)."""
+        X, single = self._as_sequences(X)
+        n_seq, n_obs, d = X.shape
+        M, K = self.n_models, self.n_states
+        weights = np.moveaxis(self._whiten, 2, 0).reshape(d, M * K * d)
+        weights = weights.astype(self.dtype, copy=False)
+        z = X.reshape(-1, d).astype(self.dtype, copy=False) @ weights
+        z = z.reshape(n_seq, n_obs, M, K, d)
+        z -= self._whitened_means.astype(self.dtype, copy=False)
+        log_b = np.einsum("stmkd,stmkd->mstk", z, z).astype(float, copy=False)
+        log_b *= -0.5
+        log_b += self._log_norm[:, None, None, :]
+        return log_b[:, 0] if single else log_b
+
+    def _emissions(self, X):
+        X, single = self._as_sequences(X)
+        return self.log_emissions(X), single
+
+    def viterbi(self, X) -> np.ndarray:
+        """Most likely state paths, shape (M, S, T)."""
+        log_b, single = self._emissions(X)
+        M, S, T, K = log_b.shape
+        # Flatten models x sequences into one batch axis
+        log_b = log_b.reshape(M * S, T, K)
+        log_A = np.repeat(self.log_transmat, S, axis=0)
+        batch = np.arange(M * S)
+        backpointers = np.empty((T, M * S, K), dtype=np.intp)
+        delta = np.repeat(self.log_startprob, S, axis=0) + log_b[:, 0]
+        for t in range(1, T):
+            scores = delta[:, :, None] + log_A
+            backpointers[t] = scores.argmax(axis=1)
+            delta = scores.max(axis=1) + log_b[:, t]
+
+        states = np.empty((M * S, T), dtype=np.intp)
+        states[:, -1] = delta.argmax(axis=1)
+        for t in range(T - 1, 0, -1):
+            states[:, t - 1] = backpointers[t, batch, states[:, t]]
+        states = states.reshape(M, S, T)
+        return states[:, 0] if single else states
+
+    def _forward(self, log_b):
+        """Normalized log forward variables and per-step log normalizers."""
+        M, S, T, K = log_b.shape
+        log_b = log_b.reshape(M * S, T, K)
+        transmat = np.repeat(self.transmat, S, axis=0)
+        log_alpha = np.empty_like(log_b)
+        log_scale = np.empty((M * S, T))
+        alpha = np.repeat(self.log_startprob, S, axis=0) + log_b[:, 0]
+        for t in range(T):
+            if t:
+                peak = alpha.max(axis=1, keepdims=True)
+                prob = np.einsum("bi,bij->bj", np.exp(alpha - peak), transmat)
+                with np.errstate(divide="ignore"):
+                    alpha = np.log(prob) + peak + log_b[:, t]
+            peak = alpha.max(axis=1, keepdims=True)
+            log_scale[:, t] = peak[:, 0] + np.log(np.exp(alpha - peak).sum(axis=1))
+            alpha = alpha - log_scale[:, t, None]
+            log_alpha[:, t] = alpha
+        return log_alpha.reshape(M, S, T, K), log_scale.reshape(M, S, T)
+
+    def filter(self, X) -> np.ndarray:
+        """Filtered state probabilities P(state_t | obs_1..t), shape (M, S, T, K)."""
+        log_b, single = self._emissions(X)
+        filtered = np.exp(self._forward(log_b)[0])
+        return filtered[:, 0] if single else filtered
+
+    def forward_backward(self, X):
+        """
+        Smoothed state posteriors and sequence log-likelihoods.
+
+        Returns
+        -------
+        posteriors : np.ndarray of shape (M, S, T, K)
+        log_likelihood : np.ndarray of shape (M, S)
+        """
+        log_b, single = self._emissions(X)
+        log_alpha, log_scale = self._forward(log_b)
+        M, S, T, K = log_b.shape
+        log_b = log_b.reshape(M * S, T, K)
+        log_scale_flat = log_scale.reshape(M * S, T)
+        transmat = np.repeat(self.transmat, S, axis=0)
+        log_beta = np.zeros_like(log_b)
+        for t in range(T - 2, -1, -1):
+            nxt = log_b[:, t + 1] + log_beta[:, t + 1]
+            peak = nxt.max(axis=1, keepdims=True)
+            prob = np.einsum("bij,bj->bi", transmat, np.exp(nxt - peak))
+            with np.errstate(divide="ignore"):
+                log_beta[:, t] = np.log(prob) + peak - log_scale_flat[:, t + 1, None]
+        log_beta = log_beta.reshape(M, S, T, K)
+        log_gamma = log_alpha + log_beta
+        log_gamma -= log_gamma.max(axis=-1, keepdims=True)
+        posteriors = np.exp(log_gamma)
+        posteriors /= posteriors.sum(axis=-1, keepdims=True)
+        log_likelihood = log_scale.sum(axis=-1)
+        if single:
+            return posteriors[:, 0], log_likelihood[:, 0]
+        return posteriors, log_likelihood
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from .config import INCLUDE_SHORTING
+from .hmm_decoding import HMMDecoder
+from .hmm_model import state_signal_table
+
+
+class HMMEnsemble:
+    """
+    Fitted HMMs decoded together, e.g. the accepted runs of a Monte Carlo.
+
+    Every model must have the same number of states and have been fitted on
+    the same features (hence the same scaler), so the test features are
+    scaled once and decoded for all models in one ``HMMDecoder`` pass. The
+    result is the runs x days state (or signal) matrix that
+    ``Backtester.backtest_batch`` consumes.
+    """
+
+    def __init__(self, models: list):
+        """
+        Parameters
+        ----------
+        models : list of HMMModel
+            Fitted models sharing ``n_states`` and the training features.
+        """
+        self.models = list(models)
+        if len({hmm_model.n_states for hmm_model in self.models}) > 1:
+            raise ValueError("All models of an ensemble need the same n_states.")
+        self._decoder = None
+
+    def __len__(self):
+        return len(self.models)
+
+    @property
+    def decoder(self) -> HMMDecoder:
+        if self._decoder is None:
+            self._decoder = HMMDecoder.from_models(self.models)
+        return self._decoder
+
+    def _check_scalers(self):
+        reference = self.models[0].scaler
+        for hmm_model in self.models[1:]:
+            scaler = hmm_model.scaler
+            if scaler is not reference and not (
+                np.array_equal(scaler.mean_, reference.mean_)
+                and np.array_equal(scaler.scale_, reference.scale_)
+            ):
+                raise ValueError("Ensemble models were fitted on different features.")
+
+    def decode(self, features: pd.DataFrame) -> np.ndarray:
+        """Viterbi state paths of every model, shape (runs, days)."""
+        if not self.models:
+            return np.zeros((0, len(features)), dtype=np.intp)
+        self._check_scalers()
+        return self.decoder.viterbi(self.models[0].transform(features))
+
+    def signals(
+        self,
+        features: pd.DataFrame,
+        ret,
+        include_shorting=INCLUDE_SHORTING,
+        threshold=0.0,
+        min_frequency=0.0,
+    ):
+        """
+        Signal paths of every model, as ``HMMModel.signal_path`` per model.
+
+        Returns
+        -------
+        signals : np.ndarray of shape (runs, days)
+        state_means : np.ndarray of shape (runs, n_states)
+        """
+        states = self.decode(features)
+        if not self.models:
+            return states.astype(np.int64), np.zeros((0, 0))
+        table, state_means, _ = state_signal_table(
+            states,
+            ret,
+            self.models[0].n_states,
+            include_shorting=include_shorting,
+            threshold=threshold,
+            min_frequency=min_frequency,
+        )
+        signals = np.take_along_axis(table.astype(np.int64), states, axis=1)
+        return signals, state_means
@@ -0,0 +1,145 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+from sklearn.cluster import KMeans
+
+# k-means++ seedings keyed by (feature matrix digest, n_states, random_state)
+_KMEANS_CACHE = OrderedDict()
+_KMEANS_CACHE_SIZE = 64
+# Ridge added to initial covariances, matching hmmlearn's default min_covar
+MIN_COVAR = 1e-3
+
+
+def _copy_params(params: dict) -> dict:
+    # Callers get their own arrays, so fitting cannot corrupt a cached seeding
+    return {name: value.copy() for name, value in params.items()}
+
+
+def kmeans_init(X: np.ndarray, n_states: int, random_state=None) -> dict:
+    """
+    k-means++ based initial HMM parameters, cached per feature matrix.
+
+    Means are the cluster centres, covariances the within-cluster covariances,
+    the transition matrix the (Laplace smoothed) label transition frequencies
+    and the start distribution is uniform. Seedings with a fixed
+    ``random_state`` are cached, so repeated fits of the same matrix (e.g.
+    successive halving rounds or refits with a larger budget) skip k-means.
+    Every call returns fresh copies of the cached arrays.
+    """
+    key = None
+    if random_state is not None:
+        digest = hashlib.sha1(np.ascontiguousarray(X).tobytes()).hexdigest()
+        key = (digest, X.shape, n_states, random_state)
+        if key in _KMEANS_CACHE:
+            _KMEANS_CACHE.move_to_end(key)
+            return _copy_params(_KMEANS_CACHE[key])
+
+    kmeans = KMeans(
+        n_clusters=n_states, init="k-means++", n_init=1, random_state=random_state
+    ).fit(X)
+    labels = kmeans.labels_
+    n_features = X.shape[1]
+    fallback = np.cov(X.T) + MIN_COVAR * np.eye(n_features)
+    covars = np.array(
+        [
+            (
+                np.cov(X[labels == k].T) + MIN_COVAR * np.eye(n_features)
+                if (labels == k).sum() > n_features
+                else fallback
+            )
+            for k in range(n_states)
+        ]
+    )
+    transitions = np.ones((n_states, n_states))
+    np.add.at(transitions, (labels[:-1], labels[1:]), 1)
+    params = {
+        "startprob": np.full(n_states, 1.0 / n_states),
+        "transmat": transitions / transitions.sum(axis=1, keepdims=True),
+        "means": kmeans.cluster_centers_,
+        "covars": covars,
+    }
+
+    if key is not None:
+        _KMEANS_CACHE[key] = params
+        if len(_KMEANS_CACHE) > _KMEANS_CACHE_SIZE:
+            _KMEANS_CACHE.popitem(last=False)
+    return _copy_params(params)
+
+
+def split_state(params: dict) -> dict:
+    """
+    K -> K+1 initialization: split the state with the widest covariance.
+
+    The two children sit one standard deviation apart along the parent's
+    principal axis, share its covariance, and split its start and incoming
+    transition probabilities evenly.
+    """
+    means, covars = params["means"], params["covars"]
+    j = int(np.argmax(np.trace(covars, axis1=1, axis2=2)))
+    eigvals, eigvecs = np.linalg.eigh(covars[j])
+    offset = 0.5 * np.sqrt(eigvals[-1]) * eigvecs[:, -1]
+
+    means = np.vstack([means, means[j] + offset])
+    means[j] = means[j] - offset
+    covars = np.concatenate([covars, covars[j : j + 1]])
+    startprob = np.append(params["startprob"], params["startprob"][j] / 2)
+    startprob[j] /= 2
+    transmat = np.column_stack([params["transmat"], params["transmat"][:, j] / 2])
+    transmat[:, j] /= 2
+    transmat = np.vstack([transmat, transmat[j]])
+    return {
+        "startprob": startprob,
+        "transmat": transmat,
+        "means": means,
+        "covars": covars,
+    }
+
+
+def merge_states(params: dict) -> dict:
+    """
+    K -> K-1 initialization: merge the two states with the closest means.
+    """
+    means = params["means"]
+    distances = np.linalg.norm(means[:, None] - means[None, :], axis=-1)
+    distances[np.diag_indices_from(distances)] = np.inf
+    a, b = sorted(np.unravel_index(np.argmin(distances), distances.shape))
+
+    means = means.copy()
+    means[a] = (means[a] + means[b]) / 2
+    covars = params["covars"].copy()
+    covars[a] = (covars[a] + covars[b]) / 2
+    startprob = params["startprob"].copy()
+    startprob[a] += startprob[b]
+    transmat = params["transmat"].copy()
+    transmat[:, a] += transmat[:, b]
+    transmat[a] = (transmat[a] + transmat[b]) / 2
+    keep = np.arange(len(means)) != b
+    return {
+        "startprob": startprob[keep],
+        "transmat": transmat[keep][:, keep],
+        "means": means[keep],
+        "covars": covars[keep],
+    }
+
+
+def compact_covars(covars: np.ndarray, covariance_type: str) -> np.ndarray:
+    """
+    Full (K, d, d) covariances in the layout hmmlearn expects for
+    ``covariance_type``.
+
+    Initializers, ``split_state`` and ``merge_states`` work on full matrices
+    (the form ``GaussianHMM.covars_`` returns for every type); ``"diag"``
+    keeps their diagonals, ``"spherical"`` the mean variance per state and
+    ``"tied"`` the average matrix over states.
+    """
+    covars = np.asarray(covars)
+    if covariance_type == "full":
+        return covars
+    if covariance_type == "diag":
+        return np.diagonal(covars, axis1=1, axis2=2).copy()
+    if covariance_type == "spherical":
+        return np.diagonal(covars, axis1=1, axis2=2).mean(axis=1)
+    if covariance_type == "tied":
+        return covars.mean(axis=0)
+    raise ValueError(f"Unknown covariance type: {covariance_type}")
@@ -1,11 +1,27 @@
+import time
+
+import hmmlearn
+import numpy as np
 import pandas as pd
+from hmmlearn._emissions import BaseGaussianHMM
+from hmmlearn.base import ConvergenceMonitor
 from hmmlearn.hmm import GaussianHMM
+from scipy.special import logsumexp
 
 # from typing import Optional
 from sklearn.preprocessing import StandardScaler
 
 from utils.suppressor import suppress_stdout
-from .config import N_STATES, SEED, INCLUDE_SHORTING
+from .config import N_STATES, SEED, INCLUDE_SHORTING, COVARIANCE_TYPE, HMM_DTYPE
+from .feature_cache import FEATURE_CACHE
+from .hmm_decoding import HMMDecoder
+from .hmm_init import (
+    MIN_COVAR,
+    compact_covars,
+    kmeans_init,
+    merge_states,
+    split_state,
+)
 from utils.logger import get_logger
 import warnings
 
@@ -14,77 +30,617 @@ warnings.filterwarnings("ignore", message="Model is not converging")
 logger = get_logger(__name__)
 
 
+class EMAborted(RuntimeError):
+    """Raised by ``EarlyStoppingMonitor`` when an EM run is abandoned."""
+
+
+class EarlyStoppingMonitor(ConvergenceMonitor):
+    """
+    Convergence monitor that abandons hopeless EM runs after a few iterations.
+
+    A run is aborted as *diverging* when the log-likelihood drops by more than
+    ``divergence_tol`` (EM is monotone, so this signals numerical breakdown,
+    which hmmlearn would otherwise report as convergence), and as *stalling*
+    when, after ``min_iter`` iterations, it gained less than ``stall_tol`` over
+    the last ``window`` iterations while still improving by more than ``tol``
+    per iteration, i.e. it is creeping towards a plateau it may take hundreds
+    of iterations to reach.
+    """
+
+    def __init__(
+        self,
+        tol,
+        n_iter,
+        verbose,
+        min_iter=30,
+        window=20,
+        stall_tol=0.5,
+        divergence_tol=1e-3,
+    ):
+        super().__init__(tol, n_iter, verbose)
+        self.min_iter = min_iter
+        self.window = window
+        self.stall_tol = stall_tol
+        self.divergence_tol = divergence_tol
+
+    def report(self, log_prob):
+        super().report(log_prob)
+        if len(self.history) < 2:
+            return
+        # hmmlearn treats any drop as convergence, so check divergence first
+        if self.history[-1] - self.history[-2] < -self.divergence_tol:
+            raise EMAborted(
+                f"diverging at iteration {self.iter}: log-likelihood fell from "
+                f"{self.history[-2]:.4f} to {self.history[-1]:.4f}"
+            )
+        if self.converged or self.iter < max(self.min_iter, self.window + 1):
+            return
+        gain = self.history[-1] - self.history[-self.window - 1]
+        if gain < self.stall_tol:
+            raise EMAborted(
+                f"stalling at iteration {self.iter}: log-likelihood gained only "
+                f"{gain:.4f} over the last {self.window} iterations"
+            )
+
+
+# hmmlearn releases PrecisionGaussianHMM was verified against (the parity test
+# in tests/test_hmm_model.py); it overrides private EM hooks of GaussianHMM
+HMMLEARN_TESTED_VERSIONS = ("0.3",)
+if ".".join(hmmlearn.__version__.split(".")[:2]) not in HMMLEARN_TESTED_VERSIONS:
+    warnings.warn(
+        f"PrecisionGaussianHMM relies on hmmlearn internals and was tested with "
+        f"hmmlearn {', '.join(HMMLEARN_TESTED_VERSIONS)}.x only, found "
+        f"{hmmlearn.__version__}; run tests/test_hmm_model.py before trusting fits.",
+        RuntimeWarning,
+    )
+
+
+class PrecisionGaussianHMM(GaussianHMM):
+    """
+    ``GaussianHMM`` whose E-step runs as matrix products in ``dtype``.
+
+    hmmlearn evaluates full-covariance emissions state by state with
+    triangular solves and accumulates second moments with an einsum that
+    bypasses BLAS. Here emissions come from ``HMMDecoder`` (one GEMM for all
+    states) and the moments from one GEMM per state, both in ``dtype``
+    (float64 or float32). Parameters, sufficient statistics and the
+    forward-backward lattice stay float64.
+
+    Relies on hmmlearn internals (``BaseGaussianHMM``, ``_init``,
+    ``_do_mstep``, ``_compute_log_likelihood``); importing this module with an
+    hmmlearn outside ``HMMLEARN_TESTED_VERSIONS`` warns.
+    """
+
+    dtype = np.dtype(np.float64)
+
+    def _compute_log_likelihood(self, X):
+        try:
+            decoder = HMMDecoder(
+                self.startprob_[None],
+                self.transmat_[None],
+                self.means_[None],
+                self.covars_[None],
+                dtype=self.dtype,
+            )
+        except np.linalg.LinAlgError:
+            # Not positive definite even after the ridge; let hmmlearn raise
+            return super()._compute_log_likelihood(X)
+        return decoder.log_emissions(X)[0]
+
+    def _accumulate_sufficient_statistics(
+        self, stats, X, lattice, posteriors, fwdlattice, bwdlattice
+    ):
+        # Start and transition statistics; the Gaussian ones are done below
+        super(BaseGaussianHMM, self)._accumulate_sufficient_statistics(
+            stats=stats,
+            X=X,
+            lattice=lattice,
+            posteriors=posteriors,
+            fwdlattice=fwdlattice,
+            bwdlattice=bwdlattice,
+        )
+        X = X.astype(self.dtype, copy=False)
+        weights = posteriors.astype(self.dtype, copy=False)
+        if self._needs_sufficient_statistics_for_mean():
+            stats["post"] += posteriors.sum(axis=0)
+            stats["obs"] += weights.T @ X
+        if self._needs_sufficient_statistics_for_covars():
+            if self.covariance_type in ("spherical", "diag"):
+                stats["obs**2"] += weights.T @ X**2
+            else:
+                for k in range(self.n_components):
+                    stats["obs*obs.T"][k] += (X * weights[:, k, None]).T @ X
+
+    def _fold_spherical(self):
+        # hmmlearn's spherical initialization and M-step leave the variances
+        # tiled to (K, d), which ``covars_`` then expands into K * d matrices
+        if self.covariance_type == "spherical" and np.ndim(self._covars_) == 2:
+            self._covars_ = self._covars_.mean(axis=1)
+
+    def _init(self, X, lengths=None):
+        super()._init(X, lengths)
+        self._fold_spherical()
+
+    def _do_mstep(self, stats):
+        super()._do_mstep(stats)
+        self._fold_spherical()
+
+
+def state_signal_table(
+    states,
+    ret,
+    n_states,
+    include_shorting=INCLUDE_SHORTING,
+    threshold=0.0,
+    min_frequency=0.0,
+):
+    """
+    Per-state signal lookup table from each state's mean next-bar return.
+
+    A state is long when its mean next-bar return exceeds ``threshold``, short
+    (or flat without shorting) when it is below ``-threshold`` and flat
+    otherwise. States seen on fewer than ``min_frequency`` (a fraction) of the
+    scored bars are always flat.
+
+    ``states`` may also be a (runs, bars) matrix of state paths over the same
+    returns; every run is then scored in the same bincount pass and the
+    outputs gain a leading runs axis.
+
+    Returns
+    -------
+    table : np.ndarray of shape (n_states,)
+        Signal per state.
+    state_means : np.ndarray of shape (n_states,)
+        Mean next-bar return per state (NaN for states never scored).
+    counts : np.ndarray of shape (n_states,)
+        Number of scored bars per state.
+    """
+    states = np.asarray(states, dtype=np.intp)
+    batch_shape = states.shape[:-1]
+    states = states.reshape(-1, states.shape[-1])[:, :-1]
+    next_ret = np.asarray(ret, dtype=float)[1:]
+    scored = ~np.isnan(next_ret)
+    states, next_ret = states[:, scored], next_ret[scored]
+
+    # Offset each run's states so one bincount scores every run
+    n_runs, n_scored = states.shape
+    flat = (states + n_states * np.arange(n_runs)[:, None]).ravel()
+    size = n_runs * n_states
+    counts = np.bincount(flat, minlength=size).reshape(n_runs, n_states)
+    sums = np.bincount(flat, weights=np.tile(next_ret, n_runs), minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        state_means = sums.reshape(n_runs, n_states) / counts
+
+    table = np.zeros((n_runs, n_states))
+    table[state_means > threshold] = 1
+    if include_shorting:
+        table[state_means < -threshold] = -1
+    if min_frequency:
+        table[counts < min_frequency * max(n_scored, 1)] = 0
+    out_shape = batch_shape + (n_states,)
+    return (
+        table.reshape(out_shape),
+        state_means.reshape(out_shape),
+        counts.reshape(out_shape),
+    )
+
+
+def posterior_state_means(probabilities, ret):
+    """
+    Posterior-weighted mean next-bar return per state.
+
+    Soft counterpart of the state means of ``state_signal_table``: bar ``t``
+    contributes its next-bar return to every state with weight
+    P(state_t = k), computed as one matrix product over all bars.
+    """
+    probabilities = np.asarray(probabilities, dtype=float)[:-1]
+    next_ret = np.asarray(ret, dtype=float)[1:]
+    scored = ~np.isnan(next_ret)
+    weights = probabilities[scored]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (weights.T @ next_ret[scored]) / weights.sum(axis=0)
+
+
+def posterior_positions(
+    probabilities, state_means, include_shorting=INCLUDE_SHORTING, scale=None
+):
+    """
+    Fractional positions proportional to the expected next-bar return.
+
+    The expected return of bar ``t`` is ``probabilities[t] @ state_means``. It
+    is divided by ``scale`` (by default the largest absolute state mean, so
+    full confidence in the best state is a full position) and clipped to
+    [-1, 1], or [0, 1] without shorting.
+    """
+    state_means = np.nan_to_num(np.asarray(state_means, dtype=float))
+    expected = np.asarray(probabilities, dtype=float) @ state_means
+    if scale is None:
+        scale = np.abs(state_means).max()
+    if not scale:
+        return np.zeros(len(expected))
+    return np.clip(expected / scale, -1.0 if include_shorting else 0.0, 1.0)
+
+
 class HMMModel:
-    def __init__(self, n_states=N_STATES, random_state=SEED):
+    def __init__(
+        self,
+        n_states=N_STATES,
+        random_state=SEED,
+        n_iter=500,
+        init="default",
+        early_stopping=False,
+        feature_cache=FEATURE_CACHE,
+        covariance_type=COVARIANCE_TYPE,
+        dtype=HMM_DTYPE,
+    ):
+        """
+        Parameters
+        ----------
+        init : str
+            ``"default"`` lets hmmlearn initialize every fit (k-means on the
+            means, random elsewhere); ``"kmeans++"`` seeds all parameters from a
+            k-means++ clustering cached per feature matrix and seed.
+        early_stopping : bool
+            Monitor the EM log-likelihood with ``EarlyStoppingMonitor`` and raise
+            ``EMAborted`` as soon as the fit is diverging or stalling.
+        feature_cache : FeatureCache, optional
+            Cache of scaled feature matrices shared by ``fit``, ``transform``
+            and everything built on it; ``None`` scales on every call.
+        covariance_type : str
+            ``"full"``, ``"diag"``, ``"tied"`` or ``"spherical"`` emission
+            covariances. EM costs O(K d^2) per bar for ``"full"`` and
+            ``"tied"`` but O(K d) for ``"diag"`` and ``"spherical"``, with
+            ``d`` the number of features.
+        dtype : str
+            ``"float64"`` or ``"float32"`` precision of the emission and
+            sufficient-statistics products (see ``PrecisionGaussianHMM``).
+        """
+        if np.dtype(dtype) not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {dtype}")
         self.n_states = n_states
         self.random_state = random_state
+        self.n_iter = n_iter
+        self.init = init
+        self.early_stopping = early_stopping
+        self.feature_cache = feature_cache
+        self.covariance_type = covariance_type
+        self.dtype = np.dtype(dtype)
         self.model = None
         self.scaler = None
+        self.fit_stats_ = None
+        self._log_alpha = None
+        self._log_startprob = None
+        self._log_transmat = None
+        self._decoder = None
         # self.converged = None
 
+    def parameters(self) -> dict:
+        """Fitted HMM parameters, usable as ``warm_start`` for another fit."""
+        if self.model is None:
+            raise ValueError("Model must be fitted before reading its parameters.")
+        return {
+            "startprob": self.model.startprob_,
+            "transmat": self.model.transmat_,
+            "means": self.model.means_,
+            "covars": self.model.covars_,
+        }
+
+    def _initial_parameters(self, X, warm_start):
+        if warm_start is None:
+            if self.init == "kmeans++":
+                return kmeans_init(X, self.n_states, self.random_state)
+            return None
+
+        params = (
+            warm_start.parameters() if isinstance(warm_start, HMMModel) else warm_start
+        )
+        n_prev = len(params["means"])
+        if n_prev == self.n_states - 1:
+            params = split_state(params)
+        elif n_prev == self.n_states + 1:
+            params = merge_states(params)
+        elif n_prev != self.n_states:
+            raise ValueError(
+                f"Cannot warm start {self.n_states} states from {n_prev} states."
+            )
+        # Copies, so the fit cannot alter the source model; EM can leave a
+        # state (near) singular, so ridge it like the cold seedings
+        params = {name: np.array(value) for name, value in params.items()}
+        params["covars"] += MIN_COVAR * np.eye(X.shape[1])
+        return params
+
     def fit(
         self,
         features: pd.DataFrame,
         verbose=True,
+        warm_start=None,
     ):
+        """
+        Fit the HMM on ``features``.
+
+        ``warm_start`` (an ``HMMModel`` or its ``parameters()``) seeds EM from a
+        previous fit on the same features; a model with one state fewer or more
+        is split or merged into ``n_states`` states first. Iteration count,
+        convergence and wall time are stored in ``fit_stats_``.
+        """
         if verbose:
             logger.info("Fitting HMM...")
-        self.scaler = StandardScaler()
-        X = self.scaler.fit_transform(features.values)
-        self.model = GaussianHMM(
+        # A refit starts a new filter; update() must not extend the old one
+        self._log_alpha = self._log_startprob = self._log_transmat = None
+        if self.feature_cache is None:
+            self.scaler = StandardScaler()
+            X = self.scaler.fit_transform(features.values)
+        else:
+            self.scaler, X = self.feature_cache.fit_transform(features)
+        params = self._initial_parameters(X, warm_start)
+        self.model = PrecisionGaussianHMM(
             n_components=self.n_states,
-            covariance_type="full",
-            n_iter=500,
+            covariance_type=self.covariance_type,
+            n_iter=self.n_iter,
             random_state=self.random_state,
+            init_params="stmc" if params is None else "",
         )
-        with suppress_stdout():
-            self.model.fit(X)
-            # self.converged = self.model.monitor_.converged
+        self.model.dtype = self.dtype
+        if params is not None:
+            self.model.startprob_ = params["startprob"]
+            self.model.transmat_ = params["transmat"]
+            self.model.means_ = params["means"]
+            self.model.covars_ = compact_covars(params["covars"], self.covariance_type)
+        if self.early_stopping:
+            self.model.monitor_ = EarlyStoppingMonitor(
+                self.model.tol, self.n_iter, self.model.verbose
+            )
+        start = time.perf_counter()
+        try:
+            with suppress_stdout():
+                self.model.fit(X)
+                # self.converged = self.model.monitor_.converged
+        finally:
+            monitor = self.model.monitor_
+            history = monitor.history
+            self.fit_stats_ = {
+                "n_iter": monitor.iter,
+                # hmmlearn's ``converged`` is also True once n_iter is used up
+                "converged": bool(
+                    len(history) >= 2 and history[-1] - history[-2] < monitor.tol
+                ),
+                "log_likelihood": history[-1] if history else np.nan,
+                "wall_time": time.perf_counter() - start,
+            }
         hidden_states = self.model.predict(X)
         if verbose:
-            logger.info("Fitting HMM Complete.")
+            logger.info(
+                f"Fitting HMM Complete ({self.fit_stats_['n_iter']} EM iterations "
+                f"in {self.fit_stats_['wall_time']:.2f}s)."
+            )
         return hidden_states
 
+    @property
+    def decoder(self) -> HMMDecoder:
+        """Batched decoding engine over the fitted parameters (built once per fit)."""
+        if self.model is None:
+            raise ValueError("Model must be fitted before prediction.")
+        if self._decoder is None or self._decoder[0] is not self.model:
+            self._decoder = (self.model, HMMDecoder.from_models([self.model]))
+        return self._decoder[1]
+
+    def predict_batch(self, sequences) -> np.ndarray:
+        """
+        Viterbi states of several equal-length feature frames in one pass.
+
+        Returns
+        -------
+        np.ndarray of shape (n_sequences, n_bars)
+        """
+        X = np.stack([self.transform(features) for features in sequences])
+        return self.decoder.viterbi(X)[0]
+
+    def transform(self, features: pd.DataFrame) -> np.ndarray:
+        """Features scaled with the fitted scaler (cached per feature frame)."""
+        if self.scaler is None or self.model is None:
+            raise ValueError("Model must be fitted before prediction.")
+        if self.feature_cache is None:
+            return self.scaler.transform(features.values)
+        return self.feature_cache.transform(features, self.scaler)
+
     def predict(self, features: pd.DataFrame, verbose=True):
         if verbose:
             logger.info("Predicting hidden states...")
-        if self.scaler is None or self.model is None:
-            raise ValueError("Model must be fitted before prediction.")
-        X = self.scaler.transform(features.values)
+        X = self.transform(features)
         hidden_states = self.model.predict(X)
         if verbose:
             logger.info("Prediction complete.")
         return hidden_states
 
+    def predict_proba(self, features: pd.DataFrame, posterior="smoothed"):
+        """
+        State probabilities per bar.
+
+        Parameters
+        ----------
+        posterior : str
+            ``"smoothed"`` for forward-backward posteriors P(state_t | all
+            bars), which like ``predict`` use the whole window, or
+            ``"filtered"`` for the causal forward filter P(state_t | bars <= t).
+        """
+        if posterior == "filtered":
+            return self.filter(features)
+        if posterior != "smoothed":
+            raise ValueError(f"Unknown posterior: {posterior}")
+        return self.model.predict_proba(self.transform(features))
+
+    def posterior_signal(
+        self,
+        features: pd.DataFrame,
+        ret,
+        include_shorting=INCLUDE_SHORTING,
+        posterior="smoothed",
+        scale=None,
+    ):
+        """
+        Fractional positions sized by the posterior expected next-bar return.
+
+        State means are estimated with posterior weights over the same bars
+        (as ``regime_to_signal`` does with hard states), then every bar's
+        position is ``posterior_positions`` of its state probabilities. The
+        result can be passed to ``Backtester`` as the ``signal``.
+
+        Returns
+        -------
+        signal : np.ndarray
+            Fractional position per bar.
+        state_means : np.ndarray
+            Posterior-weighted mean next-bar return per state.
+        """
+        probabilities = self.predict_proba(features, posterior)
+        state_means = posterior_state_means(probabilities, ret)
+        signal = posterior_positions(
+            probabilities, state_means, include_shorting, scale=scale
+        )
+        return signal, state_means
+
+    def _log_emissions(self, features: pd.DataFrame):
+        return self.model._compute_log_likelihood(self.transform(features))
+
+    def _forward_step(self, log_alpha, log_b):
+        """One normalized forward recursion step, O(K^2) in the number of states."""
+        if log_alpha is None:
+            log_alpha = self._log_startprob + log_b
+        else:
+            log_alpha = logsumexp(log_alpha[:, None] + self._log_transmat, axis=0)
+            log_alpha += log_b
+        return log_alpha - logsumexp(log_alpha)
+
+    def filter(self, features: pd.DataFrame):
+        """
+        Run the forward filter over ``features`` and keep its state for ``update``.
+
+        Returns the filtered state probabilities P(state_t | obs_1..t) per bar.
+        """
+        with np.errstate(divide="ignore"):
+            self._log_startprob = np.log(self.model.startprob_)
+            self._log_transmat = np.log(self.model.transmat_)
+        filtered = self.decoder.filter(self.transform(features))[0]
+        with np.errstate(divide="ignore"):
+            self._log_alpha = np.log(filtered[-1])
+        return filtered
+
+    def update(self, features: pd.DataFrame):
+        """
+        Advance the forward filter by the new bar(s) in ``features``.
+
+        Returns the filtered state probabilities of the newest bar. Each bar
+        costs O(K^2), independently of the length of the history.
+        """
+        if self._log_alpha is None:
+            return self.filter(features)[-1]
+        for log_b in self._log_emissions(features):
+            self._log_alpha = self._forward_step(self._log_alpha, log_b)
+        return np.exp(self._log_alpha)
+
+    def filtered_signal(self, state_stats, include_shorting=INCLUDE_SHORTING):
+        """
+        Signal of the most probable filtered state for the newest bar.
+
+        A state missing from ``state_stats`` (never visited by the Viterbi path
+        the statistics came from) or with a NaN statistic is flat.
+        """
+        if self._log_alpha is None:
+            raise ValueError("Run filter() before requesting a filtered signal.")
+        stat = pd.Series(state_stats).get(int(np.argmax(self._log_alpha)), np.nan)
+        if pd.isna(stat):
+            return 0
+        return 1 if stat > 0 else ((-1 if include_shorting else 0) if stat < 0 else 0)
+
+    def signal_path(
+        self,
+        hidden_states,
+        ret,
+        include_shorting=INCLUDE_SHORTING,
+        threshold=0.0,
+        min_frequency=0.0,
+        probabilities=None,
+    ):
+        """
+        Array counterpart of ``regime_to_signal``.
+
+        Parameters
+        ----------
+        hidden_states : array-like of int
+            State per bar.
+        ret : array-like
+            Log return per bar; each state is scored on the next bar's return.
+        include_shorting, threshold, min_frequency
+            Signal rules, see ``state_signal_table``.
+        probabilities : np.ndarray of shape (bars, n_states), optional
+            State probabilities per bar. If given, the signal is the
+            probability-weighted average of the per-state signals (a fractional
+            position) instead of the signal of ``hidden_states``.
+
+        Returns
+        -------
+        signal : np.ndarray
+            Signal per bar.
+        state_means : np.ndarray
+            Mean next-bar return per state (NaN for states without one).
+        """
+        hidden_states = np.asarray(hidden_states, dtype=np.intp)
+        n_states = max(self.n_states, int(hidden_states.max()) + 1)
+        table, state_means, _ = state_signal_table(
+            hidden_states,
+            ret,
+            n_states,
+            include_shorting=include_shorting,
+            threshold=threshold,
+            min_frequency=min_frequency,
+        )
+        if probabilities is not None:
+            probabilities = np.asarray(probabilities)
+            return probabilities @ table[: probabilities.shape[1]], state_means
+        return np.take(table.astype(np.int64), hidden_states), state_means
+
     def regime_to_signal(
         self,
         df: pd.DataFrame,
         hidden_states,
         include_shorting=INCLUDE_SHORTING,
         verbose=True,
+        threshold=0.0,
+        min_frequency=0.0,
+        probabilities=None,
     ):
         if verbose:
             logger.info("Computing signals...")
-        df = df.copy()
-        df["state"] = hidden_states
-
-        # Next-day returns
-        df["next_ret"] = df["ret"].shift(-1)
-
-        # Mean future return per state
-        state_stats = df.groupby("state")["next_ret"].mean()
+        hidden_states = np.asarray(hidden_states, dtype=np.intp)
+        ret = df["ret"].to_numpy(dtype=float)
+        signal, state_means = self.signal_path(
+            hidden_states,
+            ret,
+            include_shorting=include_shorting,
+            threshold=threshold,
+            min_frequency=min_frequency,
+            probabilities=probabilities,
+        )
 
-        # Assign signals: long if >0, short if <0
-        df["signal"] = df["state"].map(
-            lambda s: 1
-            if state_stats[s] > 0
-            else ((-1 if include_shorting else 0) if state_stats[s] < 0 else 0)
+        # Mean future return per state, for the states that occur
+        observed = np.flatnonzero(np.bincount(hidden_states))
+        state_stats = pd.Series(
+            state_means[observed],
+            index=pd.Index(observed, name="state"),
+            name="next_ret",
         )
 
+        next_ret = np.full(len(ret), np.nan)
+        next_ret[:-1] = ret[1:]
+        df = df.assign(state=hidden_states, next_ret=next_ret, signal=signal)
+
         # Flatten MultiIndex if present
         if df.columns.nlevels > 1:
             df.columns = df.columns.get_level_values(0)
         if verbose:
             logger.info("Successfully computed signals.")
 
-        return df.ffill(), state_stats
+        gaps = df.columns[df.isna().any().to_numpy()]
+        if len(gaps):
+            df[gaps] = df[gaps].ffill()
+        return df, state_stats
@@ -1,12 +1,209 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
 from src.backtester import Backtester
-from src.hmm_model import HMMModel
-from scipy.stats import gaussian_kde
+from src.config import COVARIANCE_TYPE, HMM_DTYPE
+from src.equity_aggregator import EquityAggregator
+from src.hmm_ensemble import HMMEnsemble
+from src.hmm_model import EMAborted, HMMModel
+from src.model_registry import ModelRegistry
+from src.return_distribution import ReturnDistribution
+from src.shared_frames import SharedFrames
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Inputs shared by every task of a worker process, set once by ``_init_worker``.
+# Frames arrive as ``SharedFrames`` handles and are attached as memory-mapped
+# views, so neither tasks nor workers pickle the data itself.
+_WORKER_INPUTS = {}
+
+
+def _fit_seed(
+    features_train, n_states, init, early_stopping, covariance_type, dtype, seed
+):
+    """
+    Fit one HMM; never raises.
+
+    Returns the per-seed record (without ``signal``) and the fitted model,
+    which is ``None`` unless ``status`` is ``"converged"``. Other outcomes are
+    ``"aborted"`` (EM stopped early or exhausted its budget without
+    converging) and ``"errored"`` (any other exception).
+    """
+    record = {"random_state": seed, "status": "converged", "reason": None}
+    hmm_model = HMMModel(
+        n_states=n_states,
+        random_state=seed,
+        init=init,
+        early_stopping=early_stopping,
+        covariance_type=covariance_type,
+        dtype=dtype,
+    )
+    start = time.perf_counter()
+    try:
+        hmm_model.fit(features_train, verbose=False)
+        if not hmm_model.fit_stats_["converged"]:
+            history = hmm_model.model.monitor_.history
+            last_ll = history[-1]
+            prev_ll = history[-2] if len(history) > 1 else last_ll
+            raise EMAborted(
+                f"HMM failed to converge. "
+                f"Last log-likelihood: {last_ll:.4f}, "
+                f"Delta: {last_ll - prev_ll:.4f}"
+            )
+    except EMAborted as e:
+        record.update(status="aborted", reason=str(e))
+    except Exception as e:
+        record.update(status="errored", reason=f"{type(e).__name__}: {e}")
+    stats = hmm_model.fit_stats_ or {}
+    record["n_iter"] = stats.get("n_iter", 0)
+    record["fit_time"] = stats.get("wall_time", np.nan)
+    record["wall_time"] = time.perf_counter() - start
+    return record, hmm_model if record["status"] == "converged" else None
+
+
+def _evaluate_seeds(
+    features_train,
+    features_test,
+    test_df,
+    n_states,
+    init,
+    early_stopping,
+    covariance_type,
+    dtype,
+    seeds,
+):
+    """
+    Fit one HMM per seed and derive the signal paths over the test set.
+
+    The converged models are decoded together as an ``HMMEnsemble``; the
+    decoding time is split evenly over their ``wall_time``. Should the batched
+    decode fail, models are decoded one by one so a single bad fit is recorded
+    as ``"errored"`` instead of sinking the whole batch. Never raises.
+
+    Returns
+    -------
+    list of dict
+        One record per seed, in seed order; converged records carry their
+        ``signal`` path.
+    """
+    records, models = [], []
+    for seed in seeds:
+        record, hmm_model = _fit_seed(
+            features_train, n_states, init, early_stopping, covariance_type, dtype, seed
+        )
+        records.append(record)
+        if hmm_model is not None:
+            models.append((record, hmm_model))
+    if not models:
+        return records
+
+    ret = test_df["ret"].values
+    start = time.perf_counter()
+    try:
+        ensemble = HMMEnsemble([hmm_model for _, hmm_model in models])
+        signals, _ = ensemble.signals(features_test, ret)
+        for (record, _), signal in zip(models, signals):
+            record["signal"] = signal
+    except Exception as e:
+        logger.warning(
+            f"Batched decoding of {len(models)} models failed "
+            f"({type(e).__name__}: {e}); decoding them one by one."
+        )
+        for record, hmm_model in models:
+            try:
+                hidden_states = hmm_model.predict(features_test, verbose=False)
+                record["signal"], _ = hmm_model.signal_path(hidden_states, ret)
+            except Exception as e:
+                record.update(status="errored", reason=f"{type(e).__name__}: {e}")
+    decode_time = (time.perf_counter() - start) / len(models)
+    for record, _ in models:
+        record["wall_time"] += decode_time
+    return records
+
+
+def _init_worker(
+    features_train,
+    features_test,
+    test_df,
+    n_states,
+    init,
+    early_stopping,
+    covariance_type,
+    dtype,
+):
+    _WORKER_INPUTS.update(
+        features_train=features_train.attach(),
+        features_test=features_test.attach(),
+        test_df=test_df.attach(),
+        n_states=n_states,
+        init=init,
+        early_stopping=early_stopping,
+        covariance_type=covariance_type,
+        dtype=dtype,
+    )
+
+
+def _run_seed_batch(seeds):
+    """Worker task: evaluate a batch of seeds, one record per seed."""
+    return _evaluate_seeds(seeds=seeds, **_WORKER_INPUTS)
+
+
+def _write_chunk(path, records, n_days):
+    """
+    Atomically write seed records (and accepted signal paths) to a ``.npz``.
+
+    Signals are stored as ``int8``; equity curves and metrics are recomputed
+    from them on resume, which reproduces them exactly.
+    """
+    signals = [r["signal"] for r in records if r["status"] == "converged"]
+    arrays = {
+        "seed": np.array([r["seed"] for r in records], dtype=np.int64),
+        "random_state": np.array(
+            [-1 if r["random_state"] is None else r["random_state"] for r in records],
+            dtype=np.int64,
+        ),
+        "status": np.array([r["status"] for r in records]),
+        "reason": np.array([r["reason"] or "" for r in records]),
+        "n_iter": np.array([r["n_iter"] for r in records], dtype=np.int64),
+        "fit_time": np.array([r["fit_time"] for r in records], dtype=float),
+        "wall_time": np.array([r["wall_time"] for r in records], dtype=float),
+        "signal": (
+            np.vstack(signals).astype(np.int8)
+            if signals
+            else np.zeros((0, n_days), dtype=np.int8)
+        ),
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _read_chunk(path):
+    """Inverse of ``_write_chunk``: yield the stored seed records in order."""
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files}
+    signals = iter(arrays["signal"].astype(float))
+    for k in range(len(arrays["seed"])):
+        random_state = int(arrays["random_state"][k])
+        record = {
+            "random_state": None if random_state < 0 else random_state,
+            "status": str(arrays["status"][k]),
+            "reason": str(arrays["reason"][k]) or None,
+            "n_iter": int(arrays["n_iter"][k]),
+            "fit_time": float(arrays["fit_time"][k]),
+            "wall_time": float(arrays["wall_time"][k]),
+        }
+        if record["status"] == "converged":
+            record["signal"] = next(signals)
+        yield record
+
 
 class MCBacktester:
     """
@@ -20,6 +217,18 @@ class MCBacktester:
         test_df: pd.DataFrame,
         n_states: int = 14,
         runs: int = 100,
+        init: str = "default",
+        early_stopping: bool = False,
+        covariance_type: str = COVARIANCE_TYPE,
+        dtype: str = HMM_DTYPE,
+        max_rejections: int = None,
+        batch_size: int = 256,
+        quantiles=(0.05, 0.5, 0.95),
+        exact_paths: int = 100,
+        spill_path: str = None,
+        checkpoint_dir: str = None,
+        checkpoint_every: int = 50,
+        n_bootstrap: int = 1000,
     ):
         """
         Parameters
@@ -38,6 +247,39 @@ class MCBacktester:
             Number of hidden states for HMM.
         runs : int
             Number of Monte Carlo runs.
+        init : str
+            EM initialization passed to ``HMMModel`` (``"default"`` or
+            ``"kmeans++"``).
+        early_stopping : bool
+            Abort seeds whose EM log-likelihood is diverging or stalling instead
+            of running them to ``n_iter``.
+        covariance_type : str
+            HMM emission covariance passed to ``HMMModel``.
+        dtype : str
+            Precision of the HMM E-step and of the ensemble decoding
+            (``"float64"`` or ``"float32"``).
+        max_rejections : int, optional
+            Give up once this many seeds were aborted or errored (defaults to
+            ``10 * runs``).
+        batch_size : int
+            Accepted runs buffered before being backtested and folded into the
+            streaming equity statistics.
+        quantiles : tuple of float
+            Equity quantile bands reported per timestamp.
+        exact_paths : int
+            Studies of up to this many runs get exact quantile bands; larger
+            ones read them from per-timestamp P² sketches (see
+            ``EquityAggregator``), so memory does not grow with ``runs``.
+        spill_path : str, optional
+            Keep every equity path in this memory-mapped ``.npy`` file
+            (exposed as ``paths_equity``); otherwise paths are not retained.
+        checkpoint_dir : str, optional
+            Directory where completed seeds are periodically checkpointed so an
+            interrupted study can be resumed with ``run(resume=True)``.
+        checkpoint_every : int
+            Number of completed seeds between two checkpoints.
+        n_bootstrap : int
+            Bootstrap resamples behind the outperformance confidence intervals.
         """
         self.features_train = features_train
         self.features_test = features_test
@@ -45,7 +287,20 @@ class MCBacktester:
         self.test_df = test_df
         self.n_states = n_states
         self.runs = runs
+        self.init = init
+        self.early_stopping = early_stopping
+        self.covariance_type = covariance_type
+        self.dtype = dtype
+        self.max_rejections = max_rejections if max_rejections else 10 * runs
+        self.batch_size = batch_size
+        self.quantiles = quantiles
+        self.exact_paths = exact_paths
+        self.spill_path = spill_path
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+        self.n_bootstrap = n_bootstrap
         self.benchmark_return = None
+        self.distribution = None
         self.sf = None
         self.pdf = None
         self.cdf = None
@@ -55,92 +310,295 @@ class MCBacktester:
         self.sharpes = []
         self.drawdowns = []
         self.trades = []
-        self.paths_equity = []
+        self.fit_stats = []
+        self.seed_records = []
+        self.paths_equity = None
+        self._pending_signals = []
+        self._aggregator = None
+        self._unsaved_records = []
+        self._entropy = None
 
-    def run(self, seeded=False, verbose=True):
-        """Run Monte Carlo backtest across multiple simulations."""
-        i = 0
-        seed = 0
-        while i < self.runs:
-            try:
-                hmm_model = HMMModel(
-                    n_states=self.n_states, random_state=seed if seeded else None
-                )
-                hmm_model.fit(self.features_train, verbose=False)
-                if (
-                    hasattr(hmm_model.model, "monitor_")
-                    and not hmm_model.model.monitor_.converged
-                ):
-                    last_ll = hmm_model.model.monitor_.history[-1]
-                    prev_ll = (
-                        hmm_model.model.monitor_.history[-2]
-                        if len(hmm_model.model.monitor_.history) > 1
-                        else last_ll
-                    )
-                    delta = last_ll - prev_ll
-                    raise RuntimeError(
-                        f"HMM failed to converge. "
-                        f"Last log-likelihood: {last_ll:.4f}, "
-                        f"Delta: {delta:.4f}"
-                    )
-                hidden_states = hmm_model.predict(self.features_test, verbose=False)
-                df_with_signals, _ = hmm_model.regime_to_signal(
-                    self.test_df, hidden_states, verbose=False
+    def run(self, seeded=False, verbose=True, n_jobs=1, chunk_size=8, resume=False):
+        """
+        Run Monte Carlo backtest across multiple simulations.
+
+        Parameters
+        ----------
+        seeded : bool
+            If True, run ``k`` is fitted with a deterministic seed so results are
+            reproducible (and identical between serial and parallel execution).
+            Otherwise seeds are drawn from fresh entropy (see
+            ``_random_states``) and recorded in ``seed_records``.
+        verbose : bool
+            Log progress after each accepted run.
+        n_jobs : int
+            Number of worker processes. ``1`` runs serially in-process,
+            ``-1`` uses every available core.
+        chunk_size : int
+            Number of consecutive seeds fitted and then decoded together as
+            one ``HMMEnsemble``; in parallel runs, the seeds of a worker task.
+        resume : bool
+            Replay the seeds stored in ``checkpoint_dir`` and only evaluate the
+            remaining ones. Without it, an existing checkpoint is an error.
+        """
+        n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        self._entropy = None if seeded else np.random.SeedSequence().entropy
+        backtester = Backtester()
+        logret = self.test_df["logret"].values
+        # Zero-run batch: benchmark equity and the rows kept by the backtest
+        benchmark = backtester.backtest_batch(np.zeros((0, len(logret))), logret)
+        self._aggregator = EquityAggregator(
+            int(benchmark["valid"].sum()),
+            quantiles=self.quantiles,
+            exact_paths=self.exact_paths,
+            spill_path=self.spill_path,
+            max_paths=self.runs,
+        )
+        if self.checkpoint_dir:
+            self._restore_checkpoint(seeded, resume, verbose)
+        try:
+            if n_jobs == 1:
+                self._run_serial(seeded, verbose, max(1, chunk_size))
+            else:
+                self._run_parallel(seeded, verbose, n_jobs, max(1, chunk_size))
+        finally:
+            self._save_checkpoint()
+        self._flush()
+        self.paths_equity = self._aggregator.paths
+        if verbose:
+            logger.info(
+                f"Accepted {len(self.returns)} runs out of {len(self.seed_records)} "
+                f"seeds (waste ratio: {self.waste_ratio():.1%})."
+            )
+
+        avg_df = self.test_df.loc[benchmark["valid"], ["Close", "Open", "High", "Low"]]
+        avg_df.insert(0, "hodl_equity", benchmark["hodl_equity"])
+        avg_df.insert(
+            0,
+            "average_equity",
+            self._aggregator.mean if self._aggregator.count else np.nan,
+        )
+        avg_df["std_equity"] = self._aggregator.std
+        bands = self._aggregator.quantiles(self.quantiles)
+        for q, band in zip(self.quantiles, bands):
+            avg_df[f"p{round(q * 100)}_equity"] = band
+        avg_df["outperforming"] = avg_df["average_equity"] > avg_df["hodl_equity"]
+        self.benchmark_return = float(
+            benchmark["hodl_equity"][-1] / benchmark["hodl_equity"][0] - 1
+        )
+        self.distribution = ReturnDistribution(
+            self.returns, n_bootstrap=self.n_bootstrap
+        )
+        self.sf = self.distribution.sf
+        self.pdf = self.distribution.pdf
+        self.cdf = self.distribution.cdf
+
+        return self.returns, self.sharpes, self.drawdowns, self.trades, avg_df
+
+    def _flush(self):
+        """Backtest the buffered signal paths in one batch and fold them in."""
+        if not self._pending_signals:
+            return
+        batch = Backtester().backtest_batch(
+            np.vstack(self._pending_signals), self.test_df["logret"].values
+        )
+        self.returns.extend(batch["total_return"].tolist())
+        self.sharpes.extend(batch["annualized_sharpe"].tolist())
+        self.drawdowns.extend(batch["max_drawdown"].tolist())
+        self.trades.extend(batch["number_of_trades"].tolist())
+        self._aggregator.update(batch["strategy_equity"])
+        self._pending_signals = []
+
+    def _checkpoint_meta(self, seeded):
+        """Settings a checkpoint must share with the study resuming it."""
+        return {
+            "n_states": self.n_states,
+            "init": self.init,
+            "early_stopping": self.early_stopping,
+            "covariance_type": self.covariance_type,
+            "dtype": str(self.dtype),
+            "seeded": seeded,
+            "n_days": len(self.test_df),
+            "test_start": str(self.test_df.index[0]),
+            "test_end": str(self.test_df.index[-1]),
+            # Content hashes, so a changed window, embargo or data cannot resume
+            "data": {
+                name: ModelRegistry.fingerprint(frame, {})
+                for name, frame in (
+                    ("features_train", self.features_train),
+                    ("features_test", self.features_test),
+                    ("test_df", self.test_df),
                 )
+            },
+        }
 
-                backtester = Backtester()
-                results = backtester.backtest(df_with_signals, verbose=False)
-                metrics = backtester.metrics(results, "strategy_equity")
-
-                self.returns.append(metrics["total_return"])
-                self.sharpes.append(metrics["annualized_sharpe"])
-                self.drawdowns.append(metrics["max_drawdown"])
-                self.trades.append(metrics["number_of_trades"])
-                self.paths_equity.append(results["strategy_equity"])
-                if verbose:
-                    logger.info(f"Run {i + 1}/{self.runs}")
-                i += 1
-
-            except Exception as e:  # noqa: F841
-                # if verbose:
-                #     logger.error(f"Error in run {i + 1} : {e}")
-                continue
-
-            finally:
-                seed += 1
-
-        if not self.paths_equity:
-            average_equity = pd.Series(
-                np.nan, index=self.test_df.index, name="average_equity"
+    def _restore_checkpoint(self, seeded, resume, verbose):
+        """Validate ``checkpoint_dir`` and replay its seeds when resuming."""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        meta_path = os.path.join(self.checkpoint_dir, "meta.json")
+        meta = self._checkpoint_meta(seeded)
+        chunks = sorted(glob.glob(os.path.join(self.checkpoint_dir, "chunk_*.npz")))
+        if chunks and not resume:
+            raise FileExistsError(
+                f"{self.checkpoint_dir} already holds a checkpoint; "
+                f"pass resume=True or use another directory."
             )
+        if chunks:
+            with open(meta_path) as f:
+                stored = json.load(f)
+            if stored != meta:
+                raise ValueError(
+                    f"Checkpoint in {self.checkpoint_dir} was written by a "
+                    f"different study: {stored} != {meta}"
+                )
         else:
-            equity_df = pd.concat(self.paths_equity, axis=1)
-            average_equity = equity_df.mean(axis=1)
-            average_equity.name = "average_equity"
-
-        avg_df = pd.DataFrame(average_equity)
-        avg_df["hodl_equity"] = results["hodl_equity"]
-        avg_df["Close"] = results["Close"]
-        avg_df["Open"] = results["Open"]
-        avg_df["High"] = results["High"]
-        avg_df["Low"] = results["Low"]
-        avg_df["outperforming"] = avg_df["average_equity"] > avg_df["hodl_equity"]
-        self.benchmark_return = backtester.metrics(results, col="hodl_equity")[
-            "total_return"
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+        for chunk in chunks:
+            for record in _read_chunk(chunk):
+                self._record(record, verbose=False, checkpoint=False)
+        if chunks and verbose:
+            logger.info(
+                f"Resumed {len(self.seed_records)} seeds "
+                f"({len(self.fit_stats)} accepted runs) from {self.checkpoint_dir}."
+            )
+
+    def _save_checkpoint(self):
+        """Write the seeds completed since the last checkpoint as a new chunk."""
+        if not self.checkpoint_dir or not self._unsaved_records:
+            return
+        first_seed = self._unsaved_records[0]["seed"]
+        path = os.path.join(self.checkpoint_dir, f"chunk_{first_seed:08d}.npz")
+        _write_chunk(path, self._unsaved_records, len(self.test_df))
+        self._unsaved_records = []
+
+    def _record(self, record, verbose, checkpoint=True):
+        """Store a seed record; return True if it produced an accepted run."""
+        record = dict(record, seed=len(self.seed_records))
+        if self.checkpoint_dir and checkpoint:
+            self._unsaved_records.append(record)
+            if len(self._unsaved_records) >= self.checkpoint_every:
+                self._save_checkpoint()
+        record = dict(record)
+        signal = record.pop("signal", None)
+        self.seed_records.append(record)
+        if record["status"] == "converged":
+            self._pending_signals.append(signal)
+            self.fit_stats.append(
+                {"n_iter": record["n_iter"], "wall_time": record["fit_time"]}
+            )
+            if len(self._pending_signals) >= self.batch_size:
+                self._flush()
+            if verbose:
+                logger.info(f"Run {len(self.fit_stats)}/{self.runs}")
+            return True
+
+        if record["status"] == "errored":
+            logger.warning(f"Seed {record['seed']} errored: {record['reason']}")
+        n_rejected = len(self.seed_records) - len(self.fit_stats)
+        if n_rejected >= self.max_rejections:
+            raise RuntimeError(
+                f"Gave up after {n_rejected} rejected seeds "
+                f"({len(self.fit_stats)}/{self.runs} runs accepted)."
+            )
+        return False
+
+    def _random_states(self, seeds):
+        """
+        ``random_state`` of every seed index in ``seeds``.
+
+        Seeded studies use the index itself. Unseeded ones derive a state per
+        index from the entropy drawn at the start of ``run``: leaving it to
+        ``None`` would make hmmlearn draw from the global NumPy RNG, which
+        every forked worker inherits in the same state, so workers would fit
+        identical models.
+        """
+        if self._entropy is None:
+            return list(seeds)
+        return [
+            int(
+                np.random.SeedSequence(self._entropy, spawn_key=(s,)).generate_state(1)[
+                    0
+                ]
+            )
+            for s in seeds
         ]
-        pdf = gaussian_kde(self.returns)
 
-        def cdf(x):
-            return pdf.integrate_box_1d(-np.inf, x)
+    def _run_serial(self, seeded, verbose, chunk_size):
+        """
+        Evaluate seeds in-process, ``chunk_size`` at a time.
 
-        def sf(x):
-            return 1 - cdf(x)
+        A batch never holds more seeds than runs still missing, so no fit is
+        wasted compared with evaluating the seeds one by one.
+        """
+        i = len(self.fit_stats)
+        seed = len(self.seed_records)
+        while i < self.runs:
+            batch = range(seed, seed + min(chunk_size, self.runs - i))
+            records = _evaluate_seeds(
+                self.features_train,
+                self.features_test,
+                self.test_df,
+                self.n_states,
+                self.init,
+                self.early_stopping,
+                self.covariance_type,
+                self.dtype,
+                self._random_states(batch),
+            )
+            for record in records:
+                i += self._record(record, verbose)
+            seed += len(batch)
 
-        self.sf = sf
-        self.pdf = pdf
-        self.cdf = cdf
+    def _run_parallel(self, seeded, verbose, n_jobs, chunk_size):
+        """
+        Fan seed batches out over a process pool.
 
-        return self.returns, self.sharpes, self.drawdowns, self.trades, avg_df
+        Seeds are dispatched in waves of ``n_jobs * chunk_size`` consecutive
+        values and outcomes are consumed in seed order, so the accepted runs are
+        exactly those the serial loop would have produced.
+        """
+        i = len(self.fit_stats)
+        seed = len(self.seed_records)
+        with SharedFrames() as shared, ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(
+                shared.share(self.features_train),
+                shared.share(self.features_test),
+                shared.share(self.test_df),
+                self.n_states,
+                self.init,
+                self.early_stopping,
+                self.covariance_type,
+                self.dtype,
+            ),
+        ) as executor:
+            while i < self.runs:
+                batches = []
+                for _ in range(n_jobs):
+                    batch = range(seed, seed + chunk_size)
+                    batches.append(self._random_states(batch))
+                    seed += chunk_size
+                for records in executor.map(_run_seed_batch, batches):
+                    for record in records:
+                        if i >= self.runs:
+                            break
+                        i += self._record(record, verbose)
+
+    def seed_report(self) -> pd.DataFrame:
+        """Per-seed outcome (converged, aborted, errored) with its fit cost."""
+        return pd.DataFrame(self.seed_records).set_index("seed")
+
+    def waste_ratio(self) -> float:
+        """Share of EM iterations spent on seeds that did not yield a run."""
+        report = self.seed_report()
+        total = report["n_iter"].sum()
+        if not total:
+            return 0.0
+        return float(
+            report.loc[report["status"] != "converged", "n_iter"].sum() / total
+        )
 
     def probability_outperformance(self, mult=1):
         """
@@ -148,16 +606,32 @@ class MCBacktester:
 
         Parameters
         ----------
-        mult : float
-            Multiplier for benchmark return to define outperformance threshold.
+        mult : float or array-like
+            Multiplier(s) for benchmark return to define outperformance
+            threshold(s).
 
         Returns
         -------
-        prob : float
-            Probability of outperforming benchmark.
+        prob : float or np.ndarray
+            Probability of outperforming benchmark, shaped like ``mult``.
         """
 
-        return self.sf(mult * self.benchmark_return)
+        return self.sf(np.asarray(mult) * self.benchmark_return)
+
+    def outperformance_interval(self, mult=1):
+        """Bootstrap confidence interval of ``probability_outperformance``."""
+        return self.distribution.sf_interval(np.asarray(mult) * self.benchmark_return)
+
+    def fit_statistics(self):
+        """EM iterations and fit wall time over the accepted runs."""
+        n_iter = [stats["n_iter"] for stats in self.fit_stats]
+        wall_time = [stats["wall_time"] for stats in self.fit_stats]
+        return {
+            "average_em_iterations": np.mean(n_iter),
+            "total_em_iterations": int(np.sum(n_iter)),
+            "average_fit_time": np.mean(wall_time),
+            "total_fit_time": np.sum(wall_time),
+        }
 
     def summary_statistics(self):
         """Compute mean and stddev of returns, sharpe ratios, and drawdowns."""
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+import joblib
+import pandas as pd
+
+from .config import MODEL_DIR
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump whenever the artifact layout changes; older artifacts are then ignored.
+ARTIFACT_VERSION = 1
+
+
+class ModelRegistry:
+    """
+    On-disk store of fitted HMM artifacts keyed by a data + config fingerprint.
+
+    Each artifact holds the fitted ``GaussianHMM``, its ``StandardScaler``, the
+    per-state mean next-day returns and the feature/model configuration it was
+    trained with, under ``<root>/<fingerprint>/``.
+    """
+
+    def __init__(self, root: str = MODEL_DIR):
+        self.root = root
+
+    @staticmethod
+    def fingerprint(features: pd.DataFrame, config: dict) -> str:
+        """
+        Content hash of the training window and the configuration used to fit it.
+
+        Parameters
+        ----------
+        features : pd.DataFrame
+            Training feature matrix (values, index and column names are hashed).
+        config : dict
+            JSON-serializable model and feature configuration.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the artifact.
+        """
+        digest = hashlib.sha256()
+        digest.update(str(ARTIFACT_VERSION).encode())
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+        digest.update(json.dumps(list(map(str, features.columns))).encode())
+        digest.update(pd.util.hash_pandas_object(features, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key, "artifact.joblib")
+
+    def save(self, key: str, model, scaler, state_stats, config: dict) -> str:
+        """Persist an artifact under ``key`` and return its path."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        artifact = {
+            "version": ARTIFACT_VERSION,
+            "fingerprint": key,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "model": model,
+            "scaler": scaler,
+            "state_stats": state_stats,
+            "config": config,
+        }
+        # Write to a temporary file first so readers never see a partial artifact
+        tmp_path = f"{path}.tmp"
+        joblib.dump(artifact, tmp_path)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved model artifact {key[:12]} to {path}")
+        return path
+
+    def load(self, key: str):
+        """Return the artifact stored under ``key``, or ``None`` if absent or stale."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        artifact = joblib.load(path)
+        if artifact.get("version") != ARTIFACT_VERSION:
+            logger.warning(
+                f"Ignoring artifact {key[:12]} with version {artifact.get('version')}"
+            )
+            return None
+        return artifact
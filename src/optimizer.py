@@ -1,6 +1,11 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
-from .config import SEED
+from .config import SEED, COVARIANCE_TYPE, HMM_DTYPE
 from .hmm_model import HMMModel
+from .shared_frames import SharedFrames
 from .backtester import Backtester
 import plotly.graph_objects as go
 from utils.logger import get_logger
@@ -8,66 +13,279 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Inputs shared by every task of a worker process, set once by ``_init_worker``.
+_WORKER_INPUTS = {}
+
+
+def _calculate_objective(strategy_ret: np.ndarray, ret: np.ndarray):
+    """
+    Calculates a custom objective score.
+    Rewards outperforming returns and penalizes underperforming returns.
+    """
+    daily_performance_diff = strategy_ret - ret
+    outperforming_returns = daily_performance_diff[daily_performance_diff > 0].sum()
+    underperforming_returns = daily_performance_diff[daily_performance_diff < 0].sum()
+
+    objective_score = outperforming_returns**2 - underperforming_returns**2
+    return -1 * objective_score
+
+
+def _score_fit(df_features, features, hmm_model, warm_start=None):
+    """Fit ``hmm_model``, then signal and backtest it; returns the objective."""
+    hidden_states = hmm_model.fit(features, verbose=False, warm_start=warm_start)
+
+    ret = df_features["ret"].values
+    signal, _ = hmm_model.signal_path(hidden_states, ret)
+
+    backtester = Backtester()
+    arrays = backtester.backtest_arrays(signal, df_features["logret"].values)
+    return _calculate_objective(arrays["strategy_ret"], ret[arrays["valid"]])
+
+
+def _evaluate_candidate(
+    df_features,
+    features,
+    n_states,
+    seed,
+    n_iter,
+    init,
+    covariance_type=COVARIANCE_TYPE,
+    dtype=HMM_DTYPE,
+):
+    """
+    Fit, signal and backtest a single (n_states, seed) candidate.
+
+    Returns the objective score and the fit statistics of the HMM.
+    """
+    hmm_model = HMMModel(
+        n_states=n_states,
+        random_state=seed,
+        n_iter=n_iter,
+        init=init,
+        covariance_type=covariance_type,
+        dtype=dtype,
+    )
+    score = _score_fit(df_features, features, hmm_model)
+    return score, dict(hmm_model.fit_stats_, warm_start=False)
+
+
+def _evaluate_chain(
+    df_features,
+    features,
+    candidates,
+    seed,
+    n_iter,
+    init,
+    covariance_type=COVARIANCE_TYPE,
+    dtype=HMM_DTYPE,
+):
+    """
+    Fit the (sorted) ``candidates`` of one seed, K -> K+1.
+
+    Every candidate following a fit with one state fewer is warm started from
+    it (``HMMModel.fit`` splits its widest state); the others are fitted cold.
+    Returns one ``(score, fit_stats)`` pair per candidate.
+    """
+    outcomes, previous = [], None
+    for n_states in candidates:
+        hmm_model = HMMModel(
+            n_states=n_states,
+            random_state=seed,
+            n_iter=n_iter,
+            init=init,
+            covariance_type=covariance_type,
+            dtype=dtype,
+        )
+        warm_start = (
+            previous
+            if previous is not None and previous.n_states == n_states - 1
+            else None
+        )
+        score = _score_fit(df_features, features, hmm_model, warm_start)
+        outcomes.append(
+            (score, dict(hmm_model.fit_stats_, warm_start=warm_start is not None))
+        )
+        previous = hmm_model
+    return outcomes
+
+
+def _init_worker(df_features, features):
+    _WORKER_INPUTS.update(df_features=df_features.attach(), features=features.attach())
+
+
+def _evaluate_task(task):
+    return _evaluate_candidate(**_WORKER_INPUTS, **task)
+
+
+def _evaluate_chain_task(task):
+    return _evaluate_chain(**_WORKER_INPUTS, **task)
+
+
 class HMMStateOptimizer:
-    def __init__(self, states_range: range, random_state: int = SEED):
+    def __init__(
+        self,
+        states_range: range,
+        random_state: int = SEED,
+        n_seeds: int = 1,
+        n_iter: int = 500,
+        init: str = "default",
+        covariance_type: str = COVARIANCE_TYPE,
+        dtype: str = HMM_DTYPE,
+        warm_start: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        warm_start : bool
+            Fit each candidate K from the same seed's fit of K - 1 states
+            (see ``_evaluate_chain``) instead of from scratch. The smallest
+            candidate, and any candidate whose K - 1 was not evaluated in the
+            same round, is fitted cold. Opt-in: warm-started fits can settle
+            in other optima, so the selected K may differ from a cold sweep,
+            and each seed's chain runs in one process, so fewer seeds than
+            ``n_jobs`` leave workers idle.
+        """
         self.states_range = states_range
         self.random_state = random_state
+        self.n_seeds = n_seeds
+        self.n_iter = n_iter
+        self.init = init
+        self.covariance_type = covariance_type
+        self.dtype = dtype
+        self.warm_start = warm_start
         self.__optimization_results_ = None
 
-    def run_optimization(self, df_features, features, verbose=False):
+    def _budgets(self, halving_rounds, eta):
+        """EM iteration budget per successive-halving round, ending at ``n_iter``."""
+        return [
+            max(1, self.n_iter // eta ** (halving_rounds - 1 - r))
+            for r in range(halving_rounds)
+        ]
+
+    def run_optimization(
+        self,
+        df_features,
+        features,
+        verbose=False,
+        n_jobs=1,
+        halving_rounds=1,
+        eta=2,
+    ):
         """
         Runs the optimization process to find the best number of HMM states.
+
+        Each candidate is scored as the mean objective over ``n_seeds`` seeds.
+        With ``halving_rounds > 1`` candidates are first fitted on a reduced EM
+        budget and only the best ``1 / eta`` fraction advances to the next round,
+        whose budget is ``eta`` times larger; the last round uses ``n_iter``.
+        Fits are dispatched over ``n_jobs`` processes (``-1`` for all cores).
+        The results table reports the mean EM iterations to convergence, the
+        total fit wall time and whether the fits were warm started, for each
+        candidate's last round. With ``warm_start`` each task is the K -> K+1
+        chain of one seed, so parallelism is over seeds.
         """
         logger.info("Optimizing for Number of States...")
-        results = []
-
-        def calculate_objective(df: pd.DataFrame):
-            """
-            Calculates a custom objective score.
-            Rewards outperforming returns and penalizes underperforming returns.
-            """
-            daily_performance_diff = df["strategy_ret"] - df["ret"]
-            outperforming_returns = daily_performance_diff[
-                daily_performance_diff > 0
-            ].sum()
-            underperforming_returns = daily_performance_diff[
-                daily_performance_diff < 0
-            ].sum()
-
-            objective_score = outperforming_returns**2 - underperforming_returns**2
-            return -1 * objective_score
-
-        for n_states in self.states_range:
-            if verbose:
-                print(f"Testing {n_states} states...")
-
-            # 3. Fit HMM
-            hmm_model = HMMModel(n_states=n_states, random_state=self.random_state)
-            hidden_states = hmm_model.fit(features, verbose=False)
-
-            # 4. Generate Signals
-            df_with_signals, _ = hmm_model.regime_to_signal(
-                df_features.copy(), hidden_states, verbose=False
+        n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        seeds = [self.random_state + k for k in range(self.n_seeds)]
+        if self.random_state is None:
+            seeds = [None] * self.n_seeds
+
+        executor = None
+        shared = None
+        if n_jobs > 1:
+            shared = SharedFrames()
+            executor = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(shared.share(df_features), shared.share(features)),
             )
 
-            # 5. Backtest
-            backtester = Backtester()
-            backtest_results = backtester.backtest(df_with_signals, verbose=False)
+        reached = {}
+        candidates = list(self.states_range)
+        budgets = self._budgets(max(1, halving_rounds), eta)
+        try:
+            for round_idx, n_iter in enumerate(budgets):
+                if verbose:
+                    print(
+                        f"Round {round_idx + 1}/{len(budgets)}: testing "
+                        f"{len(candidates)} candidates with n_iter={n_iter}..."
+                    )
+                settings = {
+                    "n_iter": n_iter,
+                    "init": self.init,
+                    "covariance_type": self.covariance_type,
+                    "dtype": self.dtype,
+                }
+                if self.warm_start:
+                    tasks = [
+                        dict(settings, candidates=candidates, seed=seed)
+                        for seed in seeds
+                    ]
+                    evaluate, evaluate_task = _evaluate_chain, _evaluate_chain_task
+                else:
+                    tasks = [
+                        dict(settings, n_states=n_states, seed=seed)
+                        for n_states in candidates
+                        for seed in seeds
+                    ]
+                    evaluate, evaluate_task = _evaluate_candidate, _evaluate_task
+                if executor is None:
+                    outcomes = [
+                        evaluate(df_features, features, **task) for task in tasks
+                    ]
+                else:
+                    outcomes = list(executor.map(evaluate_task, tasks))
+                if self.warm_start:
+                    # One chain per seed -> candidate-major like the cold tasks
+                    outcomes = [
+                        chain[k] for k in range(len(candidates)) for chain in outcomes
+                    ]
 
-            # 6. Calculate objective score
-            score = calculate_objective(backtest_results)
+                round_scores = {}
+                for k, n_states in enumerate(candidates):
+                    seed_outcomes = outcomes[k * len(seeds) : (k + 1) * len(seeds)]
+                    seed_scores, seed_stats = zip(*seed_outcomes)
+                    round_scores[n_states] = float(np.mean(seed_scores))
+                    em_iters = [stats["n_iter"] for stats in seed_stats]
+                    fit_times = [stats["wall_time"] for stats in seed_stats]
+                    reached[n_states] = {
+                        "n_states": n_states,
+                        "score": round_scores[n_states],
+                        "n_iter": n_iter,
+                        "em_iter": float(np.mean(em_iters)),
+                        "fit_time": float(np.sum(fit_times)),
+                        "warm_start": any(stats["warm_start"] for stats in seed_stats),
+                    }
+                    if verbose:
+                        print(
+                            f"  {n_states} states score: {round_scores[n_states]:.4f}"
+                        )
 
-            results.append({"n_states": n_states, "score": score})
-            if verbose:
-                print(f"  Score: {score:.4f}")
+                if round_idx < len(budgets) - 1:
+                    keep = max(1, len(candidates) // eta)
+                    candidates = sorted(candidates, key=round_scores.get)[:keep]
+                    candidates.sort()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+                shared.close()
 
-        # Find the best result
-        best_result = min(results, key=lambda x: x["score"])
+        results = [reached[n_states] for n_states in self.states_range]
+        # Find the best result among the candidates that survived every round
+        best_result = min(
+            (reached[n_states] for n_states in candidates), key=lambda x: x["score"]
+        )
         if verbose:
             logger.info(
                 f"Best number of states: {best_result['n_states']} with score {best_result['score']:.4f}"
             )
         self.__optimization_results_ = pd.DataFrame(results)
+        if verbose:
+            logger.info(
+                f"Last-round fits: {self.__optimization_results_['em_iter'].sum():.0f} "
+                f"mean EM iterations, {self.__optimization_results_['fit_time'].sum():.2f}s "
+                f"({'warm' if self.warm_start else 'cold'} started)."
+            )
 
         return best_result["n_states"], best_result["score"]
 
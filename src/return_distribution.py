@@ -0,0 +1,104 @@
+import numpy as np
+from scipy.stats import gaussian_kde
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReturnDistribution:
+    """
+    Empirical distribution of Monte Carlo total returns.
+
+    Built once from the accepted runs: values are sorted so ``cdf``/``sf`` are
+    binary searches, every query accepts a scalar or an array of thresholds,
+    and bootstrap confidence intervals are read from precomputed resample
+    weights. Unlike a KDE it stays valid when the returns are degenerate
+    (e.g. every run ends flat).
+    """
+
+    def __init__(
+        self,
+        values,
+        n_bootstrap: int = 1000,
+        confidence: float = 0.95,
+        random_state: int = 0,
+    ):
+        """
+        Parameters
+        ----------
+        values : array-like
+            Observed total returns, one per run.
+        n_bootstrap : int
+            Number of bootstrap resamples behind ``sf_interval`` (0 disables).
+        confidence : float
+            Coverage of the bootstrap confidence intervals.
+        random_state : int
+            Seed of the bootstrap resampling.
+        """
+        self.values = np.sort(np.asarray(values, dtype=float))
+        self.n = len(self.values)
+        self.confidence = confidence
+        self._kde = None
+
+        # Resample r draws value k weights[r, k] times; the cumulative counts
+        # in sorted order turn any threshold into a single column lookup.
+        self._cum_weights = None
+        if n_bootstrap and self.n:
+            rng = np.random.default_rng(random_state)
+            weights = rng.multinomial(self.n, np.full(self.n, 1 / self.n), n_bootstrap)
+            self._cum_weights = np.zeros((n_bootstrap, self.n + 1), dtype=np.int32)
+            np.cumsum(weights, axis=1, out=self._cum_weights[:, 1:])
+
+    def _rank(self, x):
+        """Number of observations <= x, for a scalar or array of thresholds."""
+        return np.searchsorted(self.values, x, side="right")
+
+    def _as_output(self, x, prob):
+        return float(prob) if np.ndim(x) == 0 else prob
+
+    def cdf(self, x):
+        """P(return <= x)."""
+        if not self.n:
+            return self._as_output(x, np.full(np.shape(x), np.nan))
+        return self._as_output(x, self._rank(x) / self.n)
+
+    def sf(self, x):
+        """P(return > x)."""
+        if not self.n:
+            return self._as_output(x, np.full(np.shape(x), np.nan))
+        return self._as_output(x, 1 - self._rank(x) / self.n)
+
+    def sf_interval(self, x):
+        """
+        Bootstrap confidence interval of ``sf(x)``.
+
+        Returns
+        -------
+        low, high : float or np.ndarray
+            Percentile bounds at ``confidence`` coverage, shaped like ``x``.
+        """
+        if self._cum_weights is None:
+            nan = self._as_output(x, np.full(np.shape(x), np.nan))
+            return nan, nan
+        boot_sf = 1 - self._cum_weights[:, self._rank(x)] / self.n
+        alpha = (1 - self.confidence) / 2
+        low, high = np.quantile(boot_sf, [alpha, 1 - alpha], axis=0)
+        return self._as_output(x, low), self._as_output(x, high)
+
+    def quantile(self, q):
+        """Empirical quantile(s) of the returns."""
+        return np.quantile(self.values, q)
+
+    def pdf(self, x):
+        """
+        Gaussian KDE density, built on first use for plotting.
+
+        Degenerate samples (fewer than two distinct returns) have no KDE; the
+        density is then reported as zero.
+        """
+        if self._kde is None:
+            if len(np.unique(self.values)) < 2:
+                logger.warning("Returns are degenerate; KDE density is unavailable.")
+                return np.zeros(np.shape(x))
+            self._kde = gaussian_kde(self.values)
+        return self._kde(x)
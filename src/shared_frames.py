@@ -0,0 +1,104 @@
+import os
+import tempfile
+import uuid
+
+import numpy as np
+import pandas as pd
+
+
+class FrameHandle:
+    """
+    Picklable reference to a DataFrame published by ``SharedFrames``.
+
+    Pickling a handle costs a few hundred bytes whatever the length of the
+    frame; ``attach`` maps the published arrays read-only, so every process
+    attaching the same handle shares one copy through the page cache.
+    """
+
+    def __init__(self, values_path, columns, index_path, index, index_tz, freq, name):
+        self.values_path = values_path
+        self.columns = columns
+        self.index_path = index_path
+        self.index = index
+        self.index_tz = index_tz
+        self.freq = freq
+        self.name = name
+
+    def attach(self) -> pd.DataFrame:
+        """Read-only DataFrame view over the memory-mapped arrays."""
+        values = np.load(self.values_path, mmap_mode="r")
+        if self.index_path is None:
+            index = self.index
+        else:
+            index = pd.Index(np.load(self.index_path, mmap_mode="r"), copy=False)
+            if self.index_tz is not None:
+                index = index.tz_localize("UTC").tz_convert(self.index_tz)
+            if self.freq is not None:
+                index = pd.DatetimeIndex(index, freq=self.freq)
+        index.name = self.name
+        return pd.DataFrame(values, index=index, columns=self.columns, copy=False)
+
+
+class SharedFrames:
+    """
+    Publishes DataFrames once as memory-mapped ``.npy`` files for workers.
+
+    Used as a context manager around a process pool: frames are written with
+    ``share`` before the pool starts, workers receive the small handles (e.g.
+    as initializer arguments) and attach zero-copy views, and the files are
+    removed on exit. Values are stored column-major so each column is
+    contiguous, as in a pandas block.
+    """
+
+    def __init__(self, root: str = None):
+        """
+        Parameters
+        ----------
+        root : str, optional
+            Directory receiving the temporary files (system default if omitted).
+        """
+        self._tmpdir = tempfile.TemporaryDirectory(
+            prefix="shared_frames_", dir=root, ignore_cleanup_errors=True
+        )
+
+    def share(self, df: pd.DataFrame) -> FrameHandle:
+        """
+        Write ``df`` to the shared store and return its handle.
+
+        Every column must be numeric; they are stored with their common dtype.
+        """
+        values = df.to_numpy()
+        if values.dtype == object:
+            raise ValueError("Only frames with numeric columns can be shared.")
+        key = uuid.uuid4().hex
+        values_path = os.path.join(self._tmpdir.name, f"{key}_values.npy")
+        np.save(values_path, np.asfortranarray(values))
+
+        index = df.index
+        index_tz = getattr(index, "tz", None)
+        index_path = None
+        if index_tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        if isinstance(index.dtype, np.dtype) and index.dtype.kind in "biufM":
+            index_path = os.path.join(self._tmpdir.name, f"{key}_index.npy")
+            np.save(index_path, index.to_numpy())
+            index = None
+        return FrameHandle(
+            values_path,
+            df.columns,
+            index_path,
+            index,
+            None if index_tz is None else str(index_tz),
+            getattr(df.index, "freqstr", None),
+            df.index.name,
+        )
+
+    def close(self):
+        """Remove the published files."""
+        self._tmpdir.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
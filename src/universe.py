@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from .backtester import Backtester
+from .config import N_STATES, SEED, TRAIN_END_DATE
+from .data_loader import DataLoader
+from .feature_engineering import FeatureEngineer
+from .hmm_model import HMMModel
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _run_ticker(ticker, raw_data, n_states, split_date, random_state):
+    """Featurize, fit, signal and backtest one ticker; never raises."""
+    row = {"ticker": ticker, "status": "ok", "error": None}
+    try:
+        feature_engineer = FeatureEngineer()
+        df, features = feature_engineer.build_features(raw_data)
+        _, test_df, features_train, features_test = (
+            feature_engineer.split_data_into_train_test(df, features, split_date)
+        )
+
+        hmm_model = HMMModel(n_states=n_states, random_state=random_state)
+        hmm_model.fit(features_train, verbose=False)
+        hidden_states = hmm_model.predict(features_test, verbose=False)
+        df_with_signals, _ = hmm_model.regime_to_signal(
+            test_df, hidden_states, verbose=False
+        )
+
+        backtester = Backtester()
+        arrays = backtester.backtest_arrays(
+            df_with_signals["signal"].values, df_with_signals["logret"].values
+        )
+        strategy = backtester.metrics_arrays(arrays, "strategy_equity")
+        hodl = backtester.metrics_arrays(arrays, "hodl_equity")
+        row.update(
+            n_bars=len(df),
+            **strategy,
+            hodl_total_return=hodl["total_return"],
+            hodl_annualized_sharpe=hodl["annualized_sharpe"],
+            hodl_max_drawdown=hodl["max_drawdown"],
+            latest_state=int(hidden_states[-1]),
+            latest_signal=int(df_with_signals["signal"].iloc[-1]),
+        )
+    except Exception as e:
+        row.update(status="error", error=f"{type(e).__name__}: {e}")
+    return row
+
+
+class UniverseRunner:
+    """
+    Regime scan over a universe of tickers.
+
+    Data for every ticker is fetched on a shared thread pool (I/O bound), then
+    feature engineering, HMM fitting and backtesting run on a shared process
+    pool (CPU bound). A failing ticker is reported in the results table instead
+    of aborting the scan.
+    """
+
+    def __init__(
+        self,
+        tickers: list,
+        n_states: int = N_STATES,
+        split_date: str = TRAIN_END_DATE,
+        random_state: int = SEED,
+        n_jobs: int = -1,
+        io_workers: int = 8,
+    ):
+        self.tickers = list(tickers)
+        self.n_states = n_states
+        self.split_date = split_date
+        self.random_state = random_state
+        self.n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        self.io_workers = io_workers
+        self.results = None
+
+    def load(self, focus="expansion") -> dict:
+        """Fetch raw OHLCV data for every ticker; failed downloads are skipped."""
+
+        def fetch(ticker):
+            try:
+                return DataLoader(ticker=ticker).get_data(focus)
+            except Exception as e:
+                logger.error(f"Failed to load {ticker}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.io_workers) as executor:
+            frames = dict(zip(self.tickers, executor.map(fetch, self.tickers)))
+        return {ticker: df for ticker, df in frames.items() if df is not None}
+
+    def run(self, data: dict = None, focus="expansion") -> pd.DataFrame:
+        """
+        Run the scan and return one row of metrics per ticker.
+
+        Parameters
+        ----------
+        data : dict, optional
+            Preloaded ``{ticker: raw OHLCV frame}``; fetched with ``load`` if
+            omitted.
+        focus : str
+            ``DataLoader.get_data`` mode used when fetching.
+        """
+        data = self.load(focus) if data is None else data
+        logger.info(f"Running regime scan over {len(data)} tickers...")
+        args = [
+            (ticker, raw_data, self.n_states, self.split_date, self.random_state)
+            for ticker, raw_data in data.items()
+        ]
+        if self.n_jobs == 1:
+            rows = [_run_ticker(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                rows = list(executor.map(_run_ticker, *zip(*args)))
+
+        missing = [ticker for ticker in self.tickers if ticker not in data]
+        rows += [
+            {"ticker": ticker, "status": "error", "error": "no data"}
+            for ticker in missing
+        ]
+        self.results = pd.DataFrame(rows).set_index("ticker")
+        n_failed = int((self.results["status"] != "ok").sum())
+        logger.info(f"Regime scan complete ({n_failed} failed).")
+        return self.results
@@ -0,0 +1,232 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .backtester import Backtester
+from .config import (
+    EMBARGO_PERIOD,
+    INCLUDE_SHORTING,
+    N_STATES,
+    SEED,
+    WF_TEST_DAYS,
+    WF_TRAIN_DAYS,
+)
+from .feature_engineering import FeatureEngineer
+from .hmm_model import HMMModel, state_signal_table
+from .shared_frames import SharedFrames
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Frames shared by every fold of a worker process, attached once by
+# ``_init_worker`` from the memory-mapped copies published by ``SharedFrames``
+_WORKER_INPUTS = {}
+
+
+def walk_forward_folds(
+    n_bars: int,
+    train_size: int = WF_TRAIN_DAYS,
+    test_size: int = WF_TEST_DAYS,
+    embargo: int = EMBARGO_PERIOD,
+    expanding: bool = False,
+) -> list:
+    """
+    Positional train/test folds for walk-forward evaluation.
+
+    Test windows are consecutive and non-overlapping, so their out-of-sample
+    signals stitch into one continuous path. Each training window ends
+    ``embargo`` bars before its test window and spans the previous
+    ``train_size`` bars (rolling) or every bar since the start (expanding).
+
+    Returns
+    -------
+    list of dict
+        ``fold``, ``train_start``, ``train_end``, ``test_start``, ``test_end``
+        (half-open positional bounds).
+    """
+    folds = []
+    test_start = train_size + embargo
+    while test_start < n_bars:
+        train_end = test_start - embargo
+        folds.append(
+            {
+                "fold": len(folds),
+                "train_start": 0 if expanding else train_end - train_size,
+                "train_end": train_end,
+                "test_start": test_start,
+                "test_end": min(test_start + test_size, n_bars),
+            }
+        )
+        test_start += test_size
+    return folds
+
+
+def _fit_fold(df, features, fold, n_states, random_state, include_shorting):
+    """
+    Fit one fold and derive its out-of-sample states and signals.
+
+    States are mapped to signals with the mean next-day return of each state
+    over the training window, so the test window never informs its own
+    signals. States never visited in training stay flat.
+    """
+    train = slice(fold["train_start"], fold["train_end"])
+    test = slice(fold["test_start"], fold["test_end"])
+    hmm_model = HMMModel(n_states=n_states, random_state=random_state)
+    train_states = hmm_model.fit(features.iloc[train], verbose=False)
+    table, _, _ = state_signal_table(
+        train_states, df["ret"].values[train], n_states, include_shorting
+    )
+    states = hmm_model.predict(features.iloc[test], verbose=False)
+    return dict(
+        fold,
+        states=states,
+        signal=np.take(table.astype(np.int64), states),
+        n_iter=hmm_model.fit_stats_["n_iter"],
+        converged=hmm_model.fit_stats_["converged"],
+        fit_time=hmm_model.fit_stats_["wall_time"],
+    )
+
+
+def _init_worker(df, features, n_states, random_state, include_shorting):
+    _WORKER_INPUTS.update(
+        df=df.attach(),
+        features=features.attach(),
+        n_states=n_states,
+        random_state=random_state,
+        include_shorting=include_shorting,
+    )
+
+
+def _run_fold(fold):
+    """Worker task: fit one fold against the shared frames."""
+    return _fit_fold(fold=fold, **_WORKER_INPUTS)
+
+
+class WalkForward:
+    """
+    Walk-forward retraining engine.
+
+    Features are computed once over the whole history and every fold slices
+    them, the HMM is refit per fold (in parallel across folds) and the
+    out-of-sample signals are stitched into one continuous backtest, which is
+    how the strategy is traded with periodic refits.
+    """
+
+    def __init__(
+        self,
+        train_size: int = WF_TRAIN_DAYS,
+        test_size: int = WF_TEST_DAYS,
+        embargo: int = EMBARGO_PERIOD,
+        expanding: bool = False,
+        n_states: int = N_STATES,
+        random_state: int = SEED,
+        include_shorting: bool = INCLUDE_SHORTING,
+        n_jobs: int = 1,
+    ):
+        self.train_size = train_size
+        self.test_size = test_size
+        self.embargo = embargo
+        self.expanding = expanding
+        self.n_states = n_states
+        self.random_state = random_state
+        self.include_shorting = include_shorting
+        self.n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        self.folds = None
+
+    def run(self, raw_data: pd.DataFrame = None, df=None, features=None, verbose=True):
+        """
+        Run every fold and backtest the stitched out-of-sample signals.
+
+        Parameters
+        ----------
+        raw_data : pd.DataFrame, optional
+            Raw OHLCV data, featurized once with ``FeatureEngineer``.
+        df, features : pd.DataFrame, optional
+            Precomputed output of ``FeatureEngineer.build_features`` (used
+            instead of ``raw_data``).
+        verbose : bool
+            Log each fold as it completes.
+
+        Returns
+        -------
+        backtest_df : pd.DataFrame
+            Backtest of the stitched path, with ``fold`` and ``state`` columns.
+        folds : pd.DataFrame
+            One row per fold: window dates and fit statistics.
+        """
+        if df is None or features is None:
+            df, features = FeatureEngineer().build_features(raw_data)
+        folds = walk_forward_folds(
+            len(df), self.train_size, self.test_size, self.embargo, self.expanding
+        )
+        if not folds:
+            raise ValueError(
+                f"{len(df)} bars are not enough for one fold "
+                f"(train {self.train_size} + embargo {self.embargo})."
+            )
+        logger.info(f"Walk-forward over {len(folds)} folds...")
+
+        if self.n_jobs == 1:
+            results = (
+                _fit_fold(
+                    df,
+                    features,
+                    fold,
+                    self.n_states,
+                    self.random_state,
+                    self.include_shorting,
+                )
+                for fold in folds
+            )
+            results = list(self._log_folds(results, verbose))
+        else:
+            with SharedFrames() as shared, ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_worker,
+                initargs=(
+                    shared.share(df),
+                    shared.share(features),
+                    self.n_states,
+                    self.random_state,
+                    self.include_shorting,
+                ),
+            ) as executor:
+                results = list(self._log_folds(executor.map(_run_fold, folds), verbose))
+
+        stitched = df.iloc[folds[0]["test_start"] :].copy()
+        stitched["fold"] = np.concatenate(
+            [np.full(r["test_end"] - r["test_start"], r["fold"]) for r in results]
+        )
+        stitched["state"] = np.concatenate([r["states"] for r in results])
+        stitched["signal"] = np.concatenate([r["signal"] for r in results])
+        backtest_df = Backtester().backtest(stitched, verbose=False)
+
+        index = df.index
+        self.folds = pd.DataFrame(
+            [
+                {
+                    "fold": r["fold"],
+                    "train_start": index[r["train_start"]],
+                    "train_end": index[r["train_end"] - 1],
+                    "test_start": index[r["test_start"]],
+                    "test_end": index[r["test_end"] - 1],
+                    "n_iter": r["n_iter"],
+                    "converged": r["converged"],
+                    "fit_time": r["fit_time"],
+                }
+                for r in results
+            ]
+        ).set_index("fold")
+        return backtest_df, self.folds
+
+    def _log_folds(self, results, verbose):
+        for result in results:
+            if verbose:
+                logger.info(
+                    f"Fold {result['fold']}: test bars "
+                    f"{result['test_start']}-{result['test_end']} fitted "
+                    f"in {result['n_iter']} EM iterations."
+                )
+            yield result
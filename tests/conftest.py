@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.hmm_model import HMMModel
+
+
+@pytest.fixture
+def make_models():
+    """Factory fitting several HMMs on the same random features."""
+
+    def make(n_models=4, n_states=3, seed=0):
+        rng = np.random.default_rng(seed)
+        features = pd.DataFrame(
+            rng.normal(size=(400, 3)).cumsum(axis=0) * 0.1 + rng.normal(size=(400, 3)),
+            columns=["ret", "vol21", "rsi"],
+        )
+        models = []
+        for random_state in range(n_models):
+            hmm_model = HMMModel(n_states=n_states, random_state=random_state)
+            hmm_model.fit(features.iloc[:300], verbose=False)
+            models.append(hmm_model)
+        return models, features
+
+    return make
+
+
+@pytest.fixture
+def make_ohlc():
+    """Factory of daily random-walk OHLC frames with log returns."""
+
+    def make(n=300, seed=0):
+        rng = np.random.default_rng(seed)
+        logret = rng.normal(0.0005, 0.02, n)
+        close = 100 * np.exp(np.cumsum(logret))
+        return pd.DataFrame(
+            {
+                "Open": close * (1 - 0.001),
+                "High": close * 1.01,
+                "Low": close * 0.99,
+                "Close": close,
+                "logret": logret,
+            },
+            index=pd.date_range(start="2023-01-01", periods=n, freq="D"),
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_feature_frame(make_ohlc):
+    """
+    Factory of featurized frames shaped like ``build_features`` output,
+    without going through pandas_ta: returns ``(df, features)``.
+    """
+
+    def make(n=200, seed=0):
+        df = make_ohlc(n, seed)
+        df["ret"] = df["logret"]
+        df["vol21"] = df["ret"].rolling(5).std() * np.sqrt(365)
+        df["rsi"] = 50 + 50 * np.tanh(df["ret"].rolling(3).mean() * 50)
+        df = df.dropna()
+        return df, df[["ret", "vol21", "rsi"]]
+
+    return make
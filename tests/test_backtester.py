@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from src.backtester import Backtester
+from src.backtester import Backtester, enforce_min_hold
 
 
 def test_transaction_costs():
@@ -56,3 +56,120 @@ def test_transaction_costs():
     # Expected return = (-1 * 0.1) - (2 * 0.02) = -0.1 - 0.04 = -0.14
     expected_ret_day5 = -0.14
     assert np.isclose(results["strategy_ret"].iloc[3], expected_ret_day5)
+
+
+def test_backtest_arrays_matches_frame():
+    """
+    Tests that the array kernel produces the same columns as the DataFrame path
+    and that metrics computed from arrays agree with the frame-based metrics.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    logret = rng.normal(0.0, 0.02, 100)
+    signal = rng.choice([-1, 0, 1], 100)
+    df = pd.DataFrame(
+        {"Close": 100 * np.exp(np.cumsum(logret)), "logret": logret, "signal": signal},
+        index=pd.date_range(start="2023-01-01", periods=100, freq="D"),
+    )
+    backtester = Backtester(min_hold_days=2)
+
+    # 2. Action
+    results = backtester.backtest(df)
+    arrays = backtester.backtest_arrays(signal, logret)
+
+    # 3. Assertions
+    for col in ["position", "trade", "strategy_ret", "strategy_equity", "hodl_equity"]:
+        np.testing.assert_array_equal(results[col].values, arrays[col])
+    frame_metrics = backtester.metrics(results)
+    array_metrics = backtester.metrics_arrays(arrays)
+    for key, value in frame_metrics.items():
+        assert np.isclose(value, array_metrics[key])
+
+
+def test_backtest_batch_matches_single_paths():
+    """
+    Tests that a batched backtest over a signal matrix reproduces the equity
+    curves and metrics of backtesting each signal path on its own.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(1)
+    logret = rng.normal(0.0, 0.02, 60)
+    signals = rng.choice([0, 1], size=(5, 60))
+    backtester = Backtester()
+
+    # 2. Action
+    batch = backtester.backtest_batch(signals, logret)
+
+    # 3. Assertions
+    assert batch["strategy_equity"].shape == (5, 60)
+    for run, signal in enumerate(signals):
+        arrays = backtester.backtest_arrays(signal, logret)
+        metrics = backtester.metrics_arrays(arrays)
+        np.testing.assert_allclose(
+            batch["strategy_equity"][run], arrays["strategy_equity"]
+        )
+        np.testing.assert_allclose(batch["hodl_equity"], arrays["hodl_equity"])
+        assert np.isclose(batch["total_return"][run], metrics["total_return"])
+        assert np.isclose(batch["annualized_sharpe"][run], metrics["annualized_sharpe"])
+        assert np.isclose(batch["max_drawdown"][run], metrics["max_drawdown"])
+        assert batch["number_of_trades"][run] == metrics["number_of_trades"]
+
+
+def test_enforce_min_hold_matches_loop():
+    """
+    Tests that the run-length min-hold filter flattens exactly the bars the
+    original per-bar loop flattened, for single paths and signal matrices.
+    """
+
+    def loop_min_hold(pos, min_hold_days):
+        pos = pos.copy()
+        last = 0
+        hold = 0
+        for i in range(len(pos)):
+            if pos[i] == last:
+                hold += 1
+            else:
+                last = pos[i]
+                hold = 1
+            if hold < min_hold_days:
+                pos[i] = 0
+        return pos
+
+    # 1. Setup
+    rng = np.random.default_rng(2)
+    positions = rng.choice([-1.0, 0.0, 1.0], size=(20, 200), p=[0.1, 0.3, 0.6])
+
+    for min_hold_days in [1, 2, 3, 5]:
+        # 2. Action
+        filtered = enforce_min_hold(positions, min_hold_days)
+
+        # 3. Assertions
+        for row, pos in enumerate(positions):
+            expected = loop_min_hold(pos, min_hold_days)
+            np.testing.assert_array_equal(filtered[row], expected)
+            np.testing.assert_array_equal(
+                enforce_min_hold(pos, min_hold_days), expected
+            )
+
+
+def test_fractional_positions():
+    """
+    Tests that fractional signals are held as fractional positions, pay costs
+    proportional to the traded size and count holding days by direction.
+    """
+    # 1. Setup
+    logret = np.log([1.0, 1.01, 1.02, 0.99, 1.01, 1.0])
+    signal = np.array([0.5, 0.75, 0.25, 0.0, -0.5, 0.0])
+    backtester = Backtester(commission=0.001, slippage=0.0)
+
+    # 2. Action
+    arrays = backtester.backtest_arrays(signal, logret)
+    held = enforce_min_hold([0.0, 0.5, 0.75, 0.25, 0.0, -0.5], 2)
+
+    # 3. Assertions
+    np.testing.assert_allclose(arrays["position"], [0.0, 0.5, 0.75, 0.25, 0.0, -0.5])
+    np.testing.assert_allclose(arrays["trade"][:-1], [0.5, 0.25, 0.5, 0.25, 0.5])
+    expected_ret = arrays["position"] * (np.exp(logret) - 1)
+    expected_ret -= arrays["trade"] * 0.001
+    np.testing.assert_allclose(arrays["strategy_ret"], expected_ret)
+    np.testing.assert_allclose(held, [0.0, 0.0, 0.75, 0.25, 0.0, 0.0])
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from benchmarks.suite import compare
+from benchmarks.synthetic import generate_ohlcv
+from benchmarks.tradeoffs import compare_configs
+
+
+def test_synthetic_ohlcv_is_reproducible():
+    """
+    Tests that the synthetic generator is deterministic per seed and produces
+    consistent OHLC bars with matching log returns.
+    """
+    # 1. Setup
+    n_bars = 5_000
+
+    # 2. Action
+    df = generate_ohlcv(n_bars, seed=3)
+    same = generate_ohlcv(n_bars, seed=3)
+    other = generate_ohlcv(n_bars, seed=4)
+
+    # 3. Assertions
+    pd.testing.assert_frame_equal(df, same)
+    assert not np.allclose(df["Close"], other["Close"])
+    assert len(df) == n_bars
+    assert (df["High"] >= df[["Open", "Close"]].max(axis=1)).all()
+    assert (df["Low"] <= df[["Open", "Close"]].min(axis=1)).all()
+    np.testing.assert_allclose(
+        df["logret"].values[1:], np.diff(np.log(df["Close"].values))
+    )
+
+
+def test_compare_flags_regressions():
+    """
+    Tests that only cases slower than the baseline beyond the tolerance are
+    reported, ignoring skipped and new cases.
+    """
+    # 1. Setup
+    baseline = {
+        "results": [
+            {"case": "hmm_fit", "n_bars": 1000, "wall_time_min": 1.0},
+            {"case": "backtest", "n_bars": 1000, "wall_time_min": 1.0},
+            {"case": "mc_run", "n_bars": 10**6, "skipped": True},
+        ]
+    }
+    current = {
+        "results": [
+            {"case": "hmm_fit", "n_bars": 1000, "wall_time_min": 1.5},
+            {"case": "backtest", "n_bars": 1000, "wall_time_min": 1.1},
+            {"case": "mc_run", "n_bars": 10**6, "skipped": True},
+            {"case": "optimizer", "n_bars": 1000, "wall_time_min": 9.0},
+        ]
+    }
+
+    # 2. Action
+    regressions = compare(baseline, current, tolerance=0.2)
+
+    # 3. Assertions
+    assert [(r["case"], r["n_bars"]) for r in regressions] == [("hmm_fit", 1000)]
+    assert np.isclose(regressions[0]["ratio"], 1.5)
+
+
+def test_tradeoffs_report_speed_and_quality():
+    """
+    Tests that the trade-off harness reports timing and quality per
+    configuration, with the reference configuration agreeing with itself.
+    """
+    # 1. Setup
+    df = generate_ohlcv(1_500, seed=0).dropna()
+    df["ret"] = np.expm1(df["logret"])
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(
+        {
+            "ret": df["ret"],
+            "vol": df["ret"].rolling(24, min_periods=1).std().fillna(0),
+            "noise": rng.normal(size=len(df)),
+        }
+    )
+    configs = [("full", "float64"), ("diag", "float32")]
+
+    # 2. Action
+    results = compare_configs(df, features, configs, n_states=2, n_iter=20)
+
+    # 3. Assertions
+    assert [(r["covariance_type"], r["dtype"]) for r in results] == configs
+    assert results[0]["signal_agreement"] == 1.0
+    for r in results:
+        assert r["fit_time"] > 0
+        assert np.isfinite(r["test_ll_per_bar"]) and np.isfinite(r["bic"])
+        assert 0 <= r["signal_agreement"] <= 1
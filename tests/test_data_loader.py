@@ -1,8 +1,14 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
 import pandas as pd
+from src.data_cache import OHLCVCache
 from src.data_loader import DataLoader
 
 
-def test_data_loader_processing(mocker):
+def test_data_loader_processing(mocker, tmp_path):
     """
     Tests that the DataLoader correctly processes a mocked API response.
     """
@@ -43,7 +49,7 @@ def test_data_loader_processing(mocker):
     mock_get.return_value.raise_for_status.return_value = None
 
     # 2. Action
-    loader = DataLoader()
+    loader = DataLoader(cache=OHLCVCache(root=str(tmp_path)))
     df = loader.get_data()
 
     # 3. Assertions
@@ -53,3 +59,195 @@ def test_data_loader_processing(mocker):
     assert "logret" in df.columns
     assert pd.api.types.is_float_dtype(df["Close"])
     assert pd.api.types.is_datetime64_any_dtype(df.index)
+
+
+class MockKlineServer:
+    """Local HTTP stand-in for the Binance klines endpoint."""
+
+    def __init__(self, n_bars, start=1672531200000, step=86_400_000):
+        self.start = start
+        self.step = step
+        self.n_bars = n_bars
+        self.rate_limited = 0  # number of upcoming requests answered with 429
+        self.overrides = {}  # open time -> close price, e.g. of a forming bar
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                params = {k: v[0] for k, v in query.items()}
+                server.requests.append(params)
+                if server.rate_limited:
+                    server.rate_limited -= 1
+                    self.send_response(429)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    return
+                body = json.dumps(server.klines(params)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/api/v3/klines"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def klines(self, params):
+        times = [self.start + i * self.step for i in range(self.n_bars)]
+        if "startTime" in params:
+            times = [t for t in times if t >= int(params["startTime"])]
+        if "endTime" in params:
+            times = [t for t in times if t <= int(params["endTime"])]
+        limit = int(params.get("limit", 500))
+        times = times[:limit] if "startTime" in params else times[-limit:]
+        rows = []
+        for t in times:
+            close = self.overrides.get(t, 100.0 + (t - self.start) / self.step)
+            rows.append(
+                [
+                    t,
+                    str(close),  # open
+                    str(close + 1),  # high
+                    str(close - 1),  # low
+                    str(close),  # close
+                    "1.0",
+                    t + self.step - 1,
+                    "0",
+                    1,
+                    "0",
+                    "0",
+                    "0",
+                ]
+            )
+        return rows
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+def test_expansion_fetches_only_missing_bars(tmp_path):
+    """
+    Tests that the cache-backed expansion mode appends only the bars newer than
+    the last stored timestamp and serves the full history from the cache.
+    """
+    # 1. Setup
+    server = MockKlineServer(n_bars=30)
+    loader = DataLoader(ticker="TESTUSDT", cache=OHLCVCache(root=str(tmp_path)))
+    loader.api_url = server.url
+
+    try:
+        # 2. Action
+        first = loader.get_data()
+        server.n_bars = 33
+        second = loader.get_data()
+    finally:
+        server.close()
+
+    # 3. Assertions
+    assert len(first) == 29  # first bar has no log return
+    assert len(second) == 32
+    assert "startTime" not in server.requests[0]
+    assert int(server.requests[1]["startTime"]) == server.start + 30 * server.step
+    assert second.index.is_unique and second.index.is_monotonic_increasing
+    assert second["Close"].iloc[-1] == 132.0
+
+
+def test_backfill_pages_concurrently_with_backoff(tmp_path):
+    """
+    Tests that a backfill splits the range into kline pages, survives rate
+    limiting and stores every bar exactly once.
+    """
+    # 1. Setup
+    server = MockKlineServer(n_bars=250)
+    server.rate_limited = 2
+    loader = DataLoader(ticker="TESTUSDT", cache=OHLCVCache(root=str(tmp_path)))
+    loader.api_url = server.url
+    loader.limit = 100
+    start = pd.to_datetime(server.start, unit="ms")
+    end = start + pd.Timedelta(days=249)
+
+    try:
+        # 2. Action
+        inserted = loader.backfill(start, end, max_workers=3)
+        reinserted = loader.backfill(start, end, max_workers=3)
+    finally:
+        server.close()
+
+    # 3. Assertions
+    cached = loader.cache.read("TESTUSDT", "1d")
+    assert inserted == 250
+    assert reinserted == 0
+    assert len(server.requests) == 2 * 3 + 2  # 3 pages per backfill + 2 retries
+    assert cached.index.is_unique and cached.index.is_monotonic_increasing
+    assert cached.index[0] == start and cached.index[-1] == end
+
+
+def test_forming_bar_is_not_cached(tmp_path, mocker):
+    """
+    Tests that the bar still forming when the cache is updated is not stored,
+    so its final values are fetched once it has closed.
+    """
+    # 1. Setup
+    server = MockKlineServer(n_bars=30)
+    loader = DataLoader(ticker="TESTUSDT", cache=OHLCVCache(root=str(tmp_path)))
+    loader.api_url = server.url
+    forming = server.start + 29 * server.step
+    clock = mocker.patch.object(DataLoader, "_now_ms")
+
+    try:
+        # 2. Action
+        # Bar 29 is half-way through its interval and quoted at a partial price
+        server.overrides[forming] = 500.0
+        clock.return_value = forming + server.step // 2
+        first = loader.get_data()
+        # One interval later bar 29 has closed at its final price
+        server.overrides.clear()
+        server.n_bars = 31
+        clock.return_value += server.step
+        second = loader.get_data()
+    finally:
+        server.close()
+
+    # 3. Assertions
+    assert first.index[-1] < pd.to_datetime(forming, unit="ms")
+    assert int(server.requests[1]["startTime"]) == forming
+    assert second.loc[pd.to_datetime(forming, unit="ms"), "Close"] == 129.0
+    assert second.index[-1] == pd.to_datetime(forming, unit="ms")
+
+
+def test_backfill_repairs_stale_bars(tmp_path):
+    """
+    Tests that a backfill overwrites stored bars whose values differ from the
+    API (e.g. a partial bar cached by an older version) and counts only the
+    bars it inserted or changed.
+    """
+    # 1. Setup
+    server = MockKlineServer(n_bars=20)
+    loader = DataLoader(ticker="TESTUSDT", cache=OHLCVCache(root=str(tmp_path)))
+    loader.api_url = server.url
+    start = pd.to_datetime(server.start, unit="ms")
+    end = start + pd.Timedelta(days=19)
+    stale = start + pd.Timedelta(days=9)
+    stored = pd.DataFrame(
+        {"Open": 500.0, "High": 501.0, "Low": 499.0, "Close": 500.0},
+        index=pd.DatetimeIndex([start, stale]),
+    )
+    stored.loc[start] = [100.0, 101.0, 99.0, 100.0]  # matches the API
+    loader.cache.append("TESTUSDT", "1d", stored)
+
+    try:
+        # 2. Action
+        merged = loader.backfill(start, end)
+    finally:
+        server.close()
+
+    # 3. Assertions
+    cached = loader.cache.read("TESTUSDT", "1d")
+    assert merged == 19  # 18 new bars + 1 repaired, the first bar is unchanged
+    assert len(cached) == 20 and cached.index.is_unique
+    assert cached.loc[stale, "Close"] == 109.0
@@ -0,0 +1,44 @@
+import numpy as np
+from src.equity_aggregator import EquityAggregator
+
+
+def test_streaming_statistics_match_full_paths(tmp_path):
+    """
+    Tests that block-wise aggregation reproduces the mean, standard deviation
+    and (while every path is buffered) exact quantiles of the full path matrix,
+    that the P² sketches track the quantiles of larger studies and that spilled
+    paths are written to the memory map.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    paths = 10000 * np.cumprod(1 + rng.normal(0, 0.01, size=(2000, 50)), axis=1)
+    head = paths[:300]
+    quantiles = [0.05, 0.5, 0.95]
+    aggregator = EquityAggregator(
+        50,
+        quantiles,
+        exact_paths=300,
+        spill_path=str(tmp_path / "paths.npy"),
+        max_paths=300,
+    )
+    sketch = EquityAggregator(50, quantiles, exact_paths=100)
+
+    # 2. Action
+    for start in range(0, 300, 64):
+        aggregator.update(head[start : start + 64])
+    for start in range(0, 2000, 64):
+        sketch.update(paths[start : start + 64])
+
+    # 3. Assertions
+    assert aggregator.count == 300
+    np.testing.assert_allclose(aggregator.mean, head.mean(axis=0))
+    np.testing.assert_allclose(aggregator.std, head.std(axis=0, ddof=1))
+    np.testing.assert_allclose(
+        aggregator.quantiles(quantiles), np.quantile(head, quantiles, axis=0)
+    )
+    np.testing.assert_array_equal(np.load(tmp_path / "paths.npy"), head)
+    # Past exact_paths the paths are dropped and the sketches take over
+    assert sketch.count == 2000 and not sketch._buffer
+    assert sketch._heights.shape == (3, 5, 50)
+    error = np.abs(sketch.quantiles(quantiles) - np.quantile(paths, quantiles, axis=0))
+    assert (error < 0.1 * paths.std(axis=0)).all()
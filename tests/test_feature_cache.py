@@ -0,0 +1,58 @@
+import numpy as np
+from src.feature_cache import FeatureCache
+from src.hmm_model import HMMModel
+
+
+def test_repeated_fits_hit_the_cache(make_feature_frame):
+    """
+    Tests that fits and predictions on identical frames reuse the scaled
+    matrices and give the same states as uncached models.
+    """
+    # 1. Setup
+    cache = FeatureCache()
+    features_train, features_test = (
+        make_feature_frame(seed=0)[1],
+        make_feature_frame(seed=1)[1],
+    )
+
+    # 2. Action
+    states = []
+    for seed in range(3):
+        hmm_model = HMMModel(n_states=2, random_state=seed, feature_cache=cache)
+        hmm_model.fit(features_train.copy(), verbose=False)
+        states.append(hmm_model.predict(features_test.copy(), verbose=False))
+    uncached = HMMModel(n_states=2, random_state=2, feature_cache=None)
+    uncached.fit(features_train, verbose=False)
+
+    # 3. Assertions
+    # One miss per distinct frame: the training fit and the test transform
+    assert cache.info() == {"hits": 4, "misses": 2, "size": 2, "maxsize": 32}
+    np.testing.assert_array_equal(
+        states[-1], uncached.predict(features_test, verbose=False)
+    )
+    np.testing.assert_allclose(uncached.model.means_, hmm_model.model.means_)
+
+
+def test_lru_eviction(make_feature_frame):
+    """
+    Tests that the least recently used entry is evicted once the cache is full
+    and that a different scaler is a different key.
+    """
+    # 1. Setup
+    cache = FeatureCache(maxsize=2)
+    frames = [make_feature_frame(n=50, seed=seed)[1] for seed in range(3)]
+
+    # 2. Action
+    scaler, _ = cache.fit_transform(frames[0])
+    cache.fit_transform(frames[1])
+    cache.fit_transform(frames[0])  # refresh frames[0]
+    cache.fit_transform(frames[2])  # evicts frames[1]
+    cache.fit_transform(frames[1])
+    other_scaler, _ = cache.fit_transform(frames[1])
+    cache.transform(frames[2], scaler)
+    X = cache.transform(frames[2], other_scaler)
+
+    # 3. Assertions
+    assert cache.info() == {"hits": 2, "misses": 6, "size": 2, "maxsize": 2}
+    assert not X.flags.writeable
+    np.testing.assert_allclose(X, other_scaler.transform(frames[2].values))
@@ -1,6 +1,10 @@
 import pandas as pd
 import numpy as np
-from src.feature_engineering import EXPECTED_FEATURES, FeatureEngineer
+from src.feature_engineering import (
+    EXPECTED_FEATURES,
+    FeatureEngineer,
+    StreamingFeatureEngineer,
+)
 
 
 def test_feature_engineering():
@@ -34,3 +38,25 @@ def test_feature_engineering():
     # Check a specific calculated value (optional, but good practice)
     # For mom10 on the last day: (130 - 115) / 115 = 0.1304
     assert features["mom10"].notna().any()
+
+
+def test_streaming_features_match_batch():
+    """
+    Tests that the streaming feature engine emits, bar by bar, the same rows as
+    the batch feature path on the stored BTC history.
+    """
+    # 1. Setup
+    raw = pd.read_csv("raw_data.csv", parse_dates=["date"], index_col="date")
+
+    # 2. Action
+    _, batch_features = FeatureEngineer().build_features(raw)
+    streamed_features = StreamingFeatureEngineer().update_many(raw)
+
+    # 3. Assertions
+    pd.testing.assert_index_equal(streamed_features.index, batch_features.index)
+    np.testing.assert_allclose(
+        streamed_features[EXPECTED_FEATURES].values,
+        batch_features[EXPECTED_FEATURES].values,
+        rtol=1e-9,
+        atol=1e-9,
+    )
@@ -0,0 +1,82 @@
+import numpy as np
+from src.hmm_decoding import HMMDecoder
+
+
+def test_batched_decoding_matches_hmmlearn(make_models):
+    """
+    Tests that batched Viterbi paths, posteriors and log-likelihoods match
+    hmmlearn model by model.
+    """
+    # 1. Setup
+    models, features = make_models()
+    X = models[0].transform(features.iloc[300:])
+
+    # 2. Action
+    decoder = HMMDecoder.from_models(models)
+    states = decoder.viterbi(X)
+    posteriors, log_likelihood = decoder.forward_backward(X)
+
+    # 3. Assertions
+    assert states.shape == (4, 100)
+    for k, hmm_model in enumerate(models):
+        np.testing.assert_array_equal(states[k], hmm_model.model.predict(X))
+        np.testing.assert_allclose(
+            posteriors[k], hmm_model.model.predict_proba(X), atol=1e-10
+        )
+        assert np.isclose(log_likelihood[k], hmm_model.model.score(X))
+
+
+def test_sequence_batch_and_filter(make_models):
+    """
+    Tests decoding several sequences at once and the filtered probabilities
+    of the forward pass.
+    """
+    # 1. Setup
+    models, features = make_models(n_models=1)
+    hmm_model = models[0]
+    sequences = [features.iloc[k * 100 : (k + 1) * 100] for k in range(4)]
+
+    # 2. Action
+    batch_states = hmm_model.predict_batch(sequences)
+    filtered = hmm_model.filter(features)
+
+    # 3. Assertions
+    assert batch_states.shape == (4, 100)
+    for sequence, states in zip(sequences, batch_states):
+        np.testing.assert_array_equal(
+            states, hmm_model.predict(sequence, verbose=False)
+        )
+    np.testing.assert_allclose(filtered.sum(axis=1), 1.0)
+    np.testing.assert_allclose(
+        filtered[-1], hmm_model.model.predict_proba(hmm_model.transform(features))[-1]
+    )
+
+
+def test_singular_covariance_is_ridged_like_hmmlearn(make_models):
+    """
+    Tests that a numerically singular state covariance, which EM can leave
+    behind, is decoded like hmmlearn does instead of failing the Cholesky
+    factorization.
+    """
+    # 1. Setup
+    models, features = make_models(n_models=1)
+    hmm_model = models[0]
+    rng = np.random.default_rng(1)
+    basis = rng.normal(size=(3, 2))
+    singular = basis @ basis.T - 1e-15 * np.eye(3)
+    hmm_model.model._covars_[0] = singular
+    X = hmm_model.transform(features.iloc[300:])
+
+    # 2. Action
+    decoder = HMMDecoder.from_models([hmm_model])
+    states = decoder.viterbi(X)
+    _, log_likelihood = decoder.forward_backward(X)
+    batch_states = hmm_model.predict_batch([features.iloc[300:]])
+    filtered = hmm_model.filter(features.iloc[300:])
+
+    # 3. Assertions
+    assert np.linalg.eigvalsh(singular).min() < 0
+    np.testing.assert_array_equal(states[0], hmm_model.model.predict(X))
+    assert np.isclose(log_likelihood[0], hmm_model.model.score(X))
+    np.testing.assert_array_equal(batch_states[0], states[0])
+    np.testing.assert_allclose(filtered.sum(axis=1), 1.0)
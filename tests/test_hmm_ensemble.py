@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from src.hmm_ensemble import HMMEnsemble
+
+
+def test_ensemble_signals_match_models(make_models):
+    """
+    Tests that the runs x days state and signal matrices of an ensemble match
+    decoding each model on its own.
+    """
+    # 1. Setup
+    models, features = make_models()
+    test_features = features.iloc[300:]
+    ret = test_features["ret"].values
+
+    # 2. Action
+    ensemble = HMMEnsemble(models)
+    states = ensemble.decode(test_features)
+    signals, state_means = ensemble.signals(test_features, ret, include_shorting=True)
+
+    # 3. Assertions
+    assert len(ensemble) == 4
+    assert states.shape == signals.shape == (4, 100)
+    assert state_means.shape == (4, 3)
+    for k, hmm_model in enumerate(models):
+        hidden_states = hmm_model.predict(test_features, verbose=False)
+        expected, expected_means = hmm_model.signal_path(
+            hidden_states, ret, include_shorting=True
+        )
+        np.testing.assert_array_equal(states[k], hidden_states)
+        np.testing.assert_array_equal(signals[k], expected)
+        np.testing.assert_allclose(state_means[k], expected_means)
+
+
+def test_ensemble_validation(make_models):
+    """
+    Tests empty ensembles and the rejection of models with different numbers
+    of states.
+    """
+    # 1. Setup
+    models, features = make_models(n_models=1)
+    other, _ = make_models(n_models=1, n_states=2)
+
+    # 2. Action
+    signals, _ = HMMEnsemble([]).signals(features, features["ret"].values)
+
+    # 3. Assertions
+    assert signals.shape == (0, 400)
+    with pytest.raises(ValueError):
+        HMMEnsemble(models + other)
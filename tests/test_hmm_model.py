@@ -1,6 +1,15 @@
 import pandas as pd
 import numpy as np
-from src.hmm_model import HMMModel
+import pytest
+import hmmlearn
+from hmmlearn.hmm import GaussianHMM
+from src.hmm_init import kmeans_init
+from src.hmm_model import (
+    HMMLEARN_TESTED_VERSIONS,
+    EarlyStoppingMonitor,
+    EMAborted,
+    HMMModel,
+)
 
 
 def test_regime_to_signal_logic():
@@ -47,3 +56,235 @@ def test_regime_to_signal_logic():
     )
     expected_short_signals = pd.Series([-1, -1, 0, 0, -1])
     assert df_with_shorting["signal"].isin([-1, 0, 1]).all()
+
+
+def test_signal_rules():
+    """
+    Tests the thresholds, minimum state frequency and probability-weighted
+    sizing of the array signal mapping.
+    """
+    # 1. Setup
+    hmm_model = HMMModel(n_states=3)
+    # Mean next-bar returns: state 0 -> 0.02, state 1 -> -0.005, state 2 -> 0.01
+    states = np.array([0, 1, 0, 1, 2, 0, 1, 0])
+    ret = np.array([0.0, 0.02, -0.005, 0.02, -0.005, 0.01, 0.02, -0.005])
+
+    # 2. Action
+    signal, state_means = hmm_model.signal_path(states, ret, include_shorting=True)
+    thresholded, _ = hmm_model.signal_path(
+        states, ret, include_shorting=True, threshold=0.008
+    )
+    frequent, _ = hmm_model.signal_path(states, ret, min_frequency=0.2)
+    probabilities = np.array([[0.5, 0.5, 0.0], [0.2, 0.0, 0.8]])
+    sized, _ = hmm_model.signal_path(
+        states, ret, include_shorting=True, probabilities=probabilities
+    )
+
+    # 3. Assertions
+    np.testing.assert_allclose(state_means, [0.02, -0.005, 0.01])
+    np.testing.assert_array_equal(signal, [1, -1, 1, -1, 1, 1, -1, 1])
+    np.testing.assert_array_equal(thresholded, [1, 0, 1, 0, 1, 1, 0, 1])
+    # State 2 is scored on 1 of 7 bars, below the 20% minimum
+    np.testing.assert_array_equal(frequent, [1, 0, 1, 0, 0, 1, 0, 1])
+    np.testing.assert_allclose(sized, [0.0, 1.0])
+
+
+def test_posterior_position_sizing():
+    """
+    Tests that posterior sizing yields bounded fractional positions equal to
+    the scaled expected next-bar return under the state posteriors.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(200, 3)), columns=["ret", "vol21", "rsi"])
+    ret = features["ret"].values * 0.01
+    hmm_model = HMMModel(n_states=3, random_state=0)
+    hmm_model.fit(features, verbose=False)
+
+    # 2. Action
+    long_only, state_means = hmm_model.posterior_signal(features, ret)
+    long_short, _ = hmm_model.posterior_signal(features, ret, include_shorting=True)
+    filtered, _ = hmm_model.posterior_signal(features, ret, posterior="filtered")
+
+    # 3. Assertions
+    probabilities = hmm_model.predict_proba(features)
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+    weights = probabilities[:-1]
+    np.testing.assert_allclose(
+        state_means, (weights * ret[1:, None]).sum(axis=0) / weights.sum(axis=0)
+    )
+    expected = probabilities @ state_means / np.abs(state_means).max()
+    np.testing.assert_allclose(long_short, expected)
+    np.testing.assert_allclose(long_only, np.clip(expected, 0, 1))
+    assert ((filtered >= 0) & (filtered <= 1)).all()
+    assert not np.array_equal(filtered, long_only)
+
+
+def test_forward_filter_incremental_update():
+    """
+    Tests that the filtered probabilities of the last bar match hmmlearn's
+    posterior for that bar, that incremental updates reproduce a full pass,
+    that states without statistics are flat and that a refit restarts the
+    filter.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(150, 3)), columns=["ret", "vol21", "rsi"])
+    hmm_model = HMMModel(n_states=3, random_state=0, n_iter=20)
+    hmm_model.fit(features, verbose=False)
+
+    # 2. Action
+    full = hmm_model.filter(features)
+    hmm_model.filter(features.iloc[:100])
+    for t in range(100, 150):
+        latest = hmm_model.update(features.iloc[[t]])
+    posterior = hmm_model.model.predict_proba(
+        hmm_model.scaler.transform(features.values)
+    )
+    hmm_model.fit(features.iloc[:120], verbose=False)
+    refit_latest = hmm_model.update(features.iloc[[149]])
+
+    # 3. Assertions
+    np.testing.assert_allclose(full.sum(axis=1), 1.0)
+    np.testing.assert_allclose(full[-1], posterior[-1], atol=1e-8)
+    np.testing.assert_allclose(latest, full[-1], atol=1e-10)
+    np.testing.assert_allclose(
+        refit_latest, hmm_model.filter(features.iloc[[149]])[-1], atol=1e-12
+    )
+    state_stats = pd.Series([0.01, -0.01, 0.0])
+    assert hmm_model.filtered_signal(state_stats) in (0, 1)
+    # Viterbi never visited the filtered state, or its statistic is NaN
+    long_stats = pd.Series([0.01, 0.01, 0.01])
+    top = int(np.argmax(refit_latest))
+    assert hmm_model.filtered_signal(long_stats.drop(top)) == 0
+    assert hmm_model.filtered_signal(long_stats.mask(long_stats.index == top)) == 0
+
+
+def test_warm_start_and_split_merge_init():
+    """
+    Tests that warm starting from a converged fit needs fewer EM iterations,
+    that split/merge initialization moves between neighbouring state counts and
+    that the cached k-means seedings cannot be altered by their callers.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    regimes = np.repeat(rng.integers(0, 3, 30), 50)
+    values = rng.normal(size=(1500, 3)) * np.array([0.5, 1.0, 2.0])[regimes, None]
+    features = pd.DataFrame(values + np.array([-1.0, 0.0, 1.0])[regimes, None])
+
+    # 2. Action
+    cold = HMMModel(n_states=3, random_state=0, init="kmeans++")
+    cold.fit(features, verbose=False)
+    warm = HMMModel(n_states=3, random_state=1)
+    warm.fit(features, verbose=False, warm_start=cold)
+    split = HMMModel(n_states=4, random_state=0)
+    split.fit(features, verbose=False, warm_start=cold)
+    merged = HMMModel(n_states=2, random_state=0)
+    merged.fit(features, verbose=False, warm_start=cold.parameters())
+    seeding = kmeans_init(features.values, 3, random_state=0)
+    seeding["means"][:] = 0.0
+
+    # 3. Assertions
+    assert cold.fit_stats_["converged"]
+    assert warm.fit_stats_["n_iter"] < cold.fit_stats_["n_iter"]
+    assert warm.fit_stats_["log_likelihood"] >= cold.fit_stats_["log_likelihood"] - 1e-6
+    assert split.model.means_.shape == (4, 3)
+    assert merged.model.means_.shape == (2, 3)
+    np.testing.assert_allclose(split.model.transmat_.sum(axis=1), 1.0)
+    # Cached k-means seedings are handed out as copies
+    assert np.abs(kmeans_init(features.values, 3, random_state=0)["means"]).sum() > 0
+
+
+@pytest.mark.parametrize("covariance_type", ["full", "diag", "tied", "spherical"])
+def test_covariance_types_and_precision(covariance_type):
+    """
+    Tests that every covariance type fits exactly like stock hmmlearn in
+    float64 (PrecisionGaussianHMM overrides private hmmlearn hooks, so an
+    hmmlearn upgrade that changes the EM must fail here), stays close to it in
+    float32, exposes full covariances and can be warm started from a
+    full-covariance fit.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    regimes = np.repeat(rng.integers(0, 3, 20), 50)
+    values = rng.normal(size=(1000, 3)) * np.array([0.5, 1.0, 2.0])[regimes, None]
+    features = pd.DataFrame(values + np.array([-1.0, 0.0, 1.0])[regimes, None])
+    full = HMMModel(n_states=3, random_state=0, n_iter=20)
+    full.fit(features, verbose=False)
+
+    # 2. Action
+    exact = HMMModel(
+        n_states=3, random_state=0, n_iter=20, covariance_type=covariance_type
+    )
+    exact.fit(features, verbose=False)
+    reference = GaussianHMM(
+        n_components=3, covariance_type=covariance_type, n_iter=20, random_state=0
+    )
+    reference.fit(exact.transform(features))
+    reduced = HMMModel(
+        n_states=3,
+        random_state=0,
+        n_iter=20,
+        covariance_type=covariance_type,
+        dtype="float32",
+    )
+    reduced.fit(features, verbose=False)
+    warm = HMMModel(n_states=3, random_state=0, covariance_type=covariance_type)
+    warm.fit(features, verbose=False, warm_start=full)
+
+    # 3. Assertions
+    assert ".".join(hmmlearn.__version__.split(".")[:2]) in HMMLEARN_TESTED_VERSIONS
+    np.testing.assert_allclose(exact.model.startprob_, reference.startprob_, atol=1e-8)
+    np.testing.assert_allclose(exact.model.transmat_, reference.transmat_, atol=1e-8)
+    np.testing.assert_allclose(exact.model.means_, reference.means_, atol=1e-8)
+    if covariance_type == "spherical":
+        # Stock hmmlearn keeps the variances tiled to (K, d) (so its covars_
+        # has K * d matrices); PrecisionGaussianHMM folds them to (K,)
+        assert reference.covars_.shape == (9, 3, 3)
+        np.testing.assert_allclose(
+            np.broadcast_to(exact.model._covars_[:, None], (3, 3)),
+            reference._covars_,
+            atol=1e-8,
+        )
+    else:
+        np.testing.assert_allclose(exact.model.covars_, reference.covars_, atol=1e-8)
+    X = exact.transform(features)
+    assert np.isclose(exact.model.score(X), reference.score(X))
+    np.testing.assert_allclose(reduced.model.means_, exact.model.means_, atol=1e-4)
+    assert np.isclose(
+        reduced.fit_stats_["log_likelihood"],
+        exact.fit_stats_["log_likelihood"],
+        rtol=1e-5,
+    )
+    assert exact.model.covars_.shape == (3, 3, 3)
+    assert warm.model.covariance_type == covariance_type
+    np.testing.assert_array_equal(
+        exact.predict_batch([features])[0], exact.predict(features, verbose=False)
+    )
+    with pytest.raises(ValueError):
+        HMMModel(dtype="float16")
+
+
+def test_early_stopping_monitor_aborts_bad_trajectories():
+    """
+    Tests that the early-stopping monitor aborts diverging and stalling EM
+    log-likelihood trajectories but lets a healthy one converge.
+    """
+    # 1. Setup
+    healthy = [-1000 + 100 * (1 - 0.5**i) for i in range(30)]
+    diverging = [-1000.0, -990.0, -985.0, -986.0]
+    stalling = [-1000 + 0.02 * i for i in range(60)]
+
+    # 2. Action & 3. Assertions
+    monitor = EarlyStoppingMonitor(tol=1e-2, n_iter=500, verbose=False)
+    for log_prob in healthy:
+        monitor.report(log_prob)
+        if monitor.converged:
+            break
+    assert monitor.converged and monitor.iter < 30
+
+    for trajectory, reason in [(diverging, "diverging"), (stalling, "stalling")]:
+        monitor = EarlyStoppingMonitor(tol=1e-2, n_iter=500, verbose=False)
+        with pytest.raises(EMAborted, match=reason):
+            for log_prob in trajectory:
+                monitor.report(log_prob)
@@ -0,0 +1,272 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.backtester import Backtester
+from src.hmm_model import HMMModel
+from src.mc_backtester import MCBacktester, _evaluate_seeds, _fit_seed
+
+
+def split_dataset(df, features):
+    """Two-thirds train / one-third test split of a featurized frame."""
+    split = len(df) * 2 // 3
+    return df.iloc[split:], features.iloc[:split], features.iloc[split:]
+
+
+def test_parallel_run_matches_serial(make_feature_frame):
+    """
+    Tests that the process-pool path accepts the same seeds, in the same order,
+    as the serial path.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame())
+
+    # 2. Action
+    serial = MCBacktester(features_train, features_test, test_df, n_states=2, runs=4)
+    serial_out = serial.run(seeded=True, verbose=False)
+    parallel = MCBacktester(features_train, features_test, test_df, n_states=2, runs=4)
+    parallel_out = parallel.run(seeded=True, verbose=False, n_jobs=2, chunk_size=3)
+
+    # 3. Assertions
+    for serial_metric, parallel_metric in zip(serial_out[:4], parallel_out[:4]):
+        np.testing.assert_array_equal(serial_metric, parallel_metric)
+    pd.testing.assert_frame_equal(serial_out[4], parallel_out[4])
+
+
+def test_unseeded_parallel_runs_are_distinct(make_feature_frame):
+    """
+    Tests that unseeded workers fit distinct models rather than replaying the
+    global RNG state they inherited, and that recorded seeds reproduce a run.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame(n=400))
+
+    # 2. Action
+    mc = MCBacktester(features_train, features_test, test_df, n_states=6, runs=8)
+    returns = mc.run(verbose=False, n_jobs=4, chunk_size=1)[0]
+    report = mc.seed_report()
+    first = report[report["status"] == "converged"].iloc[0]
+    (replay,) = _evaluate_seeds(
+        features_train,
+        features_test,
+        test_df,
+        6,
+        "default",
+        False,
+        "full",
+        "float64",
+        [int(first["random_state"])],
+    )
+    replay_batch = Backtester().backtest_batch(replay["signal"], test_df["logret"])
+
+    # 3. Assertions
+    assert report["random_state"].nunique() == len(report)
+    assert len(set(np.round(returns, 12))) > len(returns) // 2
+    assert np.isclose(replay_batch["total_return"][0], returns[0])
+
+
+def test_batched_decode_failure_falls_back_with_warning(
+    mocker, caplog, make_feature_frame
+):
+    """
+    Tests that a failing ensemble decode is logged and that the seeds are then
+    decoded one by one into the same signals.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame())
+    args = (features_train, features_test, test_df, 2, "default", False, "full")
+    batched = _evaluate_seeds(*args, "float64", [0, 1])
+
+    # 2. Action
+    mocker.patch(
+        "src.mc_backtester.HMMEnsemble.signals", side_effect=RuntimeError("boom")
+    )
+    with caplog.at_level("WARNING", logger="src.mc_backtester"):
+        fallback = _evaluate_seeds(*args, "float64", [0, 1])
+
+    # 3. Assertions
+    assert "RuntimeError: boom" in caplog.text
+    for batched_record, fallback_record in zip(batched, fallback):
+        assert fallback_record["status"] == "converged"
+        np.testing.assert_array_equal(
+            batched_record["signal"], fallback_record["signal"]
+        )
+
+
+def test_exhausted_em_budget_is_not_converged(mocker, make_feature_frame):
+    """
+    Tests that a fit which runs out of EM iterations while the log-likelihood
+    is still improving is reported as not converged and its seed is aborted.
+    """
+    # 1. Setup
+    _, features_train, _ = split_dataset(*make_feature_frame())
+    hmm_model = HMMModel(n_states=3, random_state=0, n_iter=3)
+    mocker.patch(
+        "src.mc_backtester.HMMModel",
+        lambda **kwargs: HMMModel(**dict(kwargs, n_iter=3)),
+    )
+
+    # 2. Action
+    hmm_model.fit(features_train, verbose=False)
+    record, fitted = _fit_seed(
+        features_train, 3, "default", False, "full", "float64", 0
+    )
+
+    # 3. Assertions
+    history = hmm_model.model.monitor_.history
+    assert history[-1] - history[-2] > hmm_model.model.tol
+    assert hmm_model.fit_stats_["n_iter"] == 3
+    assert not hmm_model.fit_stats_["converged"]
+    assert record["status"] == "aborted" and fitted is None
+    assert "failed to converge" in record["reason"]
+
+
+def test_early_stopping_records_seed_outcomes(make_feature_frame):
+    """
+    Tests that every attempted seed gets a structured outcome, that aborted
+    seeds stop early and that the waste ratio accounts for them.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame())
+    mc = MCBacktester(
+        features_train,
+        features_test,
+        test_df,
+        n_states=6,
+        runs=3,
+        early_stopping=True,
+    )
+
+    # 2. Action
+    mc.run(seeded=True, verbose=False)
+    report = mc.seed_report()
+
+    # 3. Assertions
+    assert (report["status"] == "converged").sum() == 3
+    assert set(report["status"]) <= {"converged", "aborted", "errored"}
+    assert len(report) == len(mc.seed_records)
+    assert 0.0 <= mc.waste_ratio() < 1.0
+    aborted = report[report["status"] == "aborted"]
+    assert (aborted["n_iter"] < 500).all()
+    assert aborted["reason"].notna().all()
+
+
+def test_streaming_aggregation_bands(tmp_path, make_feature_frame):
+    """
+    Tests that small flush batches give the same average path as one batch and
+    that quantile bands and the optional path spill are reported.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame())
+    spill_path = str(tmp_path / "paths.npy")
+
+    # 2. Action
+    one_batch = MCBacktester(features_train, features_test, test_df, n_states=2, runs=5)
+    one_batch_out = one_batch.run(seeded=True, verbose=False)
+    streamed = MCBacktester(
+        features_train,
+        features_test,
+        test_df,
+        n_states=2,
+        runs=5,
+        batch_size=2,
+        spill_path=spill_path,
+    )
+    avg_df = streamed.run(seeded=True, verbose=False)[4]
+
+    # 3. Assertions
+    np.testing.assert_allclose(
+        avg_df["average_equity"], one_batch_out[4]["average_equity"]
+    )
+    assert (avg_df["p5_equity"] <= avg_df["p50_equity"]).all()
+    assert (avg_df["p50_equity"] <= avg_df["p95_equity"]).all()
+    assert one_batch.paths_equity is None
+    assert streamed.paths_equity.shape == (5, len(avg_df))
+    np.testing.assert_allclose(
+        streamed.paths_equity.mean(axis=0), avg_df["average_equity"]
+    )
+
+
+def test_resume_from_checkpoint(tmp_path, make_feature_frame):
+    """
+    Tests that a study interrupted after a few seeds and resumed from its
+    checkpoint reproduces an uninterrupted study without refitting done seeds.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame())
+    checkpoint_dir = str(tmp_path / "study")
+    reference = MCBacktester(features_train, features_test, test_df, n_states=2, runs=5)
+    reference_out = reference.run(seeded=True, verbose=False)
+
+    # 2. Action
+    partial = MCBacktester(
+        features_train,
+        features_test,
+        test_df,
+        n_states=2,
+        runs=3,
+        checkpoint_dir=checkpoint_dir,
+        checkpoint_every=2,
+    )
+    partial.run(seeded=True, verbose=False)
+    resumed = MCBacktester(
+        features_train,
+        features_test,
+        test_df,
+        n_states=2,
+        runs=5,
+        checkpoint_dir=checkpoint_dir,
+    )
+    resumed_out = resumed.run(seeded=True, verbose=False, resume=True)
+
+    # 3. Assertions
+    for reference_metric, resumed_metric in zip(reference_out[:4], resumed_out[:4]):
+        np.testing.assert_array_equal(reference_metric, resumed_metric)
+    pd.testing.assert_frame_equal(reference_out[4], resumed_out[4])
+    pd.testing.assert_frame_equal(
+        reference.seed_report().drop(columns=["fit_time", "wall_time"]),
+        resumed.seed_report().drop(columns=["fit_time", "wall_time"]),
+    )
+    restarted = MCBacktester(
+        features_train,
+        features_test,
+        test_df,
+        n_states=2,
+        runs=5,
+        checkpoint_dir=checkpoint_dir,
+    )
+    with pytest.raises(FileExistsError):
+        restarted.run(seeded=True, verbose=False)
+    with pytest.raises(ValueError):
+        restarted.run(seeded=False, verbose=False, resume=True)
+    # Same settings and test dates, but a shifted training window
+    shifted = MCBacktester(
+        features_train.iloc[1:],
+        features_test,
+        test_df,
+        n_states=2,
+        runs=5,
+        checkpoint_dir=checkpoint_dir,
+    )
+    with pytest.raises(ValueError, match="different study"):
+        shifted.run(seeded=True, verbose=False, resume=True)
+
+
+def test_outperformance_probabilities(make_feature_frame):
+    """
+    Tests that outperformance probabilities are empirical frequencies, queried
+    for several multipliers at once.
+    """
+    # 1. Setup
+    test_df, features_train, features_test = split_dataset(*make_feature_frame())
+    mc = MCBacktester(features_train, features_test, test_df, n_states=2, runs=6)
+    returns = np.array(mc.run(seeded=True, verbose=False)[0])
+
+    # 2. Action
+    probs = mc.probability_outperformance([1, 2, 3])
+    low, high = mc.outperformance_interval([1, 2, 3])
+
+    # 3. Assertions
+    expected = [(returns > m * mc.benchmark_return).mean() for m in (1, 2, 3)]
+    np.testing.assert_allclose(probs, expected)
+    assert mc.probability_outperformance() == expected[0]
+    assert ((low <= probs) & (probs <= high)).all()
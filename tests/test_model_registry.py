@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+from src.hmm_model import HMMModel
+from src.model_registry import ModelRegistry
+
+
+def test_registry_roundtrip_and_fingerprint(tmp_path):
+    """
+    Tests that a saved artifact is found again under the same fingerprint and
+    that changing the training window or config yields a different fingerprint.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(
+        rng.normal(size=(120, 3)),
+        columns=["ret", "vol21", "rsi"],
+        index=pd.date_range(start="2023-01-01", periods=120, freq="D"),
+    )
+    config = {"n_states": 2, "random_state": 0}
+    hmm_model = HMMModel(n_states=2, random_state=0, n_iter=10)
+    hmm_model.fit(features, verbose=False)
+    state_stats = pd.Series([0.01, -0.01], index=[0, 1])
+    registry = ModelRegistry(root=str(tmp_path))
+
+    # 2. Action
+    key = registry.fingerprint(features, config)
+    assert registry.load(key) is None
+    registry.save(key, hmm_model.model, hmm_model.scaler, state_stats, config)
+    artifact = registry.load(key)
+
+    # 3. Assertions
+    assert artifact["fingerprint"] == key
+    pd.testing.assert_series_equal(artifact["state_stats"], state_stats)
+    X = artifact["scaler"].transform(features.values)
+    np.testing.assert_array_equal(
+        artifact["model"].predict(X), hmm_model.predict(features, verbose=False)
+    )
+    assert registry.fingerprint(features.iloc[:-1], config) != key
+    assert registry.fingerprint(features, {**config, "n_states": 3}) != key
@@ -35,3 +35,63 @@ def test_optimizer_runs():
     assert best_n_states > 1
     assert optimizer.optimization_results is not None
     assert not optimizer.optimization_results.empty
+
+
+def test_parallel_halving_optimizer(make_feature_frame):
+    """
+    Tests that the parallel search scores candidates exactly like the serial one
+    and that successive halving only carries survivors to the full EM budget.
+    """
+    # 1. Setup
+    df_with_features, features = make_feature_frame(n=150)
+    states_range = range(2, 6)
+
+    # 2. Action
+    serial = HMMStateOptimizer(states_range=states_range, n_seeds=2, n_iter=20)
+    serial_best = serial.run_optimization(df_with_features, features)
+    parallel = HMMStateOptimizer(states_range=states_range, n_seeds=2, n_iter=20)
+    parallel_best = parallel.run_optimization(df_with_features, features, n_jobs=2)
+    halving = HMMStateOptimizer(states_range=states_range, n_iter=20)
+    halving.run_optimization(
+        df_with_features, features, n_jobs=2, halving_rounds=3, eta=2
+    )
+
+    # 3. Assertions
+    assert serial_best == parallel_best
+    columns = ["n_states", "score", "n_iter", "em_iter"]
+    pd.testing.assert_frame_equal(
+        serial.optimization_results[columns], parallel.optimization_results[columns]
+    )
+    budgets = halving.optimization_results.set_index("n_states")["n_iter"]
+    assert budgets.max() == 20
+    assert (budgets == 20).sum() == 1
+    assert (budgets == 5).sum() == 2
+
+
+def test_warm_started_sweep(make_feature_frame):
+    """
+    Tests that the K -> K+1 warm-started sweep fits every candidate after the
+    first from its predecessor, needs fewer EM iterations than fitting every
+    candidate cold, and gives the same results in parallel.
+    """
+    # 1. Setup
+    df_with_features, features = make_feature_frame(n=400)
+    states_range = range(2, 7)
+
+    # 2. Action
+    cold = HMMStateOptimizer(states_range=states_range, n_seeds=2)
+    cold.run_optimization(df_with_features, features)
+    warm = HMMStateOptimizer(states_range=states_range, n_seeds=2, warm_start=True)
+    warm.run_optimization(df_with_features, features)
+    parallel = HMMStateOptimizer(states_range=states_range, n_seeds=2, warm_start=True)
+    parallel.run_optimization(df_with_features, features, n_jobs=2)
+
+    # 3. Assertions
+    cold_results, warm_results = cold.optimization_results, warm.optimization_results
+    assert not cold_results["warm_start"].any()
+    assert warm_results["warm_start"].tolist() == [False, True, True, True, True]
+    assert warm_results["em_iter"].sum() < cold_results["em_iter"].sum()
+    columns = ["n_states", "score", "em_iter", "warm_start"]
+    pd.testing.assert_frame_equal(
+        warm_results[columns], parallel.optimization_results[columns]
+    )
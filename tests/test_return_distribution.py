@@ -0,0 +1,43 @@
+import numpy as np
+from src.return_distribution import ReturnDistribution
+
+
+def test_empirical_probabilities():
+    """
+    Tests that vectorized threshold queries match a brute-force count and that
+    the bootstrap interval brackets the point estimate.
+    """
+    # 1. Setup
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.1, 0.3, 500)
+    thresholds = np.linspace(-1, 1, 300)
+
+    # 2. Action
+    distribution = ReturnDistribution(returns, n_bootstrap=200)
+    sf = distribution.sf(thresholds)
+    low, high = distribution.sf_interval(thresholds)
+
+    # 3. Assertions
+    expected = (returns[None, :] > thresholds[:, None]).mean(axis=1)
+    np.testing.assert_allclose(sf, expected)
+    np.testing.assert_allclose(distribution.cdf(thresholds), 1 - expected)
+    assert isinstance(distribution.sf(0.1), float)
+    assert (low <= sf + 1e-12).all() and (sf <= high + 1e-12).all()
+    assert (high - low).max() < 0.1
+
+
+def test_degenerate_returns():
+    """
+    Tests that identical returns, which break a KDE, still give valid
+    probabilities and a zero density.
+    """
+    # 1. Setup
+    distribution = ReturnDistribution([0.0, 0.0, 0.0])
+
+    # 2. Action
+    probs = distribution.sf([-0.1, 0.0, 0.1])
+    density = distribution.pdf(np.linspace(-1, 1, 5))
+
+    # 3. Assertions
+    np.testing.assert_array_equal(probs, [1.0, 0.0, 0.0])
+    np.testing.assert_array_equal(density, np.zeros(5))
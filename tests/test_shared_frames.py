@@ -0,0 +1,62 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.shared_frames import SharedFrames
+
+
+def test_attach_is_a_read_only_view(tmp_path):
+    """
+    Tests that an attached frame equals the original, maps the published file
+    without copying, cannot be written through and has a tiny handle.
+    """
+    # 1. Setup
+    n = 50_000
+    df = pd.DataFrame(
+        np.random.default_rng(0).normal(size=(n, 3)),
+        columns=["ret", "vol21", "rsi"],
+        index=pd.date_range(start="2020-01-01", periods=n, freq="h", name="date"),
+    )
+
+    # 2. Action
+    with SharedFrames(root=str(tmp_path)) as shared:
+        handle = shared.share(df)
+        payload = pickle.dumps(handle)
+        attached = pickle.loads(payload).attach()
+
+        # 3. Assertions
+        pd.testing.assert_frame_equal(attached, df)
+        base = attached["vol21"].to_numpy()
+        while not isinstance(base, np.memmap) and base.base is not None:
+            base = base.base
+        assert isinstance(base, np.memmap)
+        assert len(payload) < 2_000
+        with pytest.raises(ValueError):
+            attached["ret"].to_numpy()[0] = 1.0
+    assert not list(tmp_path.iterdir())
+
+
+def test_share_index_variants():
+    """
+    Tests that timezone-aware, integer and string indexes survive the trip.
+    """
+    # 1. Setup
+    frames = [
+        pd.DataFrame(
+            {"Close": [1.0, 2.0, 3.0]},
+            index=pd.date_range("2024-01-01", periods=3, tz="Europe/Paris"),
+        ),
+        pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.Index([5, 7], name="bar")),
+        pd.DataFrame({"Close": [1.0, 2.0]}, index=["BTCUSDT", "ETHUSDT"]),
+    ]
+
+    # 2. Action
+    with SharedFrames() as shared:
+        attached = [shared.share(df).attach() for df in frames]
+
+        # 3. Assertions
+        for original, copy in zip(frames, attached):
+            pd.testing.assert_frame_equal(copy, original)
+        with pytest.raises(ValueError):
+            shared.share(pd.DataFrame({"ticker": ["BTCUSDT"]}))
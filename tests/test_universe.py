@@ -0,0 +1,31 @@
+import numpy as np
+from src.universe import UniverseRunner
+
+
+def test_universe_runner_consolidates_results(make_ohlc):
+    """
+    Tests that the universe scan returns one row per ticker, in parallel, and
+    reports failing tickers instead of raising.
+    """
+    # 1. Setup
+    data = {
+        "AAAUSDT": make_ohlc(seed=0),
+        "BBBUSDT": make_ohlc(seed=1),
+        "BADUSDT": make_ohlc(seed=2)[:5],
+    }
+    runner = UniverseRunner(
+        tickers=list(data) + ["MISSINGUSDT"],
+        n_states=2,
+        split_date="2023-08-01",
+        n_jobs=2,
+    )
+
+    # 2. Action
+    results = runner.run(data=data)
+
+    # 3. Assertions
+    assert list(results.index) == ["AAAUSDT", "BBBUSDT", "BADUSDT", "MISSINGUSDT"]
+    assert (results.loc[["AAAUSDT", "BBBUSDT"], "status"] == "ok").all()
+    assert (results.loc[["BADUSDT", "MISSINGUSDT"], "status"] == "error").all()
+    assert results.loc["AAAUSDT", "latest_signal"] in (-1, 0, 1)
+    assert np.isfinite(results.loc["AAAUSDT", "total_return"])
@@ -0,0 +1,52 @@
+import pandas as pd
+from src.walk_forward import WalkForward, walk_forward_folds
+
+
+def test_walk_forward_folds():
+    """
+    Tests that test windows tile the history after the first training window
+    and that every training window ends an embargo before its test window.
+    """
+    # 1. Setup
+    n_bars, train_size, test_size, embargo = 250, 100, 40, 2
+
+    # 2. Action
+    rolling = walk_forward_folds(n_bars, train_size, test_size, embargo)
+    expanding = walk_forward_folds(n_bars, train_size, test_size, embargo, True)
+
+    # 3. Assertions
+    assert rolling[0]["test_start"] == train_size + embargo
+    assert rolling[-1]["test_end"] == n_bars
+    for prev, fold in zip(rolling, rolling[1:]):
+        assert fold["test_start"] == prev["test_end"]
+    for fold in rolling:
+        assert fold["test_start"] - fold["train_end"] == embargo
+        assert fold["train_end"] - fold["train_start"] == train_size
+    assert all(fold["train_start"] == 0 for fold in expanding)
+
+
+def test_parallel_walk_forward_matches_serial(make_feature_frame):
+    """
+    Tests that folds fitted on a process pool stitch into the same backtest as
+    serial folds, covering every out-of-sample bar once.
+    """
+    # 1. Setup
+    df, features = make_feature_frame(n=400)
+    kwargs = dict(train_size=150, test_size=60, embargo=2, n_states=2)
+
+    # 2. Action
+    serial_df, serial_folds = WalkForward(**kwargs).run(
+        df=df, features=features, verbose=False
+    )
+    parallel_df, parallel_folds = WalkForward(n_jobs=2, **kwargs).run(
+        df=df, features=features, verbose=False
+    )
+
+    # 3. Assertions
+    pd.testing.assert_frame_equal(serial_df, parallel_df)
+    pd.testing.assert_frame_equal(
+        serial_folds.drop(columns="fit_time"), parallel_folds.drop(columns="fit_time")
+    )
+    assert serial_df.index[0] == df.index[152]
+    assert serial_df.index[-1] == df.index[-1]
+    assert serial_df["fold"].nunique() == len(serial_folds)
@@ -1,10 +1,26 @@
-# import joblib
 # from src.data_loader import DataLoader
-from src.feature_engineering import FeatureEngineer
+from src.feature_engineering import EXPECTED_FEATURES, FeatureEngineer
 from src.hmm_model import HMMModel
+from src.model_registry import ModelRegistry
 
 
-def train(raw_data):
+def training_config(feature_engineer: FeatureEngineer, hmm_model: HMMModel) -> dict:
+    """
+    Configuration that, together with the training features, identifies a model.
+    """
+    return {
+        "features": EXPECTED_FEATURES,
+        "roll_vol": feature_engineer.roll_vol,
+        "rsi_window": feature_engineer.rsi_window,
+        "n_states": hmm_model.n_states,
+        "random_state": hmm_model.random_state,
+        "n_iter": hmm_model.n_iter,
+        "covariance_type": hmm_model.covariance_type,
+        "dtype": str(hmm_model.dtype),
+    }
+
+
+def train(raw_data, registry: ModelRegistry = None):
     """
     Trains the HMM model and saves it to disk.
     """
@@ -18,13 +34,21 @@ def train(raw_data):
 
     # 3. Fit HMM
     hmm_model = HMMModel()
-    hmm_model.fit(features)
-
-    # 4. Save the model and scaler
-    # joblib.dump(hmm_model.model, 'hmm_model.pkl')
-    # joblib.dump(hmm_model.scaler, 'scaler.pkl')
-
-    # print("Model trained and saved successfully.")
+    hidden_states = hmm_model.fit(features)
+    _, state_stats = hmm_model.regime_to_signal(df, hidden_states)
+
+    # 4. Save the model, scaler and state statistics
+    registry = registry or ModelRegistry()
+    config = training_config(feature_engineer, hmm_model)
+    registry.save(
+        registry.fingerprint(features, config),
+        hmm_model.model,
+        hmm_model.scaler,
+        state_stats,
+        config,
+    )
+
+    print("Model trained and saved successfully.")
     return hmm_model.model, hmm_model.scaler
 
 
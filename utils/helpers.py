@@ -99,13 +99,8 @@ def output_performance_summary(
     )
 
     print("\n--- Outperformance Probabilities ---")
-    print(
-        f"- Beating HODLing:              {mc_backtester.probability_outperformance():.0%}"
-    )
-    print(
-        f"- At least 2× HODLing returns:  {mc_backtester.probability_outperformance(2):.0%}"
-    )
-    print(
-        f"- At least 3× HODLing returns:  {mc_backtester.probability_outperformance(3):.0%}"
-    )
+    beat_1x, beat_2x, beat_3x = mc_backtester.probability_outperformance([1, 2, 3])
+    print(f"- Beating HODLing:              {beat_1x:.0%}")
+    print(f"- At least 2× HODLing returns:  {beat_2x:.0%}")
+    print(f"- At least 3× HODLing returns:  {beat_3x:.0%}")
     print("=" * 100)